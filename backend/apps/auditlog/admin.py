@@ -4,7 +4,19 @@ Django admin configuration for audit logs models
 
 from django.contrib import admin
 
-from .models import LogEntry, LogGroup
+from .models import LogEntry, LogGroup, LogGroupStats
+
+
+class LogGroupStatsInline(admin.TabularInline):
+    """Read-only entry counters of a log group"""
+
+    model = LogGroupStats
+    extra = 0
+    can_delete = False
+    readonly_fields = ["type", "count", "last_timestamp"]
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(LogGroup)
@@ -16,6 +28,7 @@ class LogGroupAdmin(admin.ModelAdmin):
     search_fields = ["reference_id"]
     readonly_fields = ["created"]
     ordering = ["-created"]
+    inlines = [LogGroupStatsInline]
 
     fieldsets = (
         (None, {"fields": ("type", "reference_id", "properties")}),
@@ -4,16 +4,30 @@ Audit Logs API
 This module implements the HTTP endpoints for the audit logging system.
 """
 
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+import orjson
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from ninja import Field, Query, Router, Schema
+from ninja.errors import HttpError
+from pydantic import Json
 
+from .export import aiter_export, content_type, file_extension, iter_export
 from .services import (
+    MAX_BATCH_SIZE,
     LogEntryRequest,
+    LogGroupNotFoundError,
     LogGroupRequest,
+    create_log_entries,
     create_log_entry,
+    filter_log_entries,
     get_log_group_with_entry_counts_by_reference_id,
     get_or_create_log_group,
     list_log_entries,
     list_log_groups,
+    validate_log_entry_items,
 )
 
 
@@ -26,6 +40,7 @@ class LogGroupOut(Schema):
     reference_id: str
     properties: dict
     entry_counts: dict[str, int] = Field(default_factory=dict)
+    users: list[str] = Field(default_factory=list)
 
 
 class LogEntryOut(Schema):
@@ -44,12 +59,14 @@ class LogGroupsResponse(Schema):
     """Response schema for log groups endpoint"""
 
     log_groups: list[LogGroupOut]
+    next_cursor: str | None = None
 
 
 class LogEntriesResponse(Schema):
     """Response schema for log entries endpoint"""
 
     log_entries: list[LogEntryOut]
+    next_cursor: str | None = None
 
 
 class LogGroupFilters(Schema):
@@ -57,6 +74,7 @@ class LogGroupFilters(Schema):
 
     page_size: int = 100
     offset: int = 0
+    cursor: str | None = None
     type: str | None = None
     entry_types: list[str] | None = Field(default_factory=list)
 
@@ -66,8 +84,28 @@ class LogEntryFilters(Schema):
 
     page_size: int = 100
     offset: int = 0
+    cursor: str | None = None
+    log_group_reference_id: str | None = None
+    user: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    search: str | None = None
+    # JSON object the entry properties must contain
+    properties: Json[dict[str, Any]] | None = None
+
+
+class LogEntryExportFilters(Schema):
+    """Query filters and output options for the log entries export"""
+
     log_group_reference_id: str | None = None
     user: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    search: str | None = None
+    # JSON object the entry properties must contain
+    properties: Json[dict[str, Any]] | None = None
+    format: Literal["ndjson", "csv"] = "ndjson"
+    gzip: bool = True
 
 
 class LogGroupIn(Schema):
@@ -86,11 +124,64 @@ class LogEntryIn(Schema):
     description: str = ""
     type: str
     properties: dict = Field(default_factory=dict)
+    idempotency_key: str | None = Field(None, min_length=1, max_length=255)
+
+
+class LogEntryBatchError(Schema):
+    """Error for one item of a batch, identified by its position"""
+
+    index: int
+    error: str
+
 
+class LogEntryBatchResponse(Schema):
+    """Response schema for the batch log entries endpoint"""
+
+    created: int
+    ids: list[int | None]
+    errors: list[LogEntryBatchError]
+    # Positions of entries already stored under their idempotency key
+    duplicates: list[int] = Field(default_factory=list)
+
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/jsonl"}
+INVALID_JSON = object()
 
 router = Router()
 
 
+def _request_user_email(request) -> str:
+    """Return the email of the authenticated user, or "anonymous"."""
+    return getattr(request.auth, "email", None) or "anonymous"
+
+
+def _parse_batch_body(request) -> list[Any]:
+    """
+    Decode a batch body sent as a JSON array or as NDJSON.
+
+    NDJSON lines that are not valid JSON are kept as ``INVALID_JSON`` so
+    their index can be reported as an item error.
+    """
+    if request.content_type in NDJSON_CONTENT_TYPES:
+        items = []
+        for line in request.body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                items.append(INVALID_JSON)
+        return items
+
+    try:
+        items = orjson.loads(request.body)
+    except orjson.JSONDecodeError as err:
+        raise HttpError(400, "Invalid JSON body") from err
+    if not isinstance(items, list):
+        raise HttpError(400, "Expected a JSON array of log entries")
+    return items
+
+
 @router.get("/log-groups", response=LogGroupsResponse)
 async def get_log_groups(request, filters: LogGroupFilters = Query(...)):  # noqa: B008
     """
@@ -98,39 +189,32 @@ async def get_log_groups(request, filters: LogGroupFilters = Query(...)):  # noq
 
     - Ordered in descending order of log group creation date
     - Page size = 100 by default
+    - Pass the returned next_cursor as cursor to fetch the next page
     - Optionally includes review statistics in batch
     """
     # Get log groups first
-    groups = await list_log_groups(
+    page = await list_log_groups(
         group_type=filters.type,
         entry_types=filters.entry_types,
+        cursor=filters.cursor,
         offset=filters.offset,
         limit=filters.page_size,
     )
 
-    log_groups = []
-    for lg in groups:
-        # Build entry_counts dictionary from annotated fields
-        entry_counts = {}
-        for attr_name in dir(lg):
-            if attr_name.startswith("count_"):
-                entry_type = attr_name[6:]  # Remove "count_" prefix
-                count_value = getattr(lg, attr_name)
-                if count_value is not None:
-                    entry_counts[entry_type] = count_value
-
-        log_groups.append(
-            LogGroupOut(
-                id=lg.id,
-                created=lg.created.isoformat(),
-                type=lg.type,
-                reference_id=lg.reference_id,
-                properties=lg.properties,
-                entry_counts=entry_counts,
-            )
+    log_groups = [
+        LogGroupOut(
+            id=lg.id,
+            created=lg.created.isoformat(),
+            type=lg.type,
+            reference_id=lg.reference_id,
+            properties=lg.properties,
+            entry_counts=lg.entry_counts,
+            users=lg.users,
         )
+        for lg in page.items
+    ]
 
-    return LogGroupsResponse(log_groups=log_groups)
+    return LogGroupsResponse(log_groups=log_groups, next_cursor=page.next_cursor)
 
 
 @router.get("/log-entries", response=LogEntriesResponse)
@@ -140,13 +224,25 @@ async def get_log_entries(request, filters: LogEntryFilters = Query(...)):  # no
 
     - Ordered in descending order of timestamp
     - Page size = 100 by default
+    - Pass the returned next_cursor as cursor to fetch the next page
     - Optional filters:
       - logGroupReferenceId
       - user
+      - since (inclusive) / until (exclusive) timestamps; recent-log queries
+        should always pass since so only recent partitions are read
+      - search: words in the description, in web search syntax
+        ("exact phrase", or, -excluded)
+      - properties: JSON object the entry properties must contain, e.g.
+        properties={"etapa": "analisis"}
     """
-    entries = await list_log_entries(
+    page = await list_log_entries(
         log_group_reference_id=filters.log_group_reference_id,
         user=filters.user,
+        since=filters.since,
+        until=filters.until,
+        search=filters.search,
+        properties=filters.properties,
+        cursor=filters.cursor,
         offset=filters.offset,
         limit=filters.page_size,
     )
@@ -161,17 +257,53 @@ async def get_log_entries(request, filters: LogEntryFilters = Query(...)):  # no
             properties=le.properties,
             log_group_id=le.log_group_id,
         )
-        for le in entries
+        for le in page.items
     ]
 
-    return LogEntriesResponse(log_entries=log_entries)
+    return LogEntriesResponse(log_entries=log_entries, next_cursor=page.next_cursor)
+
+
+@router.get("/log-entries/export")
+async def export_log_entries(
+    request,
+    filters: LogEntryExportFilters = Query(...),  # noqa: B008
+):
+    """
+    Stream every log entry matching the filters as a file download.
+
+    - NDJSON (default) or CSV, gzip compressed unless gzip=false
+    - Chronological order, read with a server-side cursor in constant memory
+    - Same filters as /log-entries; pass since/until to bound large exports
+    """
+    queryset = filter_log_entries(
+        log_group_reference_id=filters.log_group_reference_id,
+        user=filters.user,
+        since=filters.since,
+        until=filters.until,
+        search=filters.search,
+        properties=filters.properties,
+    )
+    extension = file_extension(filters.format, compress=filters.gzip)
+    filename = f"auditlog-{datetime.now(tz=UTC):%Y%m%dT%H%M%SZ}.{extension}"
+
+    # Each server streams only its own kind of iterator and buffers the other
+    # one whole, so WSGI workers (SERVER_MODE=wsgi) get the sync export
+    export = aiter_export if isinstance(request, ASGIRequest) else iter_export
+    response = StreamingHttpResponse(
+        export(queryset, filters.format, compress=filters.gzip),
+        content_type=(
+            "application/gzip" if filters.gzip else content_type(filters.format)
+        ),
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
 @router.get("/log-group/{reference_id}", response=LogGroupOut)
 async def get_log_group(
     request,
     reference_id: str,
-    entry_types: list[str] | None = None,
+    entry_types: list[str] | None = Query(None),  # noqa: B008
 ):
     """
     Fetch a specific log group by reference ID.
@@ -188,23 +320,14 @@ async def get_log_group(
 
         raise Http404
 
-    # Build entry_counts dictionary from annotated fields
-    entry_counts = {}
-    for attr_name in dir(log_group):
-        if attr_name.startswith("count_"):
-            entry_type = attr_name[6:]  # Remove "count_" prefix
-            count_value = getattr(log_group, attr_name)
-            if count_value is not None:
-                entry_counts[entry_type] = count_value
-    # Get users for this log group
-
     return LogGroupOut(
         id=log_group.id,
         created=log_group.created.isoformat(),
         type=log_group.type,
         reference_id=log_group.reference_id,
         properties=log_group.properties,
-        entry_counts=entry_counts,
+        entry_counts=log_group.entry_counts,
+        users=log_group.users,
     )
 
 
@@ -245,10 +368,11 @@ async def create_log_entry_endpoint(request, log_entry_data: LogEntryIn):
     Create a new log entry.
 
     Creates a new log entry for the specified log group.
-    The user email is extracted from the JWT token automatically.
+    The user email is taken from the authenticated session.
+    Retrying with the same idempotency_key and timestamp returns the stored
+    entry instead of creating another one.
     """
-    # Extract user email from JWT token
-    user_email = request.auth or "anonymous"
+    user_email = _request_user_email(request)
 
     log_entry_request = LogEntryRequest(
         timestamp=log_entry_data.timestamp,
@@ -257,9 +381,13 @@ async def create_log_entry_endpoint(request, log_entry_data: LogEntryIn):
         properties=log_entry_data.properties,
         description=log_entry_data.description,
         user=user_email,
+        idempotency_key=log_entry_data.idempotency_key,
     )
 
-    log_entry = await create_log_entry(log_entry_request)
+    try:
+        log_entry = await create_log_entry(log_entry_request)
+    except LogGroupNotFoundError as err:
+        raise HttpError(404, str(err)) from err
 
     return LogEntryOut(
         id=log_entry.id,
@@ -270,3 +398,47 @@ async def create_log_entry_endpoint(request, log_entry_data: LogEntryIn):
         properties=log_entry.properties,
         log_group_id=log_entry.log_group_id,
     )
+
+
+@router.post("/log-entries/batch", response=LogEntryBatchResponse)
+async def create_log_entries_endpoint(request):
+    """
+    Create many log entries in one request.
+
+    - Body is a JSON array of log entries, or NDJSON (one entry per line)
+      with Content-Type application/x-ndjson
+    - At most MAX_BATCH_SIZE entries per request
+    - Valid entries are inserted together; invalid ones are reported in
+      errors by their position and do not abort the batch
+    - ids follows the order of the input, with null for rejected items
+    - Entries with an idempotency_key already stored (same key and timestamp)
+      are not inserted again: they get the stored id and are listed in
+      duplicates, so a failed batch can be retried as a whole
+    """
+    items = _parse_batch_body(request)
+    if len(items) > MAX_BATCH_SIZE:
+        raise HttpError(413, f"Batch exceeds {MAX_BATCH_SIZE} entries")
+
+    requests, errors = validate_log_entry_items(items, _request_user_email(request))
+    for index, item in enumerate(items):
+        if item is INVALID_JSON:
+            errors[index] = "Invalid JSON"
+    positions = list(requests)
+
+    result = await create_log_entries(list(requests.values()))
+
+    ids: list[int | None] = [None] * len(items)
+    for request_index, entry in result.entries.items():
+        ids[positions[request_index]] = entry.id
+    for request_index, error in result.errors.items():
+        errors[positions[request_index]] = error
+
+    return LogEntryBatchResponse(
+        created=len(result.entries) - len(result.duplicates),
+        ids=ids,
+        duplicates=sorted(positions[index] for index in result.duplicates),
+        errors=[
+            LogEntryBatchError(index=index, error=error)
+            for index, error in sorted(errors.items())
+        ],
+    )
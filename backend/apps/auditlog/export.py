@@ -0,0 +1,145 @@
+"""
+Streaming export of audit log entries
+
+Entries are read with ``iterator()`` (server-side cursors on PostgreSQL)
+and encoded chunk by chunk as NDJSON or CSV, optionally gzip compressed, so
+an export of any size runs in constant memory. The HTTP
+endpoint and the ``export_log_entries`` command share these generators.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+
+from .models import LogEntry
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_COLUMNS = (
+    "id",
+    "timestamp",
+    "user",
+    "type",
+    "description",
+    "properties",
+    "log_group_id",
+    "log_group__reference_id",
+)
+# Rows fetched per round trip, and encoded per yielded chunk
+CHUNK_SIZE = 2000
+# zlib window bits that produce a gzip stream
+GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def export_queryset(queryset: QuerySet[LogEntry]) -> QuerySet:
+    """Return ``queryset`` as export rows in chronological order."""
+    return queryset.order_by("timestamp", "id").values_list(*EXPORT_COLUMNS)
+
+
+def content_type(fmt: str) -> str:
+    """Return the MIME type of an uncompressed export in ``fmt``."""
+    return "application/x-ndjson" if fmt == "ndjson" else "text/csv"
+
+
+def file_extension(fmt: str, *, compress: bool) -> str:
+    """Return the file extension of an export, e.g. ``ndjson.gz``."""
+    return f"{fmt}.gz" if compress else fmt
+
+
+class ExportEncoder:
+    """Turns export rows into (optionally gzip-compressed) bytes."""
+
+    def __init__(self, fmt: str, *, compress: bool):
+        if fmt not in EXPORT_FORMATS:
+            msg = f"Unsupported export format: {fmt}"
+            raise ValueError(msg)
+        self.fmt = fmt
+        self._compressor = (
+            zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS) if compress else None
+        )
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer)
+
+    def header(self) -> bytes:
+        if self.fmt != "csv":
+            return b""
+        self._csv.writerow(column.replace("__", "_") for column in EXPORT_COLUMNS)
+        return self._take()
+
+    def encode(self, rows: Iterable[tuple[Any, ...]]) -> bytes:
+        if self.fmt == "ndjson":
+            data = b"".join(
+                orjson.dumps(dict(zip(EXPORT_COLUMNS, row)), option=orjson.OPT_UTC_Z)
+                + b"\n"
+                for row in rows
+            )
+            return self._compress(data)
+        for row in rows:
+            entry_id, timestamp, user, entry_type, description, properties, *group = row
+            self._csv.writerow(
+                [
+                    entry_id,
+                    timestamp.isoformat(),
+                    user,
+                    entry_type,
+                    description,
+                    orjson.dumps(properties).decode(),
+                    *group,
+                ]
+            )
+        return self._take()
+
+    def finish(self) -> bytes:
+        if self._compressor is None:
+            return b""
+        return self._compressor.flush()
+
+    def _take(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return self._compress(data)
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is None:
+            return data
+        return self._compressor.compress(data)
+
+
+def iter_export(
+    queryset: QuerySet[LogEntry], fmt: str, *, compress: bool = False
+) -> Iterator[bytes]:
+    """Yield the export of ``queryset`` in ``fmt`` as chunks of bytes."""
+    encoder = ExportEncoder(fmt, compress=compress)
+    yield encoder.header()
+    rows = export_queryset(queryset).iterator(chunk_size=CHUNK_SIZE)
+    while chunk := list(islice(rows, CHUNK_SIZE)):
+        yield encoder.encode(chunk)
+    yield encoder.finish()
+
+
+async def aiter_export(
+    queryset: QuerySet[LogEntry], fmt: str, *, compress: bool = False
+) -> AsyncIterator[bytes]:
+    """Async version of iter_export."""
+    encoder = ExportEncoder(fmt, compress=compress)
+    yield encoder.header()
+    # QuerySet.aiterator() runs values_list() queries in the event loop, so
+    # chunks are pulled from the sync iterator in the database thread instead
+    rows = export_queryset(queryset).iterator(chunk_size=CHUNK_SIZE)
+    next_chunk = sync_to_async(lambda: list(islice(rows, CHUNK_SIZE)))
+    try:
+        while chunk := await next_chunk():
+            yield encoder.encode(chunk)
+    finally:
+        # Closes the server-side cursor if the client goes away mid-export
+        await sync_to_async(rows.close)()
+    yield encoder.finish()
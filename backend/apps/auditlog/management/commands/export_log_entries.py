@@ -0,0 +1,76 @@
+"""Export audit log entries to an NDJSON or CSV file."""
+
+import sys
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from apps.auditlog.export import EXPORT_FORMATS, iter_export
+from apps.auditlog.services import filter_log_entries
+
+
+def _datetime(value: str):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        msg = f"Invalid datetime: {value}"
+        raise CommandError(msg)
+    return parsed
+
+
+def _json_object(value: str) -> dict:
+    try:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError as err:
+        msg = f"Invalid JSON: {value}"
+        raise CommandError(msg) from err
+    if not isinstance(parsed, dict):
+        msg = f"Expected a JSON object: {value}"
+        raise CommandError(msg)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream audit log entries to a file (or stdout) as NDJSON or CSV, "
+        "in constant memory"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help='Destination file, or "-" for stdout')
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+        parser.add_argument("--gzip", action="store_true", help="Compress the output")
+        parser.add_argument("--log-group", help="Log group reference id")
+        parser.add_argument("--user", help="User that performed the actions")
+        parser.add_argument("--since", type=_datetime, help="Inclusive start timestamp")
+        parser.add_argument("--until", type=_datetime, help="Exclusive end timestamp")
+        parser.add_argument("--search", help="Words to find in the description")
+        parser.add_argument(
+            "--properties",
+            type=_json_object,
+            help="JSON object the entry properties must contain",
+        )
+
+    def handle(self, *args, **options):
+        queryset = filter_log_entries(
+            log_group_reference_id=options["log_group"],
+            user=options["user"],
+            since=options["since"],
+            until=options["until"],
+            search=options["search"],
+            properties=options["properties"],
+        )
+        chunks = iter_export(queryset, options["format"], compress=options["gzip"])
+
+        if options["output"] == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        size = 0
+        with open(options["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+                size += len(chunk)
+        self.stderr.write(f"Wrote {size} bytes to {options['output']}")
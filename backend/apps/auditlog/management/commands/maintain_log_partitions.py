@@ -0,0 +1,82 @@
+"""Create upcoming LogEntry partitions and archive the expired ones."""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.auditlog.partitions import (
+    archive_partition,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+    maintenance_lock,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly LogEntry partitions ahead of time and, when a "
+        "retention is configured, export expired partitions to gzip NDJSON "
+        "and drop them. Meant to run daily (see railway.cron.toml)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.AUDITLOG_PARTITIONS_AHEAD,
+            help="Number of future months to create partitions for",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.AUDITLOG_RETENTION_MONTHS,
+            help="Months of entries to keep (besides the current one); 0 keeps all",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=settings.AUDITLOG_ARCHIVE_DIR,
+            help="Directory where expired partitions are exported",
+        )
+        parser.add_argument(
+            "--skip-retention",
+            action="store_true",
+            help="Only create partitions",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the partitions that would be archived without touching them",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write("LogEntry is not partitioned, nothing to do")
+            return
+
+        with maintenance_lock() as acquired:
+            if not acquired:
+                self.stdout.write("Another maintenance run is in progress, skipping")
+                return
+            self._maintain(options)
+
+    def _maintain(self, options):
+        if not options["dry_run"]:
+            for name in ensure_partitions(options["months_ahead"]):
+                self.stdout.write(f"Created partition {name}")
+
+        if options["skip_retention"] or options["retention_months"] <= 0:
+            return
+
+        archive_dir = Path(options["archive_dir"])
+        for partition in expired_partitions(options["retention_months"]):
+            if options["dry_run"]:
+                self.stdout.write(f"Would archive {partition.name}")
+                continue
+            path, count = archive_partition(partition, archive_dir)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Archived {count} entries of {partition.name} to {path}"
+                )
+            )
@@ -0,0 +1,16 @@
+"""Rebuild the per-group entry counters and members from the log entries."""
+
+from django.core.management.base import BaseCommand
+
+from apps.auditlog.services import rebuild_log_group_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute LogGroupStats and LogGroupUser from LogEntry, e.g. after "
+        "entries were changed outside the audit log services"
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_log_group_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} log group stats rows"))
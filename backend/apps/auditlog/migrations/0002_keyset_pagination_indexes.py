@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='logentry',
+            name='auditlog_lo_timesta_c1d9bd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='logentry',
+            name='auditlog_lo_user_9a36e5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='logentry',
+            name='auditlog_lo_log_gro_dac8f1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='loggroup',
+            name='auditlog_lo_created_2d119c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['-timestamp', '-id'], name='auditlog_lo_timesta_5df2f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['user', '-timestamp', '-id'], name='auditlog_lo_user_c0fd68_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['log_group', '-timestamp', '-id'], name='auditlog_lo_log_gro_4b407c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loggroup',
+            index=models.Index(fields=['-created', '-id'], name='auditlog_lo_created_916992_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loggroup',
+            index=models.Index(fields=['type', '-created', '-id'], name='auditlog_lo_type_7fd0bb_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0002_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['log_group', 'type'], name='auditlog_lo_log_gro_66420a_idx'),
+        ),
+    ]
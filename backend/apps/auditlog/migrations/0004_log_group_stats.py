@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_stats(apps, schema_editor):
+    """Build the stats from the existing log entries."""
+    LogEntry = apps.get_model("auditlog", "LogEntry")
+    LogGroupStats = apps.get_model("auditlog", "LogGroupStats")
+
+    rows = (
+        LogEntry.objects.order_by()
+        .values("log_group_id", "type")
+        .annotate(count=Count("id"), last_timestamp=Max("timestamp"))
+    )
+    LogGroupStats.objects.bulk_create(
+        (LogGroupStats(**row) for row in rows.iterator()), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0003_entry_counts_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogGroupStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(help_text='The type of the log entries', max_length=50)),
+                ('count', models.PositiveBigIntegerField(default=0, help_text='Number of entries of this type in the log group')),
+                ('last_timestamp', models.DateTimeField(help_text='Timestamp of the most recent entry of this type')),
+                ('log_group', models.ForeignKey(help_text='The log group the entries belong to', on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='auditlog.loggroup')),
+            ],
+            options={
+                'verbose_name_plural': 'Log group stats',
+                'constraints': [models.UniqueConstraint(fields=('log_group', 'type'), name='auditlog_stats_group_type_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
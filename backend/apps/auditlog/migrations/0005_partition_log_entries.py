@@ -0,0 +1,98 @@
+"""
+Turn auditlog_logentry into a table range-partitioned by month on timestamp.
+
+PostgreSQL only; other databases keep the plain table. The existing rows are
+copied into the new partitions, and the indexes and foreign keys of the old
+table are recreated with the same names so later migrations still apply.
+The primary key becomes (id, timestamp), as partitioned tables require, and
+ids keep coming from a sequence since PostgreSQL 16 does not allow identity
+columns on partitioned tables.
+"""
+
+import datetime
+
+from django.db import migrations
+
+TABLE = "auditlog_logentry"
+OLD_TABLE = "auditlog_logentry_unpartitioned"
+SEQUENCE = "auditlog_logentry_id_seq"
+MONTHS_AHEAD = 3
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_log_entries(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s",
+            [TABLE, f"{TABLE}_pkey"],
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT min("timestamp")::date FROM {TABLE}')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+        # Frees the sequence name; the old table is dropped below
+        cursor.execute(
+            f"ALTER TABLE {OLD_TABLE} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+        )
+        cursor.execute(f"DROP SEQUENCE IF EXISTS {SEQUENCE} CASCADE")
+
+        cursor.execute(
+            f"""
+            CREATE TABLE {TABLE} (
+                LIKE {OLD_TABLE},
+                PRIMARY KEY (id, "timestamp")
+            ) PARTITION BY RANGE ("timestamp")
+            """
+        )
+        cursor.execute(f"CREATE SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')"
+        )
+
+        today = datetime.date.today()
+        month = datetime.date((oldest or today).year, (oldest or today).month, 1)
+        last = add_months(datetime.date(today.year, today.month, 1), MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {TABLE} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [f"{month} 00:00:00+00", f"{add_months(month, 1)} 00:00:00+00"],
+            )
+            month = add_months(month, 1)
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}")
+        cursor.execute(
+            f"SELECT setval('{SEQUENCE}', COALESCE(max(id), 0) + 1, false) FROM {TABLE}"
+        )
+        cursor.execute(f"DROP TABLE {OLD_TABLE}")
+
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0004_log_group_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_log_entries, migrations.RunPython.noop),
+    ]
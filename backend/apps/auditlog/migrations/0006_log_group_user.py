@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_members(apps, schema_editor):
+    """Register the users of the existing log entries."""
+    LogEntry = apps.get_model("auditlog", "LogEntry")
+    LogGroupUser = apps.get_model("auditlog", "LogGroupUser")
+
+    pairs = LogEntry.objects.order_by().values("log_group_id", "user").distinct()
+    LogGroupUser.objects.bulk_create(
+        (LogGroupUser(**pair) for pair in pairs.iterator()), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0005_partition_log_entries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogGroupUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user', models.CharField(help_text='A string identifying the user, as stored in LogEntry.user', max_length=255)),
+                ('log_group', models.ForeignKey(help_text='The log group the user has recorded entries in', on_delete=django.db.models.deletion.CASCADE, related_name='members', to='auditlog.loggroup')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('log_group', 'user'), name='auditlog_member_group_user_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_members, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0006_log_group_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logentry',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Client-supplied key; retried entries with the same key and timestamp are stored once', max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='logentry',
+            constraint=models.UniqueConstraint(fields=('idempotency_key', 'timestamp'), name='auditlog_entry_idempotency_uniq'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+"""
+Index LogEntry for full-text search on description and JSON containment on
+properties.
+
+PostgreSQL only; other databases fall back to unindexed lookups. The text
+search expression must stay identical to the one built by
+``filter_log_entries`` or the planner will not use the index. Indexes created
+on the partitioned parent are created on every partition, current and future.
+"""
+
+from django.db import migrations
+
+TABLE = "auditlog_logentry"
+SEARCH_INDEX = "auditlog_entry_search_idx"
+PROPERTIES_INDEX = "auditlog_entry_props_idx"
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON {TABLE} USING gin (
+                to_tsvector('spanish'::regconfig, COALESCE(description, ''))
+            )
+            """
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {PROPERTIES_INDEX} "
+            f"ON {TABLE} USING gin (properties jsonb_path_ops)"
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX}")
+        cursor.execute(f"DROP INDEX IF EXISTS {PROPERTIES_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0007_log_entry_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
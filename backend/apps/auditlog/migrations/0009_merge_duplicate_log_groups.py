@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-19 05:21
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def merge_duplicate_groups(apps, schema_editor):
+    """Fold groups sharing a reference_id into the oldest one."""
+    LogGroup = apps.get_model("auditlog", "LogGroup")
+    LogEntry = apps.get_model("auditlog", "LogEntry")
+    LogGroupStats = apps.get_model("auditlog", "LogGroupStats")
+    LogGroupUser = apps.get_model("auditlog", "LogGroupUser")
+
+    duplicated = list(
+        LogGroup.objects.order_by()
+        .values("reference_id")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("reference_id", flat=True)
+    )
+    for reference_id in duplicated:
+        keep, *others = LogGroup.objects.filter(reference_id=reference_id).order_by(
+            "id"
+        )
+        LogEntry.objects.filter(log_group__in=others).update(log_group=keep)
+        for stats in LogGroupStats.objects.filter(log_group__in=others):
+            kept, _ = LogGroupStats.objects.get_or_create(
+                log_group=keep,
+                type=stats.type,
+                defaults={"count": 0, "last_timestamp": stats.last_timestamp},
+            )
+            kept.count += stats.count
+            kept.last_timestamp = max(kept.last_timestamp, stats.last_timestamp)
+            kept.save()
+        for member in LogGroupUser.objects.filter(log_group__in=others):
+            LogGroupUser.objects.get_or_create(log_group=keep, user=member.user)
+        LogGroup.objects.filter(pk__in=[group.pk for group in others]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0008_log_entry_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_groups, migrations.RunPython.noop),
+    ]
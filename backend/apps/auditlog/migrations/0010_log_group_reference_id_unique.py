@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditlog', '0009_merge_duplicate_log_groups'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='loggroup',
+            name='reference_id',
+            field=models.CharField(help_text='The identifier the log group is looked up by, whatever its type', max_length=255, unique=True),
+        ),
+    ]
@@ -25,8 +25,8 @@ class LogGroup(models.Model):
 
     reference_id = models.CharField(
         max_length=255,
-        db_index=True,
-        help_text="An identifier that should be unique across the log group type",
+        unique=True,
+        help_text="The identifier the log group is looked up by, whatever its type",
     )
 
     properties = models.JSONField(
@@ -38,7 +38,8 @@ class LogGroup(models.Model):
         ordering = ["-created"]
         indexes = [
             models.Index(fields=["type", "reference_id"]),
-            models.Index(fields=["-created"]),
+            models.Index(fields=["-created", "-id"]),
+            models.Index(fields=["type", "-created", "-id"]),
         ]
 
     def __str__(self):
@@ -80,14 +81,100 @@ class LogEntry(models.Model):
         default=dict, blank=True, help_text="A dictionary of arbitrary key-values"
     )
 
+    idempotency_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="Client-supplied key; retried entries with the same key and "
+        "timestamp are stored once",
+    )
+
     class Meta:
         ordering = ["-timestamp"]
         indexes = [
-            models.Index(fields=["-timestamp"]),
-            models.Index(fields=["user"]),
-            models.Index(fields=["log_group", "-timestamp"]),
+            models.Index(fields=["-timestamp", "-id"]),
+            models.Index(fields=["user", "-timestamp", "-id"]),
+            models.Index(fields=["log_group", "-timestamp", "-id"]),
+            # Covers the per-type entry counts of a page of groups
+            models.Index(fields=["log_group", "type"]),
+        ]
+        constraints = [
+            # Includes timestamp because unique indexes on a partitioned table
+            # must contain the partition key
+            models.UniqueConstraint(
+                fields=["idempotency_key", "timestamp"],
+                name="auditlog_entry_idempotency_uniq",
+            ),
         ]
         verbose_name_plural = "Log entries"
 
     def __str__(self):
         return f"{self.user} - {self.type} at {self.timestamp}"
+
+
+class LogGroupStats(models.Model):
+    """
+    Number of entries of each type in a log group.
+
+    Kept up to date in the same transaction that inserts the entries, so
+    counts can be read without scanning LogEntry.
+    """
+
+    log_group = models.ForeignKey(
+        LogGroup,
+        on_delete=models.CASCADE,
+        related_name="stats",
+        help_text="The log group the entries belong to",
+    )
+
+    type = models.CharField(max_length=50, help_text="The type of the log entries")
+
+    count = models.PositiveBigIntegerField(
+        default=0, help_text="Number of entries of this type in the log group"
+    )
+
+    last_timestamp = models.DateTimeField(
+        help_text="Timestamp of the most recent entry of this type"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["log_group", "type"], name="auditlog_stats_group_type_uniq"
+            ),
+        ]
+        verbose_name_plural = "Log group stats"
+
+    def __str__(self):
+        return f"{self.log_group_id} - {self.type}: {self.count}"
+
+
+class LogGroupUser(models.Model):
+    """
+    A user that has recorded at least one entry in a log group.
+
+    Inserted alongside the entries, so the participants of a group can be
+    listed without reading LogEntry.
+    """
+
+    log_group = models.ForeignKey(
+        LogGroup,
+        on_delete=models.CASCADE,
+        related_name="members",
+        help_text="The log group the user has recorded entries in",
+    )
+
+    user = models.CharField(
+        max_length=255,
+        help_text="A string identifying the user, as stored in LogEntry.user",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["log_group", "user"], name="auditlog_member_group_user_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.log_group_id} - {self.user}"
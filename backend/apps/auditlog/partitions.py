@@ -0,0 +1,323 @@
+"""
+Monthly partitions of the LogEntry table
+
+On PostgreSQL ``auditlog_logentry`` is range-partitioned by ``timestamp``
+(see migration 0005), with one partition per month named
+``auditlog_logentry_pYYYY_MM`` and a default partition for anything outside
+them. Queries filtering on ``timestamp`` only touch the matching partitions.
+
+This module creates partitions ahead of time and archives old ones: a
+partition past the retention window is detached, exported to gzip NDJSON and
+dropped, so old entries cost neither index space nor vacuum time.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+import orjson
+from django.db import connection, transaction
+
+from .models import LogEntry, LogGroup, LogGroupStats, LogGroupUser
+
+PARENT_TABLE = LogEntry._meta.db_table
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Partition(NamedTuple):
+    """A monthly partition and the first day of its month."""
+
+    name: str
+    month: datetime.date
+
+
+def month_start(value: datetime.date) -> datetime.date:
+    """Return the first day of the month of ``value``."""
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    """Return the partition table name for ``month``."""
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def is_partitioned() -> bool:
+    """Return whether LogEntry is stored in a partitioned table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+@contextmanager
+def maintenance_lock() -> Iterator[bool]:
+    """
+    Hold the session advisory lock of partition maintenance.
+
+    Yields whether the lock was acquired; it is not when another replica is
+    already creating or archiving partitions.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(hashtext(%s))", [PARENT_TABLE])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_unlock(hashtext(%s))", [PARENT_TABLE]
+                )
+
+
+def list_partitions() -> list[Partition]:
+    """Return the monthly partitions of LogEntry, oldest first."""
+    prefix = f"{PARENT_TABLE}_p"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        if not name.startswith(prefix):
+            continue
+        year, month = name.removeprefix(prefix).split("_")
+        partitions.append(Partition(name, datetime.date(int(year), int(month), 1)))
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+@transaction.atomic
+def create_partition(month: datetime.date) -> str:
+    """
+    Create the partition for ``month`` if it does not exist yet.
+
+    Entries of that month already stored in the default partition would make
+    ``CREATE TABLE ... PARTITION OF`` fail, so they are moved to the new
+    partition in the same transaction.
+    """
+    name = partition_name(month)
+    quote = connection.ops.quote_name
+    bounds = [f"{month} 00:00:00+00", f"{add_months(month, 1)} 00:00:00+00"]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s), to_regclass(%s)", [name, DEFAULT_PARTITION]
+        )
+        exists, has_default = cursor.fetchone()
+        if exists:
+            return name
+
+        misplaced = False
+        if has_default:
+            # Keeps new entries of the month from landing in the default
+            # partition between the check and the move
+            cursor.execute(
+                f"LOCK TABLE {quote(DEFAULT_PARTITION)} IN SHARE ROW EXCLUSIVE MODE"
+            )
+            cursor.execute(
+                f"""
+                SELECT EXISTS (
+                    SELECT 1 FROM {quote(DEFAULT_PARTITION)}
+                    WHERE "timestamp" >= %s AND "timestamp" < %s
+                )
+                """,  # noqa: S608
+                bounds,
+            )
+            misplaced = cursor.fetchone()[0]
+        if misplaced:
+            cursor.execute(
+                f"ALTER TABLE {quote(PARENT_TABLE)} "
+                f"DETACH PARTITION {quote(DEFAULT_PARTITION)}"
+            )
+
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} "
+            f"PARTITION OF {quote(PARENT_TABLE)} FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+
+        if misplaced:
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {quote(DEFAULT_PARTITION)}
+                    WHERE "timestamp" >= %s AND "timestamp" < %s
+                    RETURNING *
+                )
+                INSERT INTO {quote(name)} SELECT * FROM moved
+                """,  # noqa: S608
+                bounds,
+            )
+            cursor.execute(
+                f"ALTER TABLE {quote(PARENT_TABLE)} "
+                f"ATTACH PARTITION {quote(DEFAULT_PARTITION)} DEFAULT"
+            )
+    return name
+
+
+def ensure_partitions(
+    months_ahead: int, today: datetime.date | None = None
+) -> list[str]:
+    """
+    Create the partitions from the current month to ``months_ahead`` months later.
+
+    Returns:
+        Names of the partitions that did not exist before
+    """
+    current = month_start(today or datetime.datetime.now(tz=datetime.UTC).date())
+    existing = {partition.name for partition in list_partitions()}
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if partition_name(month) not in existing:
+            created.append(create_partition(month))
+    return created
+
+
+def expired_partitions(
+    retention_months: int, today: datetime.date | None = None
+) -> list[Partition]:
+    """Return the partitions whose whole month is older than the retention window."""
+    current = month_start(today or datetime.datetime.now(tz=datetime.UTC).date())
+    cutoff = add_months(current, -retention_months)
+    return [partition for partition in list_partitions() if partition.month < cutoff]
+
+
+def export_partition(partition: Partition, archive_dir: Path) -> tuple[Path, int]:
+    """
+    Write every entry of ``partition`` to ``<archive_dir>/<name>.ndjson.gz``.
+
+    Rows are streamed with a server-side cursor, so memory stays constant.
+    The file is written under a temporary name and renamed when complete.
+
+    Returns:
+        Path of the archive and number of entries written
+    """
+    quote = connection.ops.quote_name
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{partition.name}.ndjson.gz"
+    partial_path = path.with_name(f"{path.name}.partial")
+
+    columns = ("id", "timestamp", "user", "type", "description")
+    count = 0
+    with transaction.atomic(), connection.chunked_cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT {", ".join(f"e.{quote(column)}" for column in columns)},
+                   e.properties::text, e.log_group_id, g.type, g.reference_id
+            FROM {quote(partition.name)} e
+            JOIN {quote(LogGroup._meta.db_table)} g ON g.id = e.log_group_id
+            ORDER BY e.timestamp, e.id
+            """  # noqa: S608
+        )
+        with partial_path.open("wb") as raw_file:
+            with gzip.GzipFile(fileobj=raw_file, mode="wb") as archive:
+                while rows := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+                    for row in rows:
+                        record = dict(zip(columns, row[: len(columns)]))
+                        record["properties"] = orjson.loads(row[-4])
+                        record["log_group"] = {
+                            "id": row[-3],
+                            "type": row[-2],
+                            "reference_id": row[-1],
+                        }
+                        archive.write(
+                            orjson.dumps(record, option=orjson.OPT_UTC_Z) + b"\n"
+                        )
+                    count += len(rows)
+            # The archive must be on disk before the partition is dropped
+            raw_file.flush()
+            os.fsync(raw_file.fileno())
+    partial_path.replace(path)
+    return path, count
+
+
+@transaction.atomic
+def archive_partition(partition: Partition, archive_dir: Path) -> tuple[Path, int]:
+    """
+    Detach ``partition``, export it with export_partition and drop it.
+
+    Everything runs in one transaction, and the partition is detached before
+    it is read: entries of that month inserted meanwhile (clients set the
+    timestamp, spill replays carry old ones) wait for the commit and then go
+    to the default partition instead of being dropped unarchived. The detach
+    locks the parent table, so LogEntry reads and writes wait for the export.
+
+    Returns:
+        Path of the archive and number of entries archived
+    """
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {quote(PARENT_TABLE)} "
+            f"DETACH PARTITION {quote(partition.name)}"
+        )
+    path, count = export_partition(partition, archive_dir)
+    _drop_detached_partition(partition)
+    return path, count
+
+
+def _drop_detached_partition(partition: Partition) -> None:
+    """
+    Drop a detached ``partition``, removing its entries from LogGroupStats.
+
+    Users left without entries in a group stop being members of it
+    (LogGroupUser). Must run in the transaction that detached the partition.
+    """
+    quote = connection.ops.quote_name
+    stats_table = quote(LogGroupStats._meta.db_table)
+    members_table = quote(LogGroupUser._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {stats_table} s
+            SET count = GREATEST(s.count - d.count, 0)
+            FROM (
+                SELECT log_group_id, type, count(*) AS count
+                FROM {quote(partition.name)}
+                GROUP BY log_group_id, type
+            ) d
+            WHERE s.log_group_id = d.log_group_id AND s.type = d.type
+            """  # noqa: S608
+        )
+        cursor.execute(f"DELETE FROM {stats_table} WHERE count = 0")  # noqa: S608
+        # The detach locks the parent table until commit, so no entry of these
+        # users can be inserted before the membership check commits
+        cursor.execute(
+            f"""
+            DELETE FROM {members_table} m
+            USING (
+                SELECT DISTINCT log_group_id, "user" FROM {quote(partition.name)}
+            ) d
+            WHERE m.log_group_id = d.log_group_id AND m."user" = d."user"
+            AND NOT EXISTS (
+                SELECT 1 FROM {quote(PARENT_TABLE)} e
+                WHERE e.log_group_id = m.log_group_id AND e."user" = m."user"
+            )
+            """  # noqa: S608
+        )
+        cursor.execute(f"DROP TABLE {quote(partition.name)}")
@@ -9,13 +9,29 @@ and map their inputs/outputs to transport-specific schemas.
 from __future__ import annotations
 
 from abc import ABC
-from datetime import datetime  # noqa: TC003
-from typing import Any, ClassVar
+from datetime import UTC, datetime
+from typing import Any, ClassVar, NamedTuple
 
-from django.db.models import BooleanField, Case, Count, When
-from pydantic import BaseModel
+from asgiref.sync import sync_to_async
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Max, QuerySet
+from django.utils import timezone
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from .models import LogEntry, LogGroup
+from services.pagination import CursorPage, apaginate_queryset
+
+from .models import LogEntry, LogGroup, LogGroupStats, LogGroupUser
+
+# Maximum number of entries accepted in one batch, whatever the transport
+MAX_BATCH_SIZE = 1000
+# Rows per INSERT statement, well below the bind parameter limits
+INSERT_CHUNK_SIZE = 1000
+ENTRY_TYPES_CACHE_KEY = "auditlog:entry_types"
+ENTRY_TYPES_CACHE_TIMEOUT = 300
+# Text search configuration of the description index (see migration 0008)
+SEARCH_CONFIG = "spanish"
 
 
 ###########################
@@ -38,14 +54,24 @@ class LogGroupRequest(ABC, BaseModel):
 
 
 class LogEntryRequest(BaseModel):
-    """Request model for creating a log entry via WebSocket"""
+    """Request model for creating a log entry via HTTP or WebSocket"""
 
     timestamp: datetime
     log_group_reference_id: str
     type: str
-    properties: dict[str, Any]
+    properties: dict[str, Any] = Field(default_factory=dict)
     description: str = ""
     user: str = "sidekick"  # Default to sidekick
+    # Retries with the same key and timestamp return the stored entry
+    idempotency_key: str | None = Field(None, min_length=1, max_length=255)
+
+    @field_validator("timestamp")
+    @classmethod
+    def make_timestamp_aware(cls, value: datetime) -> datetime:
+        """Read naive timestamps as UTC so they compare with stored ones."""
+        if timezone.is_naive(value):
+            return timezone.make_aware(value, UTC)
+        return value
 
 
 ###########################
@@ -60,22 +86,287 @@ class LogGroupNotFoundError(Exception):
         super().__init__(message)
 
 
+class LogEntryBatchResult(NamedTuple):
+    """Outcome of a batch insert, keyed by the position of each request."""
+
+    entries: dict[int, LogEntry]
+    errors: dict[int, str]
+    # Indexes of entries that were already stored under their idempotency key
+    duplicates: set[int]
+
+
+###########################
+# Validation
+###########################
+def format_validation_error(err: ValidationError) -> str:
+    """Summarize a pydantic error as ``field: message`` pairs."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in err.errors()
+    )
+
+
+def validate_log_entry_items(
+    items: list[Any], user: str
+) -> tuple[dict[int, LogEntryRequest], dict[int, str]]:
+    """
+    Validate raw log entry payloads received by a transport.
+
+    Args:
+        items: Decoded payloads, one per entry
+        user: Authenticated user recorded on every entry
+
+    Returns:
+        Valid requests and error messages, both keyed by position in ``items``
+    """
+    requests: dict[int, LogEntryRequest] = {}
+    errors: dict[int, str] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors[index] = "Expected a JSON object"
+            continue
+        try:
+            requests[index] = LogEntryRequest.model_validate({**item, "user": user})
+        except ValidationError as err:
+            errors[index] = format_validation_error(err)
+    return requests, errors
+
+
+###########################
+# Sync helpers
+###########################
+def increment_log_group_stats(entries: list[LogEntry]) -> None:
+    """
+    Add ``entries`` to the per-group, per-type stats with a single upsert.
+
+    Must run in the transaction that inserts the entries so the stats stay
+    exact.
+    """
+    deltas: dict[tuple[int, str], tuple[int, datetime]] = {}
+    for entry in entries:
+        key = (entry.log_group_id, entry.type)
+        count, last_timestamp = deltas.get(key, (0, entry.timestamp))
+        deltas[key] = (count + 1, max(last_timestamp, entry.timestamp))
+    if not deltas:
+        return
+
+    table = connection.ops.quote_name(LogGroupStats._meta.db_table)
+    greatest = "GREATEST" if connection.vendor == "postgresql" else "MAX"
+    values = ", ".join(["(%s, %s, %s, %s)"] * len(deltas))
+    params = []
+    # Sorted so concurrent upserts lock rows in the same order
+    for (log_group_id, entry_type), (count, last_timestamp) in sorted(deltas.items()):
+        params += [
+            log_group_id,
+            entry_type,
+            count,
+            connection.ops.adapt_datetimefield_value(last_timestamp),
+        ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (log_group_id, type, count, last_timestamp)
+            VALUES {values}
+            ON CONFLICT (log_group_id, type) DO UPDATE SET
+                count = {table}.count + EXCLUDED.count,
+                last_timestamp = {greatest}({table}.last_timestamp, EXCLUDED.last_timestamp)
+            """,  # noqa: S608
+            params,
+        )
+
+
+def add_log_group_users(entries: list[LogEntry]) -> None:
+    """Register the users of ``entries`` as members of their log groups."""
+    pairs = sorted({(entry.log_group_id, entry.user) for entry in entries})
+    LogGroupUser.objects.bulk_create(
+        [LogGroupUser(log_group_id=group_id, user=user) for group_id, user in pairs],
+        ignore_conflicts=True,
+    )
+
+
+def upsert_log_group(group_type: str, reference_id: str, properties: dict) -> LogGroup:
+    """
+    Create the log group, or update the properties of the existing one.
+
+    Groups are identified by ``reference_id`` alone, so an existing group
+    keeps its type. A single ``INSERT ... ON CONFLICT`` statement, so
+    concurrent first writes for the same group neither race nor fail on the
+    unique constraint.
+    """
+    opts = LogGroup._meta
+    quote = connection.ops.quote_name
+    return LogGroup.objects.raw(
+        f"""
+        INSERT INTO {quote(opts.db_table)} (created, type, reference_id, properties)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (reference_id) DO UPDATE SET
+            properties = EXCLUDED.properties
+        RETURNING *
+        """,  # noqa: S608
+        [
+            opts.get_field("created").get_db_prep_save(timezone.now(), connection),
+            group_type,
+            reference_id,
+            opts.get_field("properties").get_db_prep_save(properties, connection),
+        ],
+    )[0]
+
+
+def _insert_keyed_log_entries(entries: list[LogEntry]) -> list[LogEntry]:
+    """
+    Insert entries that carry an idempotency key, skipping stored ones.
+
+    Every entry gets the id of its row, whether inserted now or earlier;
+    entries repeating a key within ``entries`` share the first one's row.
+
+    Returns:
+        The entries actually inserted
+    """
+    unique: dict[tuple[str, datetime], LogEntry] = {}
+    for entry in entries:
+        unique.setdefault((entry.idempotency_key, entry.timestamp), entry)
+    candidates = list(unique.values())
+
+    opts = LogEntry._meta
+    quote = connection.ops.quote_name
+    fields = [
+        opts.get_field(name)
+        for name in (
+            "log_group",
+            "user",
+            "timestamp",
+            "description",
+            "type",
+            "properties",
+            "idempotency_key",
+        )
+    ]
+    columns = ", ".join(quote(field.column) for field in fields)
+    row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    rows = [
+        [
+            field.get_db_prep_save(getattr(entry, field.attname), connection)
+            for field in fields
+        ]
+        for entry in candidates
+    ]
+    ids: dict[tuple[str, datetime], int] = {}
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            chunk = rows[start : start + INSERT_CHUNK_SIZE]
+            cursor.execute(
+                f"""
+                INSERT INTO {quote(opts.db_table)} ({columns})
+                VALUES {", ".join([row] * len(chunk))}
+                ON CONFLICT (idempotency_key, "timestamp") DO NOTHING
+                RETURNING id, idempotency_key, "timestamp"
+                """,  # noqa: S608
+                [param for params in chunk for param in params],
+            )
+            for entry_id, key, timestamp in cursor.fetchall():
+                # SQLite returns naive UTC datetimes
+                if timezone.is_naive(timestamp):
+                    timestamp = timezone.make_aware(timestamp, UTC)
+                ids[(key, timestamp)] = entry_id
+
+    inserted = []
+    for entry in candidates:
+        entry_id = ids.get((entry.idempotency_key, entry.timestamp))
+        if entry_id is not None:
+            entry.pk = entry_id
+            entry._state.adding = False
+            inserted.append(entry)
+
+    # Skipped rows are not returned by the insert, so look up their ids
+    skipped = [entry for entry in candidates if entry.pk is None]
+    if skipped:
+        stored = LogEntry.objects.filter(
+            idempotency_key__in={entry.idempotency_key for entry in skipped},
+            timestamp__in={entry.timestamp for entry in skipped},
+        ).values_list("idempotency_key", "timestamp", "id")
+        stored_ids = {(key, timestamp): entry_id for key, timestamp, entry_id in stored}
+        for entry in skipped:
+            entry.pk = stored_ids.get((entry.idempotency_key, entry.timestamp))
+            entry._state.adding = False
+
+    for entry in entries:
+        if entry.pk is None:
+            entry.pk = unique[(entry.idempotency_key, entry.timestamp)].pk
+            entry._state.adding = False
+    return inserted
+
+
+@transaction.atomic
+def insert_log_entries(entries: list[LogEntry]) -> list[LogEntry]:
+    """
+    Insert ``entries`` and update their groups' stats and members atomically.
+
+    Entries with an idempotency key that is already stored are not inserted
+    again; they get the id of the stored entry and do not count in the stats.
+
+    Returns:
+        The entries actually inserted
+    """
+    keyed = [entry for entry in entries if entry.idempotency_key]
+    inserted = LogEntry.objects.bulk_create(
+        [entry for entry in entries if not entry.idempotency_key],
+        batch_size=INSERT_CHUNK_SIZE,
+    )
+    if keyed:
+        inserted += _insert_keyed_log_entries(keyed)
+    increment_log_group_stats(inserted)
+    add_log_group_users(inserted)
+    return inserted
+
+
+@transaction.atomic
+def rebuild_log_group_stats() -> int:
+    """
+    Recompute every log group stat and member from LogEntry.
+
+    Members whose entries were all archived are dropped.
+
+    Returns:
+        Number of stats rows written
+    """
+    if connection.vendor == "postgresql":
+        # Blocks entry inserts (not reads) until the rebuild commits
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {connection.ops.quote_name(LogEntry._meta.db_table)} "
+                "IN SHARE MODE"
+            )
+    LogGroupStats.objects.all().delete()
+    rows = (
+        LogEntry.objects.order_by()
+        .values("log_group_id", "type")
+        .annotate(count=Count("id"), last_timestamp=Max("timestamp"))
+    )
+    stats = LogGroupStats.objects.bulk_create(
+        (LogGroupStats(**row) for row in rows.iterator()), batch_size=1000
+    )
+
+    LogGroupUser.objects.all().delete()
+    pairs = LogEntry.objects.order_by().values("log_group_id", "user").distinct()
+    LogGroupUser.objects.bulk_create(
+        (LogGroupUser(**pair) for pair in pairs.iterator()), batch_size=1000
+    )
+    cache.delete(ENTRY_TYPES_CACHE_KEY)
+    return len(stats)
+
+
 ###########################
 # Async API
 ###########################
 async def get_or_create_log_group(log_owner: LogGroupRequest) -> LogGroup:
     """
     Create or update a log group with the provided properties.
+
+    See upsert_log_group.
     """
-    return (
-        await LogGroup.objects.aget_or_create(
-            reference_id=log_owner.reference_id(),
-            defaults={
-                "type": log_owner.log_group_type,
-                "properties": log_owner.properties(),
-            },
-        )
-    )[0]
+    return await sync_to_async(upsert_log_group)(
+        log_owner.log_group_type, log_owner.reference_id(), log_owner.properties()
+    )
 
 
 async def get_log_group_by_reference_id(reference_id: str) -> LogGroup | None:
@@ -86,35 +377,88 @@ async def get_log_group_by_reference_id(reference_id: str) -> LogGroup | None:
         return None
 
 
+async def get_entry_types() -> list[str]:
+    """
+    Return every distinct log entry type.
+
+    The list is cached for ENTRY_TYPES_CACHE_TIMEOUT seconds, since new
+    types appear rarely.
+    """
+    entry_types = await cache.aget(ENTRY_TYPES_CACHE_KEY)
+    if entry_types is None:
+        entry_types = sorted(
+            [
+                entry_type
+                async for entry_type in LogGroupStats.objects.order_by()
+                .values_list("type", flat=True)
+                .distinct()
+            ]
+        )
+        await cache.aset(
+            ENTRY_TYPES_CACHE_KEY, entry_types, ENTRY_TYPES_CACHE_TIMEOUT
+        )
+    return entry_types
+
+
+async def get_entry_counts(
+    log_group_ids: list[int],
+    entry_types: list[str] | None = None,
+) -> dict[int, dict[str, int]]:
+    """
+    Return the number of entries of each log group by type.
+
+    Counts are read from LogGroupStats, so the cost does not depend on the
+    size of LogEntry.
+
+    Args:
+        log_group_ids: Log groups to count
+        entry_types: Types to count (zero when absent), or None for all types
+
+    Returns:
+        Dictionary mapping log_group_id to a {type: count} dictionary
+    """
+    if entry_types is None:
+        entry_types = await get_entry_types()
+    counts: dict[int, dict[str, int]] = {
+        log_group_id: dict.fromkeys(entry_types, 0) for log_group_id in log_group_ids
+    }
+    if not log_group_ids or not entry_types:
+        return counts
+
+    rows = LogGroupStats.objects.filter(
+        log_group_id__in=log_group_ids, type__in=entry_types
+    ).values_list("log_group_id", "type", "count")
+    async for log_group_id, entry_type, count in rows:
+        counts[log_group_id][entry_type] = count
+    return counts
+
+
 async def get_log_group_with_entry_counts_by_reference_id(
     reference_id: str,
     entry_types: list[str] | None = None,
 ) -> LogGroup | None:
-    """Return the log group with entry counts for the given reference_id or None."""
-    # Build conditional counts for each type
-    annotations = {}
-    for entry_type in entry_types:
-        annotations[f"count_{entry_type}"] = Count(
-            "log_entries",
-            filter=Case(
-                When(log_entries__type=entry_type, then=True),
-                default=False,
-                output_field=BooleanField(),
-            ),
-        )
+    """
+    Return the log group for the given reference_id or None.
 
-    try:
-        return await LogGroup.objects.annotate(**annotations).aget(
-            reference_id=reference_id
-        )
-    except LogGroup.DoesNotExist:
-        return None
+    The group gets ``entry_counts`` (see get_entry_counts) and ``users``
+    (see get_users_by_log_groups) attributes.
+    """
+    log_group = await get_log_group_by_reference_id(reference_id)
+    if log_group is not None:
+        counts = await get_entry_counts([log_group.id], entry_types)
+        users = await get_users_by_log_groups([log_group.id])
+        log_group.entry_counts = counts[log_group.id]
+        log_group.users = users[log_group.id]
+    return log_group
 
 
 async def create_log_entry(request: LogEntryRequest) -> LogEntry:
     """
     Create a log entry for the specified log group by reference id.
 
+    If the request's idempotency key is already stored, the stored entry's id
+    is set on the returned entry instead.
+
     Raises LogGroupNotFoundError if the log group is not found.
     """
     try:
@@ -124,62 +468,171 @@ async def create_log_entry(request: LogEntryRequest) -> LogEntry:
     except LogGroup.DoesNotExist as err:
         raise LogGroupNotFoundError(request.log_group_reference_id) from err
 
-    return await LogEntry.objects.acreate(
+    entry = LogEntry(
         log_group=log_group,
         **request.model_dump(exclude={"log_group_reference_id"}),
     )
+    await sync_to_async(insert_log_entries)([entry])
+    return entry
+
+
+async def create_log_entries(
+    requests: list[LogEntryRequest],
+) -> LogEntryBatchResult:
+    """
+    Create many log entries with one group lookup and one insert.
+
+    Requests whose log group does not exist are reported in ``errors`` and
+    skipped; the remaining entries and their stats are inserted atomically.
+    Entries whose idempotency key is already stored are not inserted again
+    and are reported in ``duplicates``.
+
+    Args:
+        requests: Log entry requests, in client order
+
+    Returns:
+        LogEntryBatchResult mapping each request index to its created (or
+        previously stored) entry or to an error message
+    """
+    reference_ids = {request.log_group_reference_id for request in requests}
+    group_ids = {
+        reference_id: group_id
+        async for reference_id, group_id in LogGroup.objects.filter(
+            reference_id__in=reference_ids
+        ).values_list("reference_id", "id")
+    }
+
+    entries: dict[int, LogEntry] = {}
+    errors: dict[int, str] = {}
+    for index, request in enumerate(requests):
+        group_id = group_ids.get(request.log_group_reference_id)
+        if group_id is None:
+            errors[index] = str(LogGroupNotFoundError(request.log_group_reference_id))
+            continue
+        entries[index] = LogEntry(
+            log_group_id=group_id,
+            **request.model_dump(exclude={"log_group_reference_id"}),
+        )
+
+    duplicates: set[int] = set()
+    if entries:
+        inserted = await sync_to_async(insert_log_entries)(list(entries.values()))
+        inserted_ids = {id(entry) for entry in inserted}
+        duplicates = {
+            index for index, entry in entries.items() if id(entry) not in inserted_ids
+        }
+    return LogEntryBatchResult(entries=entries, errors=errors, duplicates=duplicates)
 
 
 async def list_log_groups(
     *,
     group_type: str | None = None,
     entry_types: list[str] | None = None,
+    cursor: str | None = None,
     offset: int = 0,
     limit: int = 100,
-    order_by: str = "-created",
-) -> list[LogGroup]:
-    """Return a list of log groups matching the provided filters."""
-    # If no entry_types specified, get all distinct types
-    if entry_types is None:
-        entry_types = (
-            await LogEntry.objects.values_list("type", flat=True).distinct().alist()
-        )
-
-    # Build conditional counts for each type
-    annotations = {}
-    for entry_type in entry_types:
-        annotations[f"count_{entry_type}"] = Count(
-            "log_entries",
-            filter=Case(
-                When(log_entries__type=entry_type, then=True),
-                default=False,
-                output_field=BooleanField(),
-            ),
-        )
+    ordering: tuple[str, ...] = ("-created", "-id"),
+) -> CursorPage:
+    """
+    Return a page of log groups matching the provided filters.
 
-    queryset = LogGroup.objects.all().annotate(**annotations)
+    Each group gets ``entry_counts`` (see get_entry_counts) and ``users``
+    (see get_users_by_log_groups) attributes.
+    """
+    queryset = LogGroup.objects.all()
     if group_type:
         queryset = queryset.filter(type=group_type)
-    sliced = queryset.order_by(order_by)[offset : offset + limit]
-    return [obj async for obj in sliced]
+    page = await apaginate_queryset(
+        queryset, ordering=ordering, cursor=cursor, limit=limit, offset=offset
+    )
 
+    log_group_ids = [lg.id for lg in page.items]
+    counts = await get_entry_counts(log_group_ids, entry_types)
+    users = await get_users_by_log_groups(log_group_ids)
+    for lg in page.items:
+        lg.entry_counts = counts[lg.id]
+        lg.users = users[lg.id]
+    return page
 
-async def list_log_entries(
+
+def filter_log_entries(
     *,
-    log_group_reference_id: str,
+    log_group_reference_id: str | None = None,
     user: str | None = None,
-    offset: int = 0,
-    limit: int = 100,
-    order_by: str = "-timestamp",
-) -> list[LogEntry]:
-    """Return a list of log entries matching the provided filters."""
-    queryset = LogEntry.objects.select_related("log_group")
+    since: datetime | None = None,
+    until: datetime | None = None,
+    search: str | None = None,
+    properties: dict[str, Any] | None = None,
+) -> QuerySet[LogEntry]:
+    """
+    Return the log entries matching the provided filters.
+
+    ``since`` (inclusive) and ``until`` (exclusive) bound the timestamp; on
+    PostgreSQL they also limit the scan to the matching monthly partitions.
+
+    Args:
+        search: Words to find in the description, in web search syntax
+            (``"exact phrase"``, ``or``, ``-excluded``). Full-text search on
+            PostgreSQL, a case-insensitive substring match elsewhere
+        properties: JSON object the entry properties must contain, e.g.
+            ``{"etapa": "analisis"}``. Only top-level keys are compared
+            outside PostgreSQL
+    """
+    queryset = LogEntry.objects.all()
     if log_group_reference_id:
         queryset = queryset.filter(log_group__reference_id=log_group_reference_id)
     if user:
         queryset = queryset.filter(user=user)
-    sliced = queryset.order_by(order_by)[offset : offset + limit]
-    return [obj async for obj in sliced]
+    if since:
+        queryset = queryset.filter(timestamp__gte=since)
+    if until:
+        queryset = queryset.filter(timestamp__lt=until)
+    postgres = connection.vendor == "postgresql"
+    if search and postgres:
+        # Same expression as the GIN index, so the index is used
+        queryset = queryset.alias(
+            search_vector=SearchVector("description", config=SEARCH_CONFIG)
+        ).filter(
+            search_vector=SearchQuery(
+                search, config=SEARCH_CONFIG, search_type="websearch"
+            )
+        )
+    elif search:
+        queryset = queryset.filter(description__icontains=search)
+    if properties and postgres:
+        queryset = queryset.filter(properties__contains=properties)
+    elif properties:
+        queryset = queryset.filter(
+            **{f"properties__{key}": value for key, value in properties.items()}
+        )
+    return queryset
+
+
+async def list_log_entries(
+    *,
+    log_group_reference_id: str,
+    user: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    search: str | None = None,
+    properties: dict[str, Any] | None = None,
+    cursor: str | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    ordering: tuple[str, ...] = ("-timestamp", "-id"),
+) -> CursorPage:
+    """Return a page of log entries matching the filters of filter_log_entries."""
+    queryset = filter_log_entries(
+        log_group_reference_id=log_group_reference_id,
+        user=user,
+        since=since,
+        until=until,
+        search=search,
+        properties=properties,
+    ).select_related("log_group")
+    return await apaginate_queryset(
+        queryset, ordering=ordering, cursor=cursor, limit=limit, offset=offset
+    )
 
 
 async def get_users_by_log_groups(
@@ -192,24 +645,14 @@ async def get_users_by_log_groups(
         log_group_ids: List of log group IDs
 
     Returns:
-        Dictionary mapping log_group_id to list of unique users
-    """
-    # Get all log entries for the specified log groups
-    log_entries = [
-        entry
-        async for entry in LogEntry.objects.filter(log_group_id__in=log_group_ids)
-        .values("log_group_id", "user")
-        .distinct()
-    ]
-
-    # Group users by log_group_id
+        Dictionary mapping log_group_id to the sorted list of its users
+    """
     result: dict[int, list[str]] = {lg_id: [] for lg_id in log_group_ids}
-    for entry in log_entries:
-        if entry["user"]:
-            result[entry["log_group_id"]].append(entry["user"])
-
-    # Remove duplicates
-    for lg_id in result:
-        result[lg_id] = list(set(result[lg_id]))
-
+    members = (
+        LogGroupUser.objects.filter(log_group_id__in=log_group_ids)
+        .order_by("log_group_id", "user")
+        .values_list("log_group_id", "user")
+    )
+    async for log_group_id, user in members:
+        result[log_group_id].append(user)
     return result
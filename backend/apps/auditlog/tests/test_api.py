@@ -0,0 +1,151 @@
+"""Tests for the audit log HTTP endpoints."""
+
+from datetime import UTC, datetime
+
+import orjson
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.auditlog.models import LogEntry, LogGroup
+
+BATCH_URL = "/api/auditlog/log-entries/batch"
+EXPORT_URL = "/api/auditlog/log-entries/export?gzip=false"
+
+
+def entry(**fields) -> dict:
+    return {
+        "timestamp": "2026-01-01T12:00:00Z",
+        "log_group_reference_id": "group-1",
+        "type": "step",
+        **fields,
+    }
+
+
+class CreateLogEntriesBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="auditor@example.com", password="x"
+        )
+        LogGroup.objects.create(type="test", reference_id="group-1")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post_batch(self, body: bytes, content_type: str = "application/json"):
+        return self.client.post(BATCH_URL, body, content_type=content_type)
+
+    def test_reports_item_errors_by_position(self):
+        response = self.post_batch(
+            orjson.dumps(
+                [
+                    entry(),
+                    entry(timestamp="not a date"),
+                    "not an object",
+                    entry(log_group_reference_id="missing"),
+                    entry(),
+                ]
+            )
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["created"], 2)
+        self.assertEqual(body["ids"][1:4], [None, None, None])
+        self.assertEqual([error["index"] for error in body["errors"]], [1, 2, 3])
+        self.assertIn("missing", body["errors"][2]["error"])
+        self.assertEqual(LogEntry.objects.filter(user=self.user.email).count(), 2)
+
+    def test_reports_invalid_ndjson_lines(self):
+        response = self.post_batch(
+            orjson.dumps(entry()) + b"\n{broken\n" + orjson.dumps(entry()) + b"\n",
+            content_type="application/x-ndjson",
+        )
+
+        body = response.json()
+        self.assertEqual(body["created"], 2)
+        self.assertEqual(body["errors"], [{"index": 1, "error": "Invalid JSON"}])
+
+    def test_empty_batch(self):
+        response = self.post_batch(b"[]")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"created": 0, "ids": [], "errors": [], "duplicates": []}
+        )
+
+    def test_rejects_a_body_that_is_not_a_list(self):
+        response = self.post_batch(orjson.dumps(entry()))
+
+        self.assertEqual(response.status_code, 400)
+
+
+class LogGroupIdentityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="auditor@example.com", password="x"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_reference_id_identifies_one_group_whatever_its_type(self):
+        for group_type in ["a", "b"]:
+            response = self.client.post(
+                "/api/auditlog/log-groups",
+                {"type": group_type, "reference_id": "x", "properties": {}},
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["type"], "a")
+
+        self.assertEqual(LogGroup.objects.filter(reference_id="x").count(), 1)
+        response = self.client.post(
+            "/api/auditlog/log-entries",
+            entry(log_group_reference_id="x"),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/api/auditlog/log-group/x").status_code, 200)
+
+
+class ExportLogEntriesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="auditor@example.com", password="x"
+        )
+        log_group = LogGroup.objects.create(type="test", reference_id="group-1")
+        for n in range(3):
+            LogEntry.objects.create(
+                log_group=log_group,
+                timestamp=datetime(2026, 1, 1, 12, n, tzinfo=UTC),
+                type="step",
+                description=f"entry {n}",
+            )
+
+    def assertExportsEveryEntry(self, body: bytes):
+        descriptions = [
+            orjson.loads(line)["description"] for line in body.splitlines()
+        ]
+        self.assertEqual(descriptions, ["entry 0", "entry 1", "entry 2"])
+
+    def test_streams_a_sync_iterator_to_wsgi(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.is_async)
+        self.assertExportsEveryEntry(b"".join(response.streaming_content))
+
+    async def test_streams_an_async_iterator_to_asgi(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertExportsEveryEntry(body)
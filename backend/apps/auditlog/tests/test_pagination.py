@@ -0,0 +1,74 @@
+"""Tests for the keyset pagination used by the audit log listings."""
+
+from datetime import UTC, datetime
+from unittest import TestCase as SimpleTestCase
+
+from django.test import TestCase
+
+from apps.auditlog.models import LogGroup
+from services.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    paginate_queryset,
+)
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip_keeps_microseconds(self):
+        created = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=UTC)
+
+        values = decode_cursor(encode_cursor([created, 42]), 2)
+
+        self.assertEqual(values, [created.isoformat(), 42])
+
+    def test_malformed_cursors_are_rejected(self):
+        for cursor in ["not base64!", encode_cursor([1]), encode_cursor({"id": 1})]:
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursorError):
+                decode_cursor(cursor, 2)
+
+
+class PaginateQuerysetTests(TestCase):
+    ordering = ("-created", "-id")
+
+    @classmethod
+    def setUpTestData(cls):
+        # Groups created in the same instant only differ in their id
+        for n in range(7):
+            LogGroup.objects.create(type="test", reference_id=f"group-{n}")
+        LogGroup.objects.update(created=datetime(2026, 1, 1, tzinfo=UTC))
+        LogGroup.objects.filter(reference_id="group-0").update(
+            created=datetime(2026, 1, 2, tzinfo=UTC)
+        )
+
+    def test_cursor_walks_every_row_once_across_ties(self):
+        expected = list(
+            LogGroup.objects.order_by(*self.ordering).values_list("id", flat=True)
+        )
+
+        seen, cursor = [], None
+        while True:
+            page = paginate_queryset(
+                LogGroup.objects.all(), ordering=self.ordering, cursor=cursor, limit=3
+            )
+            seen += [group.id for group in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, expected)
+
+    def test_last_full_page_has_no_next_cursor(self):
+        page = paginate_queryset(
+            LogGroup.objects.all(), ordering=self.ordering, limit=7
+        )
+
+        self.assertEqual(len(page.items), 7)
+        self.assertIsNone(page.next_cursor)
+
+    def test_legacy_offset(self):
+        page = paginate_queryset(
+            LogGroup.objects.all(), ordering=self.ordering, limit=2, offset=6
+        )
+
+        self.assertEqual([group.reference_id for group in page.items], ["group-1"])
@@ -0,0 +1,109 @@
+"""Tests for the audit log services."""
+
+from datetime import UTC, datetime
+
+from django.test import TestCase
+
+from apps.auditlog.models import LogEntry, LogGroup, LogGroupStats, LogGroupUser
+from apps.auditlog.services import LogEntryRequest, create_log_entries
+
+
+def entry_request(timestamp: datetime, **fields) -> LogEntryRequest:
+    return LogEntryRequest(
+        timestamp=timestamp, log_group_reference_id="group-1", type="step", **fields
+    )
+
+
+class CreateLogEntriesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = LogGroup.objects.create(type="test", reference_id="group-1")
+
+    def test_naive_timestamps_are_read_as_utc(self):
+        request = entry_request(datetime(2026, 1, 1, 12))
+
+        self.assertEqual(request.timestamp, datetime(2026, 1, 1, 12, tzinfo=UTC))
+
+    async def test_stats_accept_naive_and_aware_timestamps(self):
+        await create_log_entries(
+            [
+                entry_request(datetime(2026, 1, 1, 12)),
+                entry_request(datetime(2026, 1, 1, 13, tzinfo=UTC)),
+            ]
+        )
+
+        stats = await LogGroupStats.objects.aget(log_group=self.group, type="step")
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.last_timestamp, datetime(2026, 1, 1, 13, tzinfo=UTC))
+
+    async def test_empty_batch(self):
+        result = await create_log_entries([])
+
+        self.assertEqual(result, ({}, {}, set()))
+
+    async def test_batch_without_known_groups(self):
+        request = entry_request(datetime(2026, 1, 1, tzinfo=UTC))
+        request.log_group_reference_id = "missing"
+
+        result = await create_log_entries([request])
+
+        self.assertEqual(result.entries, {})
+        self.assertEqual(result.duplicates, set())
+        self.assertEqual(list(result.errors), [0])
+
+
+class IdempotentInsertTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = LogGroup.objects.create(type="test", reference_id="group-1")
+
+    async def test_retried_batch_returns_the_stored_entries(self):
+        timestamp = datetime(2026, 1, 1, 12, tzinfo=UTC)
+        requests = [
+            entry_request(timestamp, idempotency_key="a"),
+            entry_request(timestamp, idempotency_key="b"),
+        ]
+
+        first = await create_log_entries(requests)
+        retry = await create_log_entries(requests)
+
+        self.assertEqual(first.duplicates, set())
+        self.assertEqual(retry.duplicates, {0, 1})
+        self.assertEqual(
+            [entry.id for entry in retry.entries.values()],
+            [entry.id for entry in first.entries.values()],
+        )
+        self.assertEqual(await LogEntry.objects.acount(), 2)
+        stats = await LogGroupStats.objects.aget(log_group=self.group, type="step")
+        self.assertEqual(stats.count, 2)
+
+    async def test_repeated_key_within_a_batch_is_stored_once(self):
+        timestamp = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+        result = await create_log_entries(
+            [
+                entry_request(timestamp, idempotency_key="a"),
+                entry_request(timestamp, idempotency_key="a"),
+            ]
+        )
+
+        self.assertEqual(result.entries[0].id, result.entries[1].id)
+        self.assertEqual(await LogEntry.objects.acount(), 1)
+
+    async def test_naive_keyed_timestamp_is_not_a_duplicate(self):
+        request = entry_request(
+            datetime(2026, 1, 1, 12), idempotency_key="a", user="ana"
+        )
+
+        first = await create_log_entries([request])
+        retry = await create_log_entries([request])
+
+        self.assertEqual(first.duplicates, set())
+        self.assertEqual(retry.duplicates, {0})
+        stats = await LogGroupStats.objects.aget(log_group=self.group, type="step")
+        self.assertEqual(stats.count, 1)
+        self.assertTrue(
+            await LogGroupUser.objects.filter(
+                log_group=self.group, user="ana"
+            ).aexists()
+        )
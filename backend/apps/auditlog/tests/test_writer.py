@@ -0,0 +1,186 @@
+"""Tests for the buffered audit log writer."""
+
+import fcntl
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest import mock
+
+import orjson
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError
+from django.test import TransactionTestCase
+
+from apps.auditlog.models import LogEntry, LogGroup
+from apps.auditlog.services import LogEntryRequest, create_log_entries
+from apps.auditlog.writer import AuditLogWriter
+
+
+def entry_request(**fields) -> LogEntryRequest:
+    fields = {
+        "timestamp": datetime(2026, 1, 1, 12, tzinfo=UTC),
+        "log_group_reference_id": "group-1",
+        "type": "step",
+        **fields,
+    }
+    return LogEntryRequest(**fields)
+
+
+def spill_line(**fields) -> bytes:
+    data = {"entry": entry_request(**fields).model_dump(mode="json"), "group": None}
+    return orjson.dumps(data) + b"\n"
+
+
+# The writer uses its own thread and connection, so it must see committed rows
+class AuditLogWriterTests(TransactionTestCase):
+    def setUp(self):
+        LogGroup.objects.create(type="test", reference_id="group-1")
+        self.spill_dir = Path(tempfile.mkdtemp())
+        self.spill_path = self.spill_dir / "spill.ndjson"
+        self.writers = []
+        # Sizes of the batches written, so tests wait without reading the
+        # table while the writer thread inserts into it
+        self.batches = []
+
+        async def record_batch(requests):
+            result = await create_log_entries(requests)
+            self.batches.append(len(requests))
+            return result
+
+        patcher = mock.patch(
+            "apps.auditlog.writer.create_log_entries", side_effect=record_batch
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for writer in self.writers:
+            writer.shutdown()
+
+    def make_writer(self, **options) -> AuditLogWriter:
+        options = {"batch_size": 100, "flush_interval": 60, **options}
+        writer = AuditLogWriter(spill_path=self.spill_path, **options)
+        self.writers.append(writer)
+        return writer
+
+    def wait_for_batches(self, count: int, timeout: float = 5) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self.batches) < count:
+            if time.monotonic() > deadline:
+                self.fail(f"{count} batches were not written in {timeout}s")
+            time.sleep(0.01)
+
+    def test_writes_a_full_batch_without_waiting_for_the_interval(self):
+        writer = self.make_writer(batch_size=2)
+
+        for _ in range(3):
+            writer.log(entry_request())
+
+        self.wait_for_batches(1)
+        self.assertEqual(self.batches, [2])
+
+    def test_writes_a_partial_batch_after_the_interval(self):
+        writer = self.make_writer(flush_interval=0.05)
+
+        writer.log(entry_request())
+
+        self.wait_for_batches(1)
+        self.assertEqual(LogEntry.objects.count(), 1)
+
+    def test_flush_and_close_drain_the_queue(self):
+        writer = self.make_writer()
+        writer.log(entry_request())
+
+        async_to_sync(writer.flush)()
+        self.assertEqual(LogEntry.objects.count(), 1)
+
+        writer.log(entry_request())
+        async_to_sync(writer.close)()
+        self.assertEqual(LogEntry.objects.count(), 2)
+        self.assertIsNone(writer._loop)
+
+    def test_logs_from_short_lived_event_loops(self):
+        writer = self.make_writer()
+
+        async def view():
+            writer.log(entry_request())
+
+        for _ in range(3):
+            async_to_sync(view)()
+        writer.shutdown()
+
+        self.assertEqual(LogEntry.objects.count(), 3)
+
+    def test_asubmit_futures_resolve_with_the_write_results(self):
+        writer = self.make_writer(flush_interval=0.05)
+
+        async def submit(requests):
+            return [await future for future in await writer.asubmit(requests)]
+
+        first = async_to_sync(submit)(
+            [
+                entry_request(idempotency_key="a"),
+                entry_request(log_group_reference_id="missing"),
+            ]
+        )
+        retry = async_to_sync(submit)([entry_request(idempotency_key="a")])
+
+        self.assertIsNotNone(first[0].id)
+        self.assertFalse(first[0].duplicate)
+        self.assertIsNone(first[1].id)
+        self.assertIn("missing", first[1].error)
+        self.assertEqual(retry[0].id, first[0].id)
+        self.assertTrue(retry[0].duplicate)
+
+    def test_spills_the_batch_when_the_database_fails(self):
+        writer = self.make_writer(flush_interval=0.05)
+
+        async def submit():
+            futures = await writer.asubmit([entry_request(), entry_request()])
+            return [await future for future in futures]
+
+        with mock.patch(
+            "apps.auditlog.writer.create_log_entries",
+            side_effect=DatabaseError("down"),
+        ):
+            results = async_to_sync(submit)()
+
+        self.assertTrue(all(result.spilled for result in results))
+        self.assertEqual(len(self.spill_path.read_bytes().splitlines()), 2)
+        self.assertEqual(LogEntry.objects.count(), 0)
+
+    def test_start_replays_the_spill_file(self):
+        self.spill_path.write_bytes(spill_line() * 3)
+        writer = self.make_writer()
+
+        async_to_sync(writer.start)()
+        async_to_sync(writer.flush)()
+
+        self.assertEqual(LogEntry.objects.count(), 3)
+        self.assertEqual(list(self.spill_dir.iterdir()), [])
+
+    def test_start_replays_files_orphaned_by_dead_workers(self):
+        # Claimed by a worker that died mid-replay, last line cut short
+        orphan = self.spill_dir / "spill.ndjson.99999"
+        orphan.write_bytes(spill_line() * 2 + b'{"entry": {')
+        writer = self.make_writer()
+
+        replayed = async_to_sync(writer.replay_spill)()
+        async_to_sync(writer.flush)()
+
+        self.assertEqual(replayed, 2)
+        self.assertEqual(LogEntry.objects.count(), 2)
+        self.assertFalse(orphan.exists())
+
+    def test_replay_skips_files_another_worker_is_replaying(self):
+        claimed = self.spill_dir / "spill.ndjson.99999"
+        claimed.write_bytes(spill_line())
+        writer = self.make_writer()
+
+        with claimed.open("rb") as claimed_file:
+            fcntl.flock(claimed_file, fcntl.LOCK_EX)
+            replayed = async_to_sync(writer.replay_spill)()
+
+        self.assertEqual(replayed, 0)
+        self.assertTrue(claimed.exists())
@@ -0,0 +1,197 @@
+"""
+Audit Logs WebSocket entrypoint
+
+Long-lived clients stream log entries over one authenticated connection at
+``/ws/auditlog/`` instead of paying an HTTP request (and its authentication)
+per event. Entries go through the buffered writer, so entries from every
+connection are written together in batches.
+
+Protocol (JSON text frames):
+
+- On connect the server authenticates the session cookie, then sends
+  ``{"type": "ready", "window": N}``
+- The client sends ``{"id": <any>, "entries": [<log entry>, ...]}`` (or a
+  single ``"entry"``), with the same fields as ``POST /log-entries``
+- Once the entries are written the server replies
+  ``{"type": "ack", "id": <id>, "ids": [...], "errors": [...], "spilled": n,
+  "duplicates": [...]}`` with ids in message order, null for rejected or
+  spilled entries, and the positions of entries whose ``idempotency_key``
+  was already stored (so resending an unacked message is safe)
+- At most ``window`` messages may be awaiting their ack; the server stops
+  reading the socket until acks go out, so fast clients are slowed down
+  instead of growing the server's buffers
+"""
+
+from __future__ import annotations
+
+import asyncio
+from http.cookies import SimpleCookie
+from typing import Any
+from urllib.parse import urlsplit
+
+import orjson
+from django.conf import settings
+
+from services.auth import aget_session_user
+
+from .services import MAX_BATCH_SIZE, validate_log_entry_items
+from .writer import audit_log_writer
+
+WEBSOCKET_PATH = "/ws/auditlog/"
+# Messages a client may send before receiving their acks
+MAX_UNACKED_MESSAGES = 32
+# Close codes (4000-4999 are reserved for applications)
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN_ORIGIN = 4403
+
+
+def _headers(scope: dict) -> dict[str, str]:
+    return {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in scope.get("headers", [])
+    }
+
+
+def _origin_allowed(headers: dict[str, str]) -> bool:
+    """
+    Reject cross-site browser connections.
+
+    The session cookie is sent on cross-site WebSocket handshakes too, so a
+    browser Origin must be the API host or a configured frontend. Clients
+    that send no Origin (scripts, services) are not browsers and are allowed.
+    """
+    origin = headers.get("origin")
+    if origin is None:
+        return True
+    if origin in settings.CORS_ALLOWED_ORIGINS:
+        return True
+    return urlsplit(origin).netloc == headers.get("host")
+
+
+class AuditLogConnection:
+    """One WebSocket client streaming log entries."""
+
+    def __init__(self, scope: dict, receive, send):
+        self.scope = scope
+        self.receive = receive
+        self._send = send
+        self._send_lock = asyncio.Lock()
+        self._window = asyncio.Semaphore(MAX_UNACKED_MESSAGES)
+        self._acks: set[asyncio.Task] = set()
+        self.user_email = ""
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        async with self._send_lock:
+            await self._send(
+                {"type": "websocket.send", "text": orjson.dumps(data).decode()}
+            )
+
+    async def run(self) -> None:
+        message = await self.receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        headers = _headers(self.scope)
+        if not _origin_allowed(headers):
+            await self._send(
+                {"type": "websocket.close", "code": CLOSE_FORBIDDEN_ORIGIN}
+            )
+            return
+        cookie = SimpleCookie(headers.get("cookie", ""))
+        morsel = cookie.get(settings.SESSION_COOKIE_NAME)
+        user = await aget_session_user(morsel.value if morsel else None)
+        if user is None:
+            await self._send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+            return
+        self.user_email = user.email
+
+        await self._send({"type": "websocket.accept"})
+        await self.send_json({"type": "ready", "window": MAX_UNACKED_MESSAGES})
+        try:
+            while True:
+                # Waits here while the client has a full window of unacked messages
+                await self._window.acquire()
+                message = await self.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                await self.handle(message.get("text") or message.get("bytes") or b"")
+        finally:
+            # Entries already queued are still written; only the acks are dropped
+            for task in self._acks:
+                task.cancel()
+
+    async def handle(self, raw: str | bytes) -> None:
+        """Validate one client message and queue its entries."""
+        try:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            await self._reject(None, "Invalid JSON")
+            return
+        if not isinstance(payload, dict):
+            await self._reject(None, "Expected a JSON object")
+            return
+
+        message_id = payload.get("id")
+        items = payload["entries"] if "entries" in payload else [payload.get("entry")]
+        if not isinstance(items, list):
+            await self._reject(message_id, "entries must be a list")
+            return
+        if len(items) > MAX_BATCH_SIZE:
+            await self._reject(message_id, f"Batch exceeds {MAX_BATCH_SIZE} entries")
+            return
+
+        requests, errors = validate_log_entry_items(items, self.user_email)
+        # Waits for room in the writer queue, which also stops reading the socket
+        futures = await audit_log_writer.asubmit(list(requests.values()))
+        task = asyncio.create_task(
+            self._ack(message_id, len(items), list(requests), futures, errors)
+        )
+        self._acks.add(task)
+        task.add_done_callback(self._acks.discard)
+
+    async def _ack(
+        self,
+        message_id: Any,
+        size: int,
+        positions: list[int],
+        futures: list[asyncio.Future],
+        errors: dict[int, str],
+    ) -> None:
+        try:
+            results = await asyncio.gather(*futures)
+            ids: list[int | None] = [None] * size
+            duplicates = []
+            spilled = 0
+            for position, result in zip(positions, results):
+                ids[position] = result.id
+                spilled += result.spilled
+                if result.duplicate:
+                    duplicates.append(position)
+                if result.error:
+                    errors[position] = result.error
+            await self.send_json(
+                {
+                    "type": "ack",
+                    "id": message_id,
+                    "ids": ids,
+                    "errors": [
+                        {"index": index, "error": error}
+                        for index, error in sorted(errors.items())
+                    ],
+                    "spilled": spilled,
+                    "duplicates": duplicates,
+                }
+            )
+        finally:
+            self._window.release()
+
+    async def _reject(self, message_id: Any, error: str) -> None:
+        try:
+            await self.send_json({"type": "error", "id": message_id, "error": error})
+        finally:
+            self._window.release()
+
+
+async def auditlog_websocket(scope: dict, receive, send) -> None:
+    """ASGI application for the audit log WebSocket endpoint."""
+    await AuditLogConnection(scope, receive, send).run()
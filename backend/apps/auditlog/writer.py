@@ -0,0 +1,451 @@
+"""
+Buffered audit log writer
+
+Callers hand entries to ``audit_log_writer.log()`` and return immediately; a
+background task drains the queue in batches (by size or by time) into
+``create_log_entries``, so audit writes never add database latency to the
+request that produced them.
+
+The queue and its consumer live on an event loop in a dedicated thread, not
+on the caller's loop: under WSGI every async view runs on a short-lived
+``async_to_sync`` loop, and entries queued there would be lost with it.
+
+- ``log()`` never waits: when the queue is full the entry is spilled to disk
+- ``alog()`` waits for room in the queue instead (backpressure)
+- ``asubmit()`` does the same and returns one future per entry, resolved
+  once its batch is written, for transports that acknowledge writes
+- Entries that cannot be written because the database is unavailable are
+  appended to an NDJSON spill file and replayed on the next startup
+- ``close()`` flushes everything still queued; the ASGI lifespan handler
+  calls it on shutdown, and sync servers call ``shutdown()`` when a worker
+  exits (see gunicorn.conf.py)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import fcntl
+import glob
+import logging
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+
+from .models import LogGroup
+from .services import LogEntryRequest, LogGroupRequest, create_log_entries
+
+logger = logging.getLogger(__name__)
+
+# Seconds shutdown() waits for the queue to be written
+SHUTDOWN_TIMEOUT = 30
+
+
+class PendingGroup(NamedTuple):
+    """Log group created, if missing, before the entries that reference it."""
+
+    type: str
+    reference_id: str
+    properties: dict[str, Any]
+
+    @classmethod
+    def from_request(cls, request: LogGroupRequest) -> PendingGroup:
+        return cls(request.log_group_type, request.reference_id(), request.properties())
+
+
+class WriteResult(NamedTuple):
+    """Outcome of a submitted entry: its id, an error, or spilled to disk."""
+
+    id: int | None = None
+    error: str | None = None
+    spilled: bool = False
+    # The entry's idempotency key was already stored; id is the stored entry
+    duplicate: bool = False
+
+
+class QueuedEntry(NamedTuple):
+    """A log entry waiting in the writer queue."""
+
+    entry: LogEntryRequest
+    group: PendingGroup | None = None
+    # Resolved with a WriteResult once the entry's batch is handled
+    done: concurrent.futures.Future | None = None
+
+
+class _Flush(NamedTuple):
+    """Queue marker: write what came before it and resolve ``done``."""
+
+    done: concurrent.futures.Future
+    stop: bool = False
+
+
+class AuditLogWriter:
+    """In-process buffer that writes audit log entries in batches."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        spill_path: str | Path | None = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+
+    ###########################
+    # Producers
+    ###########################
+    def log(self, entry: LogEntryRequest, group: LogGroupRequest | None = None) -> None:
+        """
+        Queue a log entry without waiting for the database.
+
+        Safe to call from any thread or event loop, and from sync code.
+
+        Args:
+            entry: Log entry to write
+            group: Log group to create first if it does not exist yet
+        """
+        item = QueuedEntry(entry, PendingGroup.from_request(group) if group else None)
+        loop, queue = self._ensure_started()
+        try:
+            loop.call_soon_threadsafe(self._put_nowait, queue, item)
+        except RuntimeError:
+            # The writer loop closed in between (interpreter shutdown)
+            self._spill([item])
+
+    async def alog(
+        self, entry: LogEntryRequest, group: LogGroupRequest | None = None
+    ) -> None:
+        """Queue a log entry, waiting for room when the queue is full."""
+        item = QueuedEntry(entry, PendingGroup.from_request(group) if group else None)
+        await self._put([item])
+
+    async def asubmit(
+        self, entries: list[LogEntryRequest]
+    ) -> list[asyncio.Future[WriteResult]]:
+        """
+        Queue ``entries``, waiting for room, and return one future per entry.
+
+        Each future resolves with a WriteResult when the batch holding the
+        entry has been written or spilled, so callers can acknowledge writes
+        without blocking on them.
+        """
+        items = [
+            QueuedEntry(entry, done=concurrent.futures.Future()) for entry in entries
+        ]
+        await self._put(items)
+        return [asyncio.wrap_future(item.done) for item in items]
+
+    async def _put(self, items: list[QueuedEntry]) -> None:
+        """Put ``items`` in the queue from any loop, waiting for room."""
+
+        async def put_all(queue: asyncio.Queue) -> None:
+            for item in items:
+                await queue.put(item)
+
+        await self._run_in_writer(put_all)
+
+    def _put_nowait(self, queue: asyncio.Queue, item: QueuedEntry) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning("Audit log queue is full, spilling entry to disk")
+            self._spill([item])
+
+    ###########################
+    # Lifecycle
+    ###########################
+    def _ensure_started(self) -> tuple[asyncio.AbstractEventLoop, asyncio.Queue]:
+        """Start the writer thread if it is not running; return its loop and queue."""
+        with self._lock:
+            if self._loop is None:
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._thread_main,
+                    args=(ready,),
+                    name="audit-log-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop, self._queue
+
+    def _thread_main(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._loop, self._queue = loop, queue
+        task = loop.create_task(self._run(queue))
+        ready.set()
+        try:
+            loop.run_until_complete(task)
+        finally:
+            with self._lock:
+                self._loop = self._queue = None
+            # Run the puts scheduled before the loop was unpublished and keep
+            # whatever they queued after the stop marker
+            loop.run_until_complete(asyncio.sleep(0))
+            leftover = []
+            while not queue.empty():
+                item = queue.get_nowait()
+                if isinstance(item, _Flush):
+                    item.done.set_result(None)
+                else:
+                    leftover.append(item)
+            if leftover:
+                _resolve(
+                    leftover,
+                    WriteResult(spilled=True)
+                    if self._spill(leftover)
+                    else WriteResult(error="Lost"),
+                )
+            loop.close()
+
+    async def _run_in_writer(
+        self, func: Callable[[asyncio.Queue], Coroutine[Any, Any, Any]]
+    ) -> Any:
+        """Run ``func(queue)`` on the writer loop and await it from the caller."""
+        loop, queue = self._ensure_started()
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(func(queue), loop)
+        )
+
+    async def start(self) -> None:
+        """Start the writer thread and replay entries spilled by a previous run."""
+        self._ensure_started()
+        await self.replay_spill()
+
+    async def flush(self) -> None:
+        """Wait until every entry queued so far has been written."""
+        await asyncio.wrap_future(await self._send_marker(stop=False))
+
+    async def close(self) -> None:
+        """Flush the queue and stop the writer thread."""
+        thread = self._thread
+        if self._loop is None:
+            return
+        await asyncio.wrap_future(await self._send_marker(stop=True))
+        await asyncio.to_thread(thread.join)
+
+    async def _send_marker(self, *, stop: bool) -> concurrent.futures.Future:
+        """Queue a _Flush marker and return the future it resolves."""
+        done = concurrent.futures.Future()
+        await self._run_in_writer(lambda queue: queue.put(_Flush(done, stop=stop)))
+        return done
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """
+        Flush the queue and stop the writer thread from sync code.
+
+        For servers without an ASGI lifespan; call it before the interpreter
+        starts shutting down, since writing needs sync_to_async's executors.
+        """
+        with self._lock:
+            thread, loop, queue = self._thread, self._loop, self._queue
+        if loop is None:
+            return
+        done = concurrent.futures.Future()
+        try:
+            asyncio.run_coroutine_threadsafe(queue.put(_Flush(done, stop=True)), loop)
+            done.result(timeout=timeout)
+        except (RuntimeError, concurrent.futures.TimeoutError):
+            logger.exception("Could not flush the audit log queue on shutdown")
+            return
+        thread.join(timeout=timeout)
+
+    ###########################
+    # Consumer
+    ###########################
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            batch: list[QueuedEntry] = []
+            deadline = loop.time() + self.flush_interval
+            while not isinstance(item, _Flush):
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    item = None
+                    break
+                try:
+                    item = queue.get_nowait()
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    item = None
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except TimeoutError:
+                    item = None
+                    break
+
+            if batch:
+                try:
+                    await self._write(batch)
+                except Exception:
+                    # Keep the consumer alive; the batch is lost but not the queue
+                    logger.exception("Unexpected error writing audit log entries")
+                    _resolve(batch, WriteResult(error="Internal error"))
+            if isinstance(item, _Flush):
+                item.done.set_result(None)
+                if item.stop:
+                    return
+
+    async def _write(self, batch: list[QueuedEntry]) -> None:
+        """Write one batch, spilling it to disk if the database fails."""
+        groups = {
+            (item.group.type, item.group.reference_id): item.group
+            for item in batch
+            if item.group is not None
+        }
+        try:
+            # The flush task outlives requests, so nothing else recycles its connection
+            await sync_to_async(close_old_connections)()
+            if groups:
+                await LogGroup.objects.abulk_create(
+                    [LogGroup(**group._asdict()) for group in groups.values()],
+                    ignore_conflicts=True,
+                )
+            result = await create_log_entries([item.entry for item in batch])
+        except DatabaseError:
+            logger.exception("Could not write %d audit log entries", len(batch))
+            spilled = self._spill(batch)
+            _resolve(
+                batch,
+                WriteResult(spilled=True) if spilled else WriteResult(error="Lost"),
+            )
+            return
+
+        for index, item in enumerate(batch):
+            error = result.errors.get(index)
+            if error is not None:
+                logger.warning("Dropped audit log entry: %s", error)
+                _resolve([item], WriteResult(error=error))
+            else:
+                _resolve(
+                    [item],
+                    WriteResult(
+                        id=result.entries[index].id,
+                        duplicate=index in result.duplicates,
+                    ),
+                )
+
+    ###########################
+    # Spill file
+    ###########################
+    def _spill(self, batch: list[QueuedEntry]) -> bool:
+        """Append ``batch`` to the spill file; return False if spilling is off."""
+        if self.spill_path is None:
+            logger.error("Audit log spill is disabled, lost %d entries", len(batch))
+            return False
+        lines = b"".join(
+            orjson.dumps(
+                {
+                    "entry": item.entry.model_dump(mode="json"),
+                    "group": item.group._asdict() if item.group else None,
+                }
+            )
+            + b"\n"
+            for item in batch
+        )
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        # One append per batch keeps lines from concurrent workers intact
+        with self.spill_path.open("ab") as spill_file:
+            spill_file.write(lines)
+        return True
+
+    async def replay_spill(self) -> int:
+        """
+        Queue the entries of the spill file again and remove it.
+
+        Also replays the files left by workers that died while replaying.
+
+        Returns:
+            Number of entries replayed
+        """
+        if self.spill_path is None:
+            return 0
+        replay_path = self.spill_path.with_name(f"{self.spill_path.name}.{os.getpid()}")
+        try:
+            # New spills go to a fresh file while this one is replayed
+            self.spill_path.replace(replay_path)
+        except FileNotFoundError:
+            pass
+
+        count = 0
+        pattern = f"{glob.escape(self.spill_path.name)}.*"
+        for path in sorted(self.spill_path.parent.glob(pattern)):
+            count += await self._replay_file(path)
+        if count:
+            logger.info("Replayed %d spilled audit log entries", count)
+        return count
+
+    async def _replay_file(self, path: Path) -> int:
+        """Replay and remove ``path`` unless another worker is replaying it."""
+        try:
+            spill_file = path.open("rb")
+        except FileNotFoundError:
+            return 0
+        with spill_file:
+            try:
+                # Released by the OS if this worker dies, so the file is
+                # picked up again on the next start
+                fcntl.flock(spill_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            if os.fstat(spill_file.fileno()).st_nlink == 0:
+                # Replayed and removed by another worker meanwhile
+                return 0
+
+            count = 0
+            items = []
+            for line in spill_file:
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A line cut short by a crash while spilling
+                    logger.warning("Skipped a malformed line of %s", path)
+                    continue
+                group = PendingGroup(**data["group"]) if data["group"] else None
+                items.append(
+                    QueuedEntry(LogEntryRequest.model_validate(data["entry"]), group)
+                )
+                if len(items) >= self.batch_size:
+                    await self._put(items)
+                    count += len(items)
+                    items = []
+            await self._put(items)
+            count += len(items)
+            path.unlink()
+        return count
+
+
+def _resolve(batch: list[QueuedEntry], result: WriteResult) -> None:
+    for item in batch:
+        if item.done is not None and not item.done.done():
+            item.done.set_result(result)
+
+
+audit_log_writer = AuditLogWriter(
+    batch_size=settings.AUDITLOG_WRITER_BATCH_SIZE,
+    flush_interval=settings.AUDITLOG_WRITER_FLUSH_INTERVAL,
+    max_queue_size=settings.AUDITLOG_WRITER_QUEUE_SIZE,
+    spill_path=settings.AUDITLOG_WRITER_SPILL_PATH or None,
+)
@@ -1,13 +1,24 @@
 """Admin para conflict_detector."""
 
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import Count
 
 from .models import (
+    ContadorDescubrimientos,
     Documento,
+    DocumentoPagina,
     DescubrimientoConflicto,
     EmbeddingCache,
     ImpactoDescubierto,
 )
+from .services import eliminar_documento, recalcular_contador
+
+
+def recalcular_contadores(user_ids) -> None:
+    """Recalcula los contadores de los usuarios afectados por un cambio del admin."""
+    for user_id in sorted(set(user_ids)):
+        recalcular_contador(user_id)
 
 
 class DescubrimientoConflictoInline(admin.TabularInline):
@@ -45,13 +56,39 @@ class DocumentoAdmin(admin.ModelAdmin):
     list_display = ["id", "nombre", "user", "fecha_carga", "cantidad_descubrimientos"]
     list_filter = ["fecha_carga", "user"]
     search_fields = ["nombre", "user__email"]
-    readonly_fields = ["fecha_carga", "created_at", "updated_at"]
+    readonly_fields = ["content_hash", "fecha_carga", "created_at", "updated_at"]
     inlines = [DescubrimientoConflictoInline]
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(_cantidad_descubrimientos=Count("descubrimientos"))
+        )
+
     def cantidad_descubrimientos(self, obj):
-        return obj.descubrimientos.count()
+        return obj._cantidad_descubrimientos
+
+    def delete_model(self, request, obj):
+        eliminar_documento(obj)
+
+    @transaction.atomic
+    def delete_queryset(self, request, queryset):
+        for documento in queryset:
+            eliminar_documento(documento)
+
+    def save_related(self, request, form, formsets, change):
+        # El inline permite cambiar el estado o el usuario de los descubrimientos
+        descubrimientos = form.instance.descubrimientos
+        user_ids = list(descubrimientos.values_list("user_id", flat=True))
+        super().save_related(request, form, formsets, change)
+        if any(formset.has_changed() for formset in formsets):
+            user_ids += descubrimientos.values_list("user_id", flat=True)
+            recalcular_contadores(user_ids)
 
     cantidad_descubrimientos.short_description = "Descubrimientos"
+    cantidad_descubrimientos.admin_order_field = "_cantidad_descubrimientos"
 
 
 @admin.register(DescubrimientoConflicto)
@@ -67,7 +104,7 @@ class DescubrimientoConflictoAdmin(admin.ModelAdmin):
         "cantidad_impactos",
     ]
     list_filter = ["fecha_analisis", "documento"]
-    search_fields = ["proyecto_id", "proyecto_titulo", "documento__nombre"]
+    search_fields = ["proyecto__proyecto_id", "proyecto_titulo", "documento__nombre"]
     readonly_fields = ["fecha_analisis", "created_at", "updated_at"]
     inlines = [ImpactoDescubiertoInline]
 
@@ -80,10 +117,27 @@ class DescubrimientoConflictoAdmin(admin.ModelAdmin):
 
     proyecto_titulo_corto.short_description = "Proyecto"
 
-    def cantidad_impactos(self, obj):
-        return obj.impactos.count()
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("documento")
+
+    def save_model(self, request, obj, form, change):
+        user_ids = [obj.user_id]
+        if change:
+            user_ids += DescubrimientoConflicto.objects.filter(pk=obj.pk).values_list(
+                "user_id", flat=True
+            )
+        super().save_model(request, obj, form, change)
+        recalcular_contadores(user_ids)
 
-    cantidad_impactos.short_description = "Impactos"
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        recalcular_contadores([obj.user_id])
+
+    @transaction.atomic
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list("user_id", flat=True))
+        super().delete_queryset(request, queryset)
+        recalcular_contadores(user_ids)
 
 
 @admin.register(ImpactoDescubierto)
@@ -110,6 +164,36 @@ class ImpactoDescubiertoAdmin(admin.ModelAdmin):
     descripcion_corta.short_description = "Descripcion"
 
 
+@admin.register(DocumentoPagina)
+class DocumentoPaginaAdmin(admin.ModelAdmin):
+    """Admin para DocumentoPagina."""
+
+    list_display = [
+        "id",
+        "content_hash_corto",
+        "numero",
+        "version_normalizacion",
+        "bytes_originales",
+        "created_at",
+    ]
+    list_filter = ["version_normalizacion", "created_at"]
+    search_fields = ["content_hash"]
+    readonly_fields = [
+        "content_hash",
+        "numero",
+        "version_normalizacion",
+        "texto",
+        "bytes_originales",
+        "created_at",
+    ]
+    exclude = ["texto_comprimido"]
+
+    def content_hash_corto(self, obj):
+        return f"{obj.content_hash[:16]}..."
+
+    content_hash_corto.short_description = "Hash"
+
+
 @admin.register(EmbeddingCache)
 class EmbeddingCacheAdmin(admin.ModelAdmin):
     """Admin para EmbeddingCache."""
@@ -129,3 +213,20 @@ class EmbeddingCacheAdmin(admin.ModelAdmin):
         return f"{obj.text_hash[:16]}..."
 
     text_hash_corto.short_description = "Hash"
+
+
+@admin.register(ContadorDescubrimientos)
+class ContadorDescubrimientosAdmin(admin.ModelAdmin):
+    """Admin para ContadorDescubrimientos."""
+
+    list_display = ["user", "pendientes", "en_seguimiento", "descartados", "updated_at"]
+    search_fields = ["user__email"]
+    readonly_fields = ["pendientes", "en_seguimiento", "descartados", "updated_at"]
+    actions = ["recalcular"]
+
+    def recalcular(self, request, queryset):
+        for contador in queryset:
+            recalcular_contador(contador.user_id)
+        self.message_user(request, f"{queryset.count()} contador(es) recalculado(s)")
+
+    recalcular.short_description = "Recalcular contadores desde los descubrimientos"
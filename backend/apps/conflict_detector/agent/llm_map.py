@@ -5,7 +5,7 @@ using language models (LLM). It allows parallel text processing during the MAP p
 
 Features:
 - Parallel processing with configurable concurrency
-- In-memory caching for repeated texts (avoids redundant LLM calls)
+- Shared caching for repeated texts in the Django cache (avoids redundant LLM calls)
 - Support for Pydantic structured output
 """
 
@@ -20,42 +20,45 @@ from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from django.conf import settings
+from django.core.cache import cache
+
+from services.cache import bump_version, get_version
 
 logger = logging.getLogger(__name__)
 
 # Type variable for Pydantic models
 T = TypeVar("T", bound=BaseModel)
 
-# In-memory cache for LLM responses: {(prompt_hash, text_hash): result}
-_llm_cache: dict[tuple[str, str], str | BaseModel] = {}
+# Cache namespace for LLM responses (shared by all workers)
+LLM_CACHE_NAMESPACE = "llm_map"
+# Seconds an LLM response is kept in the cache
+LLM_CACHE_TIMEOUT = 60 * 60 * 24 * 7
 
 
-def _get_cache_key(prompt_template: str, text: str) -> tuple[str, str]:
+def _get_cache_key(prompt_template: str, text: str, version: int) -> str:
     """Generate a cache key from prompt template and text.
 
     Args:
         prompt_template: The prompt template string
         text: The input text
+        version: Current version of the LLM cache namespace
 
     Returns:
-        Tuple of (prompt_hash, text_hash) for cache lookup
+        Cache key built from the prompt and text hashes
     """
     prompt_hash = hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()[:16]
     text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
-    return (prompt_hash, text_hash)
+    return f"{LLM_CACHE_NAMESPACE}:{version}:{prompt_hash}:{text_hash}"
 
 
-def clear_llm_cache() -> int:
+def clear_llm_cache() -> None:
     """Clear the LLM response cache.
 
-    Returns:
-        Number of entries cleared
+    Bumps the namespace version, so every previously cached response is
+    ignored and left to expire.
     """
-    global _llm_cache
-    count = len(_llm_cache)
-    _llm_cache = {}
-    logger.info(f"LLM cache cleared: {count} entries removed")
-    return count
+    bump_version(LLM_CACHE_NAMESPACE)
+    logger.info("LLM cache cleared")
 
 
 class MapResult(NamedTuple):
@@ -116,8 +119,6 @@ def _llm_map(
         List of processed results (strings or BaseModel instances).
 
     """
-    global _llm_cache
-
     if not texts:
         return []
 
@@ -130,10 +131,14 @@ def _llm_map(
     uncached_indices: list[int] = []
 
     if use_cache:
-        for idx, text in enumerate(texts):
-            cache_key = _get_cache_key(prompt_template_str, text)
-            if cache_key in _llm_cache:
-                cached_results[idx] = _llm_cache[cache_key]
+        version = get_version(LLM_CACHE_NAMESPACE)
+        cache_keys = [
+            _get_cache_key(prompt_template_str, text, version) for text in texts
+        ]
+        found = cache.get_many(cache_keys)
+        for idx, (text, cache_key) in enumerate(zip(texts, cache_keys)):
+            if cache_key in found:
+                cached_results[idx] = found[cache_key]
             else:
                 uncached_texts.append(text)
                 uncached_indices.append(idx)
@@ -165,9 +170,13 @@ def _llm_map(
 
         # Store new results in cache
         if use_cache:
-            for text, result in zip(uncached_texts, new_results):
-                cache_key = _get_cache_key(prompt_template_str, text)
-                _llm_cache[cache_key] = result
+            cache.set_many(
+                {
+                    cache_keys[idx]: result
+                    for idx, result in zip(uncached_indices, new_results)
+                },
+                LLM_CACHE_TIMEOUT,
+            )
 
     # Reconstruct full results in original order
     if not use_cache:
@@ -212,7 +221,7 @@ def llm_map(
         initializes a default OpenAI client via `ChatOpenAI`.
       - Support for Pydantic structured parsers in the MAP phase.
       - Sequential processing: output of step N becomes input of step N+1.
-      - In-memory caching for repeated texts (avoids redundant LLM calls).
+      - Shared caching for repeated texts in the Django cache (avoids redundant LLM calls).
 
     Args:
         texts: Raw texts to process.
@@ -1,18 +1,33 @@
 """API endpoints para conflict detector."""
 
-from django.db.models import Count
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Count, F
+from django.http import HttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from django.utils import timezone
 from ninja import File, Router, UploadedFile
 
 from .models import Documento, DescubrimientoConflicto
 from apps.proyectos_ley.models import ProyectoLey
+from apps.proyectos_ley.services import ainvalidar_cache_corpus
+from services.pagination import DEFAULT_PAGE_SIZE, apaginate_queryset
 from .schemas import (
+    ContadorDescubrimientosSchema,
     DescubrimientoDetailSchema,
     DescubrimientoListSchema,
     DocumentoDetailSchema,
     DocumentoListSchema,
+    TriageMasivoResultadoSchema,
+    TriageMasivoSchema,
+)
+from .services import (
+    aobtener_contador,
+    cambiar_estado_descubrimiento,
+    detect_conflicts,
+    eliminar_documento,
+    triage_masivo,
 )
-from .services import detect_conflicts
 
 
 router = Router()
@@ -33,21 +48,40 @@ async def detect_conflicts_endpoint(request, file: UploadedFile = File(...)):
     pdf_content = file.read()
 
     # Procesar el PDF y detectar conflictos (guarda automáticamente en DB)
-    result = await detect_conflicts(pdf_content, nombre_documento=file.name, user=request.user)
+    result = await detect_conflicts(pdf_content, nombre_documento=file.name, user=request.auth)
     return result
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
 @router.get("/documents", response=list[DocumentoListSchema])
-def list_documents(request):
+async def list_documents(
+    request,
+    response: HttpResponse,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
     """
-    Lista todos los documentos cargados por el usuario actual.
+    Lista los documentos cargados por el usuario actual.
+
+    Paginado por cursor: el cursor de la página siguiente se retorna en el
+    header X-Next-Cursor.
 
     Returns:
         Lista de documentos con su información básica y cantidad de descubrimientos
     """
-    documentos = Documento.objects.filter(user=request.user).annotate(
-        cantidad_descubrimientos=Count("descubrimientos")
-    ).all()
+    page = await apaginate_queryset(
+        Documento.objects.filter(user=request.auth).annotate(
+            cantidad_descubrimientos=Count("descubrimientos")
+        ),
+        ordering=("-fecha_carga", "-id"),
+        cursor=cursor,
+        limit=limit,
+    )
+    documentos = page.items
+    if page.next_cursor:
+        response[NEXT_CURSOR_HEADER] = page.next_cursor
 
     return [
         {
@@ -61,7 +95,7 @@ def list_documents(request):
 
 
 @router.get("/documents/{documento_id}", response=DocumentoDetailSchema)
-def get_document_detail(request, documento_id: int):
+async def get_document_detail(request, documento_id: int):
     """
     Obtiene los detalles de un documento específico con todos sus descubrimientos.
 
@@ -71,8 +105,8 @@ def get_document_detail(request, documento_id: int):
     Returns:
         Documento con todos sus descubrimientos e impactos
     """
-    documento = get_object_or_404(
-        Documento.objects.filter(user=request.user).prefetch_related(
+    documento = await aget_object_or_404(
+        Documento.objects.filter(user=request.auth).prefetch_related(
             "descubrimientos__impactos"
         ),
         id=documento_id,
@@ -92,6 +126,7 @@ def get_document_detail(request, documento_id: int):
                 "impactos": [
                     {
                         "id": imp.id,
+                        "articulo_numero": imp.articulo_numero,
                         "extracto_interno": imp.extracto_interno,
                         "extracto_articulo": imp.extracto_articulo,
                         "nivel_relevancia": imp.nivel_relevancia,
@@ -107,7 +142,7 @@ def get_document_detail(request, documento_id: int):
 
 
 @router.delete("/documents/{documento_id}")
-def delete_document(request, documento_id: int):
+async def delete_document(request, documento_id: int):
     """
     Elimina un documento y todos sus descubrimientos asociados.
 
@@ -117,28 +152,40 @@ def delete_document(request, documento_id: int):
     Returns:
         Mensaje de confirmación
     """
-    documento = get_object_or_404(Documento, id=documento_id, user=request.user)
+    documento = await aget_object_or_404(Documento, id=documento_id, user=request.auth)
     nombre = documento.nombre
-    documento.delete()
+    await sync_to_async(eliminar_documento)(documento)
 
     return {"success": True, "message": f"Documento '{nombre}' eliminado correctamente"}
 
 
 @router.get("/discoveries", response=list[DescubrimientoListSchema])
-def list_discoveries(request):
+async def list_discoveries(
+    request,
+    response: HttpResponse,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
     """
-    Lista todos los descubrimientos de conflictos pendientes del usuario actual.
+    Lista los descubrimientos de conflictos pendientes del usuario actual.
     Excluye los descubrimientos descartados y los que están en seguimiento.
 
+    Paginado por cursor: el cursor de la página siguiente se retorna en el
+    header X-Next-Cursor.
+
     Returns:
         Lista de descubrimientos con información básica y cantidad de impactos
     """
-    descubrimientos = (
+    page = await apaginate_queryset(
         DescubrimientoConflicto.objects.select_related("documento")
-        .filter(documento__user=request.user, estado=DescubrimientoConflicto.Estado.PENDING)
-        .annotate(cantidad_impactos=Count("impactos"))
-        .order_by("-max_nivel_relevancia")
+        .filter(user=request.auth, estado=DescubrimientoConflicto.Estado.PENDING),
+        ordering=("-max_nivel_relevancia", "-id"),
+        cursor=cursor,
+        limit=limit,
     )
+    descubrimientos = page.items
+    if page.next_cursor:
+        response[NEXT_CURSOR_HEADER] = page.next_cursor
 
     return [
         {
@@ -158,29 +205,41 @@ def list_discoveries(request):
 
 
 @router.get("/discoveries/tracking", response=list[DescubrimientoListSchema])
-def list_tracking_discoveries(request):
+async def list_tracking_discoveries(
+    request,
+    response: HttpResponse,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
     """
-    Lista todos los descubrimientos que están en seguimiento del usuario actual.
+    Lista los descubrimientos que están en seguimiento del usuario actual.
     Incluye información del proyecto de ley (etapa, fecha, etc.)
 
+    Paginado por cursor: el cursor de la página siguiente se retorna en el
+    header X-Next-Cursor.
+
     Returns:
         Lista de descubrimientos en seguimiento con información básica y cantidad de impactos
     """
-    descubrimientos = (
-        DescubrimientoConflicto.objects.select_related("documento")
-        .filter(documento__user=request.user, estado=DescubrimientoConflicto.Estado.TRACKING)
-        .annotate(cantidad_impactos=Count("impactos"))
+    page = await apaginate_queryset(
+        DescubrimientoConflicto.objects.select_related("documento", "proyecto")
+        .filter(user=request.auth, estado=DescubrimientoConflicto.Estado.TRACKING),
+        ordering=("-fecha_analisis", "-id"),
+        cursor=cursor,
+        limit=limit,
     )
+    descubrimientos = page.items
+    if page.next_cursor:
+        response[NEXT_CURSOR_HEADER] = page.next_cursor
 
     result = []
     for desc in descubrimientos:
-        # Intentar obtener el proyecto de ley relacionado
-        try:
-            proyecto_ley = ProyectoLey.objects.get(proyecto_id=desc.proyecto_id)
+        proyecto_ley = desc.proyecto
+        if proyecto_ley is not None:
             proyecto_etapa = proyecto_ley.etapa
             proyecto_fecha = proyecto_ley.fecha
             proyecto_camara_origen = proyecto_ley.camara_origen
-        except ProyectoLey.DoesNotExist:
+        else:
             # Si no existe el proyecto, usar valores por defecto
             proyecto_etapa = 1
             proyecto_fecha = desc.fecha_analisis.date()
@@ -205,8 +264,56 @@ def list_tracking_discoveries(request):
     return result
 
 
+@router.get("/discoveries/counts", response=ContadorDescubrimientosSchema)
+async def get_discovery_counts(request):
+    """
+    Obtiene la cantidad de descubrimientos del usuario actual por estado.
+
+    Lee el contador mantenido al crear, cambiar de estado o eliminar
+    descubrimientos, sin contar filas.
+
+    Returns:
+        Cantidad de descubrimientos pendientes, en seguimiento y descartados
+    """
+    return await aobtener_contador(request.auth)
+
+
+@router.post("/discoveries/bulk/track", response=TriageMasivoResultadoSchema)
+async def bulk_track_discoveries(request, datos: TriageMasivoSchema):
+    """
+    Marca varios descubrimientos como en seguimiento en una sola operación.
+
+    Los descubrimientos se seleccionan por IDs y/o por filtro (documento,
+    relevancia máxima menor a un umbral). Solo se modifican los del usuario.
+    Sin IDs, solo se modifican los pendientes (o los de estado_origen).
+
+    Returns:
+        Cantidad de descubrimientos actualizados y pendientes restantes
+    """
+    return await sync_to_async(triage_masivo)(
+        request.auth, DescubrimientoConflicto.Estado.TRACKING, **datos.model_dump()
+    )
+
+
+@router.post("/discoveries/bulk/discard", response=TriageMasivoResultadoSchema)
+async def bulk_discard_discoveries(request, datos: TriageMasivoSchema):
+    """
+    Descarta varios descubrimientos en una sola operación.
+
+    Los descubrimientos se seleccionan por IDs y/o por filtro (documento,
+    relevancia máxima menor a un umbral). Solo se modifican los del usuario.
+    Sin IDs, solo se modifican los pendientes (o los de estado_origen).
+
+    Returns:
+        Cantidad de descubrimientos actualizados y pendientes restantes
+    """
+    return await sync_to_async(triage_masivo)(
+        request.auth, DescubrimientoConflicto.Estado.DISCARDED, **datos.model_dump()
+    )
+
+
 @router.get("/discoveries/{descubrimiento_id}", response=DescubrimientoDetailSchema)
-def get_discovery_detail(request, descubrimiento_id: int):
+async def get_discovery_detail(request, descubrimiento_id: int):
     """
     Obtiene los detalles de un descubrimiento específico con todos sus impactos.
 
@@ -216,12 +323,13 @@ def get_discovery_detail(request, descubrimiento_id: int):
     Returns:
         Descubrimiento con todos sus impactos y el documento asociado
     """
-    descubrimiento = get_object_or_404(
+    descubrimiento = await aget_object_or_404(
         DescubrimientoConflicto.objects.select_related("documento").prefetch_related(
             "impactos"
-        ).filter(documento__user=request.user),
+        ).filter(user=request.auth),
         id=descubrimiento_id,
     )
+    cantidad_descubrimientos = await descubrimiento.documento.descubrimientos.acount()
 
     return {
         "id": descubrimiento.id,
@@ -235,7 +343,7 @@ def get_discovery_detail(request, descubrimiento_id: int):
             "id": descubrimiento.documento.id,
             "nombre": descubrimiento.documento.nombre,
             "fecha_carga": descubrimiento.documento.fecha_carga,
-            "cantidad_descubrimientos": descubrimiento.documento.descubrimientos.count(),
+            "cantidad_descubrimientos": cantidad_descubrimientos,
         },
         "impactos": [
             {
@@ -252,8 +360,20 @@ def get_discovery_detail(request, descubrimiento_id: int):
     }
 
 
+@transaction.atomic
+def _cambiar_estado(user, descubrimiento_id: int, estado: str) -> DescubrimientoConflicto:
+    """Bloquea el descubrimiento del usuario y cambia su estado."""
+    descubrimiento = get_object_or_404(
+        DescubrimientoConflicto.objects.select_for_update(),
+        id=descubrimiento_id,
+        user=user,
+    )
+    cambiar_estado_descubrimiento(descubrimiento, estado)
+    return descubrimiento
+
+
 @router.post("/discoveries/{descubrimiento_id}/track")
-def track_discovery(request, descubrimiento_id: int):
+async def track_discovery(request, descubrimiento_id: int):
     """
     Marca un descubrimiento como en seguimiento.
     El descubrimiento dejará de aparecer en la vista de descubrimientos
@@ -265,13 +385,9 @@ def track_discovery(request, descubrimiento_id: int):
     Returns:
         Mensaje de confirmación con el descubrimiento actualizado
     """
-    descubrimiento = get_object_or_404(
-        DescubrimientoConflicto,
-        id=descubrimiento_id,
-        documento__user=request.user
+    descubrimiento = await sync_to_async(_cambiar_estado)(
+        request.auth, descubrimiento_id, DescubrimientoConflicto.Estado.TRACKING
     )
-    descubrimiento.estado = DescubrimientoConflicto.Estado.TRACKING
-    descubrimiento.save()
 
     return {
         "success": True,
@@ -281,7 +397,7 @@ def track_discovery(request, descubrimiento_id: int):
 
 
 @router.post("/discoveries/{descubrimiento_id}/discard")
-def discard_discovery(request, descubrimiento_id: int):
+async def discard_discovery(request, descubrimiento_id: int):
     """
     Marca un descubrimiento como descartado.
     El descubrimiento dejará de aparecer en la vista de descubrimientos.
@@ -292,13 +408,9 @@ def discard_discovery(request, descubrimiento_id: int):
     Returns:
         Mensaje de confirmación con el descubrimiento actualizado
     """
-    descubrimiento = get_object_or_404(
-        DescubrimientoConflicto,
-        id=descubrimiento_id,
-        documento__user=request.user
+    descubrimiento = await sync_to_async(_cambiar_estado)(
+        request.auth, descubrimiento_id, DescubrimientoConflicto.Estado.DISCARDED
     )
-    descubrimiento.estado = DescubrimientoConflicto.Estado.DISCARDED
-    descubrimiento.save()
 
     return {
         "success": True,
@@ -308,7 +420,7 @@ def discard_discovery(request, descubrimiento_id: int):
 
 
 @router.post("/demo/advance-time")
-def advance_time(request):
+async def advance_time(request):
     """
     Avanza las etapas de los proyectos de ley en seguimiento (para demo).
     Incrementa la etapa de cada proyecto en 1 (máximo 4).
@@ -316,22 +428,18 @@ def advance_time(request):
     Returns:
         Mensaje de confirmación con cantidad de proyectos actualizados
     """
-    # Obtener todos los proyectos que tienen descubrimientos en seguimiento
-    descubrimientos_tracking = DescubrimientoConflicto.objects.filter(
-        documento__user=request.user,
+    # Avanzar en un solo UPDATE los proyectos con descubrimientos en seguimiento
+    proyectos_tracking = DescubrimientoConflicto.objects.filter(
+        user=request.auth,
         estado=DescubrimientoConflicto.Estado.TRACKING
-    ).values_list('proyecto_id', flat=True).distinct()
-
-    proyectos_actualizados = 0
-    for proyecto_id in descubrimientos_tracking:
-        try:
-            proyecto = ProyectoLey.objects.get(proyecto_id=proyecto_id)
-            if proyecto.etapa < 4:
-                proyecto.etapa += 1
-                proyecto.save()
-                proyectos_actualizados += 1
-        except ProyectoLey.DoesNotExist:
-            continue
+    ).values("proyecto_id")
+
+    proyectos_actualizados = await ProyectoLey.objects.filter(
+        proyecto_id__in=proyectos_tracking,
+        etapa__lt=4,
+    ).aupdate(etapa=F("etapa") + 1, updated_at=timezone.now())
+    if proyectos_actualizados:
+        await ainvalidar_cache_corpus()
 
     return {
         "success": True,
@@ -0,0 +1 @@
+# Management package for conflict_detector app
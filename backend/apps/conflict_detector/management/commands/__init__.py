@@ -0,0 +1 @@
+# Management commands package for conflict_detector app
@@ -0,0 +1,106 @@
+"""Compara el renderer JSON por defecto de Ninja con el renderer orjson."""
+
+import datetime
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from ninja.renderers import JSONRenderer
+
+from services.renderers import ORJSONRenderer
+
+PARRAFO = (
+    "La empresa mantiene políticas internas de tratamiento de datos personales "
+    "que deberán adecuarse a las nuevas obligaciones de información, registro y "
+    "notificación establecidas en el artículo, incluyendo plazos y sanciones. "
+)
+
+
+def construir_payload(descubrimientos: int, impactos: int, largo_texto: int) -> dict:
+    """
+    Construye una respuesta similar a la del detalle de documento.
+
+    Args:
+        descubrimientos: Cantidad de descubrimientos del documento
+        impactos: Cantidad de impactos por descubrimiento
+        largo_texto: Cantidad aproximada de caracteres de cada extracto
+
+    Returns:
+        Diccionario con la forma de DocumentoDetailSchema
+    """
+    texto = (PARRAFO * (largo_texto // len(PARRAFO) + 1))[:largo_texto]
+    ahora = datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "id": 1,
+        "nombre": "memoria_anual.pdf",
+        "fecha_carga": ahora,
+        "descubrimientos": [
+            {
+                "id": d,
+                "proyecto_id": f"{16000 + d}-07",
+                "proyecto_titulo": "Modifica la ley N° 19.628 sobre protección de la vida privada",
+                "descripcion_impacto_consolidada": texto,
+                "fecha_analisis": ahora,
+                "impactos": [
+                    {
+                        "id": d * impactos + i,
+                        "articulo_numero": i + 1,
+                        "extracto_interno": texto,
+                        "extracto_articulo": texto,
+                        "nivel_relevancia": (d + i) % 100,
+                        "descripcion_impacto": texto,
+                        "created_at": ahora,
+                    }
+                    for i in range(impactos)
+                ],
+            }
+            for d in range(descubrimientos)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = "Mide el tiempo de serialización de respuestas grandes con cada renderer JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--descubrimientos", type=int, default=20)
+        parser.add_argument("--impactos", type=int, default=15)
+        parser.add_argument("--largo-texto", type=int, default=1500)
+        parser.add_argument("--repeticiones", type=int, default=20)
+
+    def handle(self, *args, **options):
+        payload = construir_payload(
+            options["descubrimientos"], options["impactos"], options["largo_texto"]
+        )
+        request = RequestFactory().get("/")
+        repeticiones = options["repeticiones"]
+
+        resultados = []
+        for nombre, renderer in (
+            ("ninja JSONRenderer", JSONRenderer()),
+            ("ORJSONRenderer", ORJSONRenderer()),
+        ):
+            contenido = renderer.render(request, payload, response_status=200)
+            if isinstance(contenido, str):
+                contenido = contenido.encode("utf-8")
+            tiempo = min(
+                timeit.repeat(
+                    lambda renderer=renderer: renderer.render(
+                        request, payload, response_status=200
+                    ),
+                    number=repeticiones,
+                    repeat=3,
+                )
+            )
+            resultados.append((nombre, tiempo / repeticiones * 1000, len(contenido)))
+
+        self.stdout.write(
+            f"Payload: {options['descubrimientos']} descubrimientos x "
+            f"{options['impactos']} impactos, textos de {options['largo_texto']} caracteres"
+        )
+        base = resultados[0][1]
+        for nombre, ms, tamano in resultados:
+            self.stdout.write(
+                f"  {nombre:<20} {ms:8.2f} ms/render  {tamano / 1024:8.1f} KiB  "
+                f"x{base / ms:.1f}"
+            )
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conflict_detector', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documento',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='Hash SHA256 del contenido del PDF', max_length=64),
+        ),
+        migrations.CreateModel(
+            name='DocumentoPagina',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='Hash SHA256 del contenido del PDF', max_length=64)),
+                ('numero', models.IntegerField(help_text='Índice de la página dentro del documento')),
+                ('version_normalizacion', models.IntegerField(help_text='Versión del algoritmo de normalización aplicado')),
+                ('texto_comprimido', models.BinaryField(help_text='Texto normalizado de la página comprimido con zlib')),
+                ('bytes_originales', models.IntegerField(default=0, help_text='Tamaño en bytes del texto extraído antes de normalizar')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Página de Documento',
+                'verbose_name_plural': 'Páginas de Documentos',
+                'db_table': 'conflict_detector_documento_pagina',
+                'ordering': ['content_hash', 'numero'],
+                'unique_together': {('content_hash', 'version_normalizacion', 'numero')},
+            },
+        ),
+    ]
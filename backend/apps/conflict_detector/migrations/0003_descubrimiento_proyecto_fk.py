@@ -0,0 +1,57 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Convierte la columna proyecto_id de DescubrimientoConflicto en una
+    clave foránea (sin constraint) hacia ProyectoLey.proyecto_id.
+
+    La columna existente se conserva; solo se reemplaza el campo en el estado
+    de Django y luego se hace nullable e indexada.
+    """
+
+    dependencies = [
+        ("conflict_detector", "0002_documento_pagina"),
+        ("proyectos_ley", "0002_load_initial_data"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveField(
+                    model_name="descubrimientoconflicto",
+                    name="proyecto_id",
+                ),
+                migrations.AddField(
+                    model_name="descubrimientoconflicto",
+                    name="proyecto",
+                    field=models.ForeignKey(
+                        db_column="proyecto_id",
+                        db_constraint=False,
+                        db_index=False,
+                        help_text="Proyecto de ley asociado (por su identificador proyecto_id)",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="descubrimientos",
+                        to="proyectos_ley.proyectoley",
+                        to_field="proyecto_id",
+                    ),
+                    preserve_default=False,
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="descubrimientoconflicto",
+            name="proyecto",
+            field=models.ForeignKey(
+                db_column="proyecto_id",
+                db_constraint=False,
+                help_text="Proyecto de ley asociado (por su identificador proyecto_id)",
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="descubrimientos",
+                to="proyectos_ley.proyectoley",
+                to_field="proyecto_id",
+            ),
+        ),
+    ]
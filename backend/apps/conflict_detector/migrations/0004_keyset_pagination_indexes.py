@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conflict_detector', '0003_descubrimiento_proyecto_fk'),
+        ('proyectos_ley', '0003_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='descubrimientoconflicto',
+            index=models.Index(fields=['estado', '-max_nivel_relevancia', '-id'], name='conflict_de_estado_4fc49a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='descubrimientoconflicto',
+            index=models.Index(fields=['estado', '-fecha_analisis', '-id'], name='conflict_de_estado_5690d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documento',
+            index=models.Index(fields=['user', '-fecha_carga', '-id'], name='conflict_de_user_id_5a5ba7_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_user_cantidad_impactos(apps, schema_editor):
+    """Copia el usuario del documento y cuenta los impactos existentes."""
+    Documento = apps.get_model("conflict_detector", "Documento")
+    DescubrimientoConflicto = apps.get_model(
+        "conflict_detector", "DescubrimientoConflicto"
+    )
+    ImpactoDescubierto = apps.get_model("conflict_detector", "ImpactoDescubierto")
+
+    DescubrimientoConflicto.objects.update(
+        user_id=Subquery(
+            Documento.objects.filter(pk=OuterRef("documento_id")).values("user_id")[:1]
+        ),
+        cantidad_impactos=Coalesce(
+            Subquery(
+                ImpactoDescubierto.objects.filter(descubrimiento_id=OuterRef("pk"))
+                .values("descubrimiento_id")
+                .annotate(total=Count("id"))
+                .values("total")[:1]
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conflict_detector', '0004_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='descubrimientoconflicto',
+            name='conflict_de_estado_4fc49a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='descubrimientoconflicto',
+            name='conflict_de_estado_5690d3_idx',
+        ),
+        migrations.AddField(
+            model_name='descubrimientoconflicto',
+            name='cantidad_impactos',
+            field=models.IntegerField(default=0, help_text='Cantidad de impactos del descubrimiento (desnormalizado)'),
+        ),
+        migrations.AddField(
+            model_name='descubrimientoconflicto',
+            name='user',
+            field=models.ForeignKey(null=True, help_text='Usuario dueño del documento (desnormalizado para la bandeja)', on_delete=django.db.models.deletion.CASCADE, related_name='descubrimientos', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(
+            backfill_user_cantidad_impactos, migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name='descubrimientoconflicto',
+            name='user',
+            field=models.ForeignKey(help_text='Usuario dueño del documento (desnormalizado para la bandeja)', on_delete=django.db.models.deletion.CASCADE, related_name='descubrimientos', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='descubrimientoconflicto',
+            index=models.Index(fields=['user', 'estado', '-max_nivel_relevancia', '-id'], name='conflict_de_user_id_4d40d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='descubrimientoconflicto',
+            index=models.Index(fields=['user', 'estado', '-fecha_analisis', '-id'], name='conflict_de_user_id_0ad5ed_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_contadores(apps, schema_editor):
+    """Crea los contadores a partir de los descubrimientos existentes."""
+    DescubrimientoConflicto = apps.get_model(
+        "conflict_detector", "DescubrimientoConflicto"
+    )
+    ContadorDescubrimientos = apps.get_model(
+        "conflict_detector", "ContadorDescubrimientos"
+    )
+
+    conteos = DescubrimientoConflicto.objects.order_by().values("user_id").annotate(
+        pendientes=Count("id", filter=Q(estado="PENDING")),
+        en_seguimiento=Count("id", filter=Q(estado="TRACKING")),
+        descartados=Count("id", filter=Q(estado="DISCARDED")),
+    )
+    ContadorDescubrimientos.objects.bulk_create(
+        [ContadorDescubrimientos(**conteo) for conteo in conteos]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conflict_detector', '0005_descubrimiento_user_cantidad_impactos'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorDescubrimientos',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='contador_descubrimientos', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('pendientes', models.IntegerField(default=0)),
+                ('en_seguimiento', models.IntegerField(default=0)),
+                ('descartados', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Contador de Descubrimientos',
+                'verbose_name_plural': 'Contadores de Descubrimientos',
+                'db_table': 'conflict_detector_contador_descubrimientos',
+            },
+        ),
+        migrations.RunPython(backfill_contadores, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 """Models for conflict_detector app."""
 
+import zlib
+
 from django.conf import settings
 from django.db import models
 from pgvector.django import VectorField
@@ -15,6 +17,13 @@ class Documento(models.Model):
         help_text="Usuario que subió el documento"
     )
     nombre = models.CharField(max_length=255)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        db_index=True,
+        help_text="Hash SHA256 del contenido del PDF",
+    )
     fecha_carga = models.DateTimeField(auto_now_add=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -24,6 +33,9 @@ class Documento(models.Model):
         ordering = ["-fecha_carga"]
         verbose_name = "Documento"
         verbose_name_plural = "Documentos"
+        indexes = [
+            models.Index(fields=["user", "-fecha_carga", "-id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.nombre}"
@@ -42,13 +54,32 @@ class DescubrimientoConflicto(models.Model):
         on_delete=models.CASCADE,
         related_name="descubrimientos",
     )
-    proyecto_id = models.CharField(max_length=50)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="descubrimientos",
+        help_text="Usuario dueño del documento (desnormalizado para la bandeja)",
+    )
+    proyecto = models.ForeignKey(
+        "proyectos_ley.ProyectoLey",
+        to_field="proyecto_id",
+        db_column="proyecto_id",
+        db_constraint=False,
+        null=True,
+        on_delete=models.DO_NOTHING,
+        related_name="descubrimientos",
+        help_text="Proyecto de ley asociado (por su identificador proyecto_id)",
+    )
     proyecto_titulo = models.TextField()
     max_nivel_relevancia = models.IntegerField(
         default=0,
         help_text="Nivel máximo de relevancia entre todos los impactos (0-100)"
     )
     descripcion_impacto_consolidada = models.TextField(blank=True, null=True)
+    cantidad_impactos = models.IntegerField(
+        default=0,
+        help_text="Cantidad de impactos del descubrimiento (desnormalizado)",
+    )
     estado = models.CharField(
         max_length=20,
         choices=Estado.choices,
@@ -64,11 +95,50 @@ class DescubrimientoConflicto(models.Model):
         ordering = ["-fecha_analisis"]
         verbose_name = "Descubrimiento de Conflicto"
         verbose_name_plural = "Descubrimientos de Conflictos"
+        indexes = [
+            models.Index(fields=["user", "estado", "-max_nivel_relevancia", "-id"]),
+            models.Index(fields=["user", "estado", "-fecha_analisis", "-id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.proyecto_id} - {self.documento.nombre}"
 
 
+class ContadorDescubrimientos(models.Model):
+    """Cantidad de descubrimientos de un usuario por estado.
+
+    Se mantiene dentro de las mismas transacciones que crean, cambian de
+    estado o eliminan descubrimientos, para que el contador del sidebar sea
+    una lectura por clave primaria en vez de un COUNT.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="contador_descubrimientos",
+    )
+    pendientes = models.IntegerField(default=0)
+    en_seguimiento = models.IntegerField(default=0)
+    descartados = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Campo del contador que corresponde a cada estado
+    CAMPOS_POR_ESTADO = {
+        DescubrimientoConflicto.Estado.PENDING: "pendientes",
+        DescubrimientoConflicto.Estado.TRACKING: "en_seguimiento",
+        DescubrimientoConflicto.Estado.DISCARDED: "descartados",
+    }
+
+    class Meta:
+        db_table = "conflict_detector_contador_descubrimientos"
+        verbose_name = "Contador de Descubrimientos"
+        verbose_name_plural = "Contadores de Descubrimientos"
+
+    def __str__(self) -> str:
+        return f"{self.user} ({self.pendientes} pendientes)"
+
+
 class ImpactoDescubierto(models.Model):
     """Representa un impacto individual descubierto dentro de un descubrimiento."""
 
@@ -105,6 +175,47 @@ class ImpactoDescubierto(models.Model):
         return f"Impacto (relevancia: {self.nivel_relevancia})"
 
 
+class DocumentoPagina(models.Model):
+    """Texto extraído y normalizado de una página, comprimido y asociado al hash del PDF."""
+
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="Hash SHA256 del contenido del PDF",
+    )
+    numero = models.IntegerField(help_text="Índice de la página dentro del documento")
+    version_normalizacion = models.IntegerField(
+        help_text="Versión del algoritmo de normalización aplicado"
+    )
+    texto_comprimido = models.BinaryField(
+        help_text="Texto normalizado de la página comprimido con zlib"
+    )
+    bytes_originales = models.IntegerField(
+        default=0,
+        help_text="Tamaño en bytes del texto extraído antes de normalizar",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "conflict_detector_documento_pagina"
+        ordering = ["content_hash", "numero"]
+        verbose_name = "Página de Documento"
+        verbose_name_plural = "Páginas de Documentos"
+        unique_together = [["content_hash", "version_normalizacion", "numero"]]
+
+    def __str__(self) -> str:
+        return f"Página {self.numero} ({self.content_hash[:8]}...)"
+
+    @staticmethod
+    def comprimir(texto: str) -> bytes:
+        """Comprime el texto de una página."""
+        return zlib.compress(texto.encode("utf-8"))
+
+    @property
+    def texto(self) -> str:
+        """Texto de la página, descomprimido al momento de accederlo."""
+        return zlib.decompress(bytes(self.texto_comprimido)).decode("utf-8")
+
+
 class EmbeddingCache(models.Model):
     """Cache de embeddings para evitar llamadas redundantes a la API de OpenAI."""
 
@@ -1,8 +1,10 @@
 """Schemas para el API de conflict detector."""
 
 from datetime import datetime
+from typing import Literal
 
 from ninja import Schema
+from pydantic import model_validator
 
 
 class ImpactoDescubiertoSchema(Schema):
@@ -76,3 +78,41 @@ class DescubrimientoDetailSchema(Schema):
     max_nivel_relevancia: int
     documento: DocumentoListSchema
     impactos: list[ImpactoDescubiertoSchema]
+
+
+class ContadorDescubrimientosSchema(Schema):
+    """Schema para el contador de descubrimientos por estado."""
+
+    pendientes: int
+    en_seguimiento: int
+    descartados: int
+
+
+class TriageMasivoSchema(Schema):
+    """Schema para cambiar el estado de varios descubrimientos a la vez.
+
+    Se puede indicar una lista de IDs, un filtro, o ambos (se combinan).
+    Las selecciones solo por filtro afectan únicamente a los descubrimientos
+    en ``estado_origen``, que por defecto es PENDING, para no mover los que
+    el usuario ya siguió o descartó.
+    """
+
+    ids: list[int] | None = None
+    documento_id: int | None = None
+    relevancia_menor_a: int | None = None
+    estado_origen: Literal["PENDING", "TRACKING", "DISCARDED"] | None = None
+
+    @model_validator(mode="after")
+    def validar_criterio(self):
+        if self.ids is None and self.documento_id is None and self.relevancia_menor_a is None:
+            raise ValueError("Debe indicar ids, documento_id o relevancia_menor_a")
+        return self
+
+
+class TriageMasivoResultadoSchema(Schema):
+    """Schema para el resultado de un cambio de estado masivo."""
+
+    success: bool
+    estado: str
+    actualizados: int
+    pendientes: int
@@ -1,11 +1,31 @@
 """Servicios para el conflict detector."""
 
+import hashlib
+import logging
+import time
+from typing import ClassVar
+
 import fitz  # PyMuPDF
 from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.auditlog.services import LogEntryRequest, LogGroupRequest
+from apps.auditlog.writer import audit_log_writer
 
 from .agent.graph import run_agent
 from .agent.models import ProyectoLeyImpacto
-from .models import Documento, DescubrimientoConflicto, ImpactoDescubierto
+from .models import (
+    ContadorDescubrimientos,
+    Documento,
+    DocumentoPagina,
+    DescubrimientoConflicto,
+    ImpactoDescubierto,
+)
+from .text_cleaning import NORMALIZACION_VERSION, normalizar_paginas
+
+logger = logging.getLogger(__name__)
 
 
 def extract_text_from_pdf(pdf_content: bytes) -> list[str]:
@@ -28,20 +48,356 @@ def extract_text_from_pdf(pdf_content: bytes) -> list[str]:
     return pages_text
 
 
-def crear_documento(nombre: str, user) -> Documento:
+def calcular_hash_contenido(pdf_content: bytes) -> str:
+    """Calcula el hash SHA256 del contenido de un PDF."""
+    return hashlib.sha256(pdf_content).hexdigest()
+
+
+def cargar_paginas_documento(content_hash: str) -> list[str] | None:
+    """
+    Carga las páginas normalizadas de un documento desde la base de datos.
+
+    Args:
+        content_hash: Hash SHA256 del contenido del PDF
+
+    Returns:
+        Lista con el texto de cada página, o None si no están almacenadas
+    """
+    paginas = list(
+        DocumentoPagina.objects.filter(
+            content_hash=content_hash,
+            version_normalizacion=NORMALIZACION_VERSION,
+        ).order_by("numero")
+    )
+    if not paginas or paginas[-1].numero != len(paginas) - 1:
+        return None
+    return [pagina.texto for pagina in paginas]
+
+
+def guardar_paginas_documento(
+    content_hash: str,
+    paginas: list[str],
+    bytes_originales: list[int],
+) -> None:
+    """
+    Guarda las páginas normalizadas de un documento comprimidas.
+
+    Args:
+        content_hash: Hash SHA256 del contenido del PDF
+        paginas: Texto normalizado de cada página
+        bytes_originales: Tamaño en bytes del texto extraído de cada página
+    """
+    DocumentoPagina.objects.bulk_create(
+        [
+            DocumentoPagina(
+                content_hash=content_hash,
+                numero=numero,
+                version_normalizacion=NORMALIZACION_VERSION,
+                texto_comprimido=DocumentoPagina.comprimir(texto),
+                bytes_originales=bytes_originales[numero],
+            )
+            for numero, texto in enumerate(paginas)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def obtener_paginas_documento(pdf_content: bytes) -> tuple[str, list[str]]:
+    """
+    Obtiene las páginas normalizadas de un PDF, reutilizando las almacenadas.
+
+    Si el PDF ya fue procesado (mismo hash de contenido) las páginas se leen
+    desde la base de datos; si no, se extraen, normalizan y almacenan.
+
+    Args:
+        pdf_content: Contenido del PDF en bytes
+
+    Returns:
+        Tupla con el hash del contenido y el texto de cada página
+    """
+    content_hash = calcular_hash_contenido(pdf_content)
+
+    paginas = cargar_paginas_documento(content_hash)
+    if paginas is not None:
+        logger.info(
+            f"Páginas del documento {content_hash[:8]} encontradas en almacenamiento"
+        )
+        return content_hash, paginas
+
+    resultado = normalizar_paginas(extract_text_from_pdf(pdf_content))
+    guardar_paginas_documento(
+        content_hash,
+        resultado.paginas,
+        [estadistica.bytes_originales for estadistica in resultado.estadisticas],
+    )
+    return content_hash, resultado.paginas
+
+
+class DocumentoLogGroup(LogGroupRequest):
+    """Grupo del audit log con las etapas del análisis de un documento."""
+
+    log_group_type: ClassVar[str] = "documento"
+
+    documento_id: int
+    nombre: str
+    user: str
+
+    def reference_id(self) -> str:
+        return f"documento-{self.documento_id}"
+
+    def properties(self) -> dict:
+        return {"nombre": self.nombre, "user": self.user}
+
+
+def registrar_etapa(
+    documento: Documento, user, tipo: str, descripcion: str, **properties
+) -> None:
+    """
+    Registra una etapa del análisis en el audit log sin esperar a la base de datos.
+
+    Args:
+        documento: Documento analizado
+        user: Usuario que sube el documento
+        tipo: Tipo de la entrada (etapa del pipeline)
+        descripcion: Descripción legible de la etapa
+        **properties: Datos adicionales de la etapa
+    """
+    email = getattr(user, "email", None) or "anonymous"
+    grupo = DocumentoLogGroup(documento_id=documento.id, nombre=documento.nombre, user=email)
+    audit_log_writer.log(
+        LogEntryRequest(
+            timestamp=timezone.now(),
+            log_group_reference_id=grupo.reference_id(),
+            type=tipo,
+            description=descripcion,
+            properties=properties,
+            user=email,
+        ),
+        group=grupo,
+    )
+
+
+def crear_documento(nombre: str, user, content_hash: str = "") -> Documento:
     """
     Crea un documento en la base de datos.
 
     Args:
         nombre: Nombre del documento
         user: Usuario que sube el documento
+        content_hash: Hash SHA256 del contenido del PDF
 
     Returns:
         El objeto Documento creado
     """
-    return Documento.objects.create(nombre=nombre, user=user)
+    return Documento.objects.create(
+        nombre=nombre, user=user, content_hash=content_hash
+    )
 
 
+def ajustar_contador(user_id: int, deltas: dict[str, int]) -> None:
+    """
+    Suma deltas al contador de descubrimientos de un usuario.
+
+    Debe llamarse dentro de la misma transacción que modifica los
+    descubrimientos, para que el contador nunca quede desfasado.
+
+    Args:
+        user_id: ID del usuario dueño de los descubrimientos
+        deltas: Diferencia a aplicar por estado, e.g. ``{"PENDING": -1, "TRACKING": 1}``
+    """
+    cambios = {
+        ContadorDescubrimientos.CAMPOS_POR_ESTADO[estado]: F(
+            ContadorDescubrimientos.CAMPOS_POR_ESTADO[estado]
+        )
+        + delta
+        for estado, delta in deltas.items()
+        if delta
+    }
+    if not cambios:
+        return
+
+    ContadorDescubrimientos.objects.get_or_create(user_id=user_id)
+    ContadorDescubrimientos.objects.filter(user_id=user_id).update(
+        **cambios, updated_at=timezone.now()
+    )
+
+
+def obtener_contador(user) -> ContadorDescubrimientos:
+    """
+    Obtiene el contador de descubrimientos de un usuario (lectura por PK).
+
+    Args:
+        user: Usuario dueño de los descubrimientos
+
+    Returns:
+        ContadorDescubrimientos del usuario (en cero si aún no tiene)
+    """
+    contador = ContadorDescubrimientos.objects.filter(user_id=user.pk).first()
+    return contador or ContadorDescubrimientos(user_id=user.pk)
+
+
+async def aobtener_contador(user) -> ContadorDescubrimientos:
+    """Versión asíncrona de obtener_contador."""
+    contador = await ContadorDescubrimientos.objects.filter(user_id=user.pk).afirst()
+    return contador or ContadorDescubrimientos(user_id=user.pk)
+
+
+@transaction.atomic
+def recalcular_contador(user_id: int) -> ContadorDescubrimientos:
+    """
+    Recalcula desde cero el contador de un usuario contando sus descubrimientos.
+
+    Args:
+        user_id: ID del usuario
+
+    Returns:
+        ContadorDescubrimientos actualizado
+    """
+    conteos = DescubrimientoConflicto.objects.filter(user_id=user_id).aggregate(
+        **{
+            campo: Count("id", filter=Q(estado=estado))
+            for estado, campo in ContadorDescubrimientos.CAMPOS_POR_ESTADO.items()
+        }
+    )
+    contador, _ = ContadorDescubrimientos.objects.update_or_create(
+        user_id=user_id, defaults=conteos
+    )
+    return contador
+
+
+@transaction.atomic
+def cambiar_estado_descubrimiento(
+    descubrimiento: DescubrimientoConflicto, estado: str
+) -> None:
+    """
+    Cambia el estado de un descubrimiento y actualiza el contador del usuario.
+
+    Args:
+        descubrimiento: Descubrimiento a actualizar
+        estado: Nuevo estado (DescubrimientoConflicto.Estado)
+    """
+    estado_anterior = descubrimiento.estado
+    if estado_anterior == estado:
+        return
+
+    descubrimiento.estado = estado
+    descubrimiento.save(update_fields=["estado", "updated_at"])
+    ajustar_contador(descubrimiento.user_id, {estado_anterior: -1, estado: 1})
+
+
+@transaction.atomic
+def cambiar_estado_masivo(queryset, estado: str) -> int:
+    """
+    Cambia el estado de todos los descubrimientos del queryset con un solo UPDATE.
+
+    Las filas se bloquean antes de actualizarlas para descontar del contador
+    exactamente los estados que tenían.
+
+    Args:
+        queryset: Descubrimientos a actualizar (ya filtrados por usuario)
+        estado: Nuevo estado (DescubrimientoConflicto.Estado)
+
+    Returns:
+        Cantidad de descubrimientos actualizados
+    """
+    filas = list(
+        queryset.exclude(estado=estado)
+        .select_for_update()
+        .order_by()
+        .values_list("id", "user_id", "estado")
+    )
+    if not filas:
+        return 0
+
+    DescubrimientoConflicto.objects.filter(id__in=[fila[0] for fila in filas]).update(
+        estado=estado, updated_at=timezone.now()
+    )
+
+    deltas_por_usuario: dict[int, dict[str, int]] = {}
+    for _, user_id, estado_anterior in filas:
+        deltas = deltas_por_usuario.setdefault(user_id, {estado: 0})
+        deltas[estado_anterior] = deltas.get(estado_anterior, 0) - 1
+        deltas[estado] += 1
+    for user_id, deltas in deltas_por_usuario.items():
+        ajustar_contador(user_id, deltas)
+
+    return len(filas)
+
+
+@transaction.atomic
+def triage_masivo(
+    user,
+    estado: str,
+    *,
+    ids: list[int] | None = None,
+    documento_id: int | None = None,
+    relevancia_menor_a: int | None = None,
+    estado_origen: str | None = None,
+) -> dict:
+    """
+    Cambia el estado de los descubrimientos del usuario elegidos por IDs y/o filtro.
+
+    Sin IDs, solo se mueven los pendientes (o los de estado_origen): un filtro
+    no debe mover lo que el usuario ya siguió o descartó.
+
+    Args:
+        user: Usuario dueño de los descubrimientos
+        estado: Nuevo estado (DescubrimientoConflicto.Estado)
+        ids: IDs de los descubrimientos a mover
+        documento_id: Solo los descubrimientos de este documento
+        relevancia_menor_a: Solo los de relevancia máxima menor a este umbral
+        estado_origen: Solo los que están en este estado
+
+    Returns:
+        Cantidad de descubrimientos actualizados y pendientes restantes
+    """
+    descubrimientos = DescubrimientoConflicto.objects.filter(user=user)
+    if ids is not None:
+        descubrimientos = descubrimientos.filter(id__in=ids)
+    if documento_id is not None:
+        descubrimientos = descubrimientos.filter(documento_id=documento_id)
+    if relevancia_menor_a is not None:
+        descubrimientos = descubrimientos.filter(
+            max_nivel_relevancia__lt=relevancia_menor_a
+        )
+    if estado_origen is None and ids is None:
+        estado_origen = DescubrimientoConflicto.Estado.PENDING
+    if estado_origen is not None:
+        descubrimientos = descubrimientos.filter(estado=estado_origen)
+
+    actualizados = cambiar_estado_masivo(descubrimientos, estado)
+
+    return {
+        "success": True,
+        "estado": estado,
+        "actualizados": actualizados,
+        "pendientes": obtener_contador(user).pendientes,
+    }
+
+
+@transaction.atomic
+def eliminar_documento(documento: Documento) -> None:
+    """
+    Elimina un documento con sus descubrimientos y descuenta el contador del usuario.
+
+    Args:
+        documento: Documento a eliminar
+    """
+    # Bloquea los descubrimientos para que un cambio de estado concurrente no
+    # altere los estados entre el conteo y el borrado
+    estados = (
+        documento.descubrimientos.select_for_update()
+        .order_by()
+        .values_list("estado", flat=True)
+    )
+    deltas: dict[str, int] = {}
+    for estado in estados:
+        deltas[estado] = deltas.get(estado, 0) - 1
+    documento.delete()
+    ajustar_contador(documento.user_id, deltas)
+
+
+@transaction.atomic
 def guardar_descubrimientos(
     documento: Documento,
     impactos: list[ProyectoLeyImpacto],
@@ -49,6 +405,10 @@ def guardar_descubrimientos(
     """
     Guarda los descubrimientos de conflictos en la base de datos.
 
+    Todos los descubrimientos e impactos se insertan en una sola transacción
+    con dos inserciones masivas, por lo que un análisis nunca queda guardado
+    a medias.
+
     Args:
         documento: Documento analizado
         impactos: Lista de ProyectoLeyImpacto detectados
@@ -56,22 +416,31 @@ def guardar_descubrimientos(
     Returns:
         Diccionario con documento y descubrimientos serializados
     """
-    descubrimientos_data = []
+    # Crear los descubrimientos (uno por proyecto) en una sola inserción
+    descubrimientos = DescubrimientoConflicto.objects.bulk_create(
+        [
+            DescubrimientoConflicto(
+                documento=documento,
+                user_id=documento.user_id,
+                proyecto_id=proyecto_impacto.proyecto_id,
+                proyecto_titulo=proyecto_impacto.proyecto_titulo,
+                max_nivel_relevancia=proyecto_impacto.max_nivel_relevancia,
+                descripcion_impacto_consolidada=proyecto_impacto.descripcion_impacto_consolidada,
+                cantidad_impactos=len(proyecto_impacto.impactos),
+            )
+            for proyecto_impacto in impactos
+        ]
+    )
 
-    for proyecto_impacto in impactos:
-        # Crear el descubrimiento (uno por proyecto)
-        descubrimiento = DescubrimientoConflicto.objects.create(
-            documento=documento,
-            proyecto_id=proyecto_impacto.proyecto_id,
-            proyecto_titulo=proyecto_impacto.proyecto_titulo,
-            max_nivel_relevancia=proyecto_impacto.max_nivel_relevancia,
-            descripcion_impacto_consolidada=proyecto_impacto.descripcion_impacto_consolidada,
-        )
+    ajustar_contador(
+        documento.user_id,
+        {DescubrimientoConflicto.Estado.PENDING: len(descubrimientos)},
+    )
 
-        # Crear los impactos individuales
-        cantidad_impactos = 0
-        for impacto in proyecto_impacto.impactos:
-            ImpactoDescubierto.objects.create(
+    # Crear todos los impactos individuales en una sola inserción
+    ImpactoDescubierto.objects.bulk_create(
+        [
+            ImpactoDescubierto(
                 descubrimiento=descubrimiento,
                 articulo_numero=impacto.articulo_numero,
                 extracto_interno=impacto.extracto_interno,
@@ -79,16 +448,22 @@ def guardar_descubrimientos(
                 nivel_relevancia=impacto.nivel_relevancia,
                 descripcion_impacto=impacto.descripcion_impacto,
             )
-            cantidad_impactos += 1
+            for descubrimiento, proyecto_impacto in zip(descubrimientos, impactos)
+            for impacto in proyecto_impacto.impactos
+        ]
+    )
 
-        descubrimientos_data.append({
+    descubrimientos_data = [
+        {
             "id": descubrimiento.id,
             "proyecto_id": descubrimiento.proyecto_id,
             "proyecto_titulo": descubrimiento.proyecto_titulo,
             "max_nivel_relevancia": descubrimiento.max_nivel_relevancia,
             "descripcion_impacto_consolidada": descubrimiento.descripcion_impacto_consolidada,
-            "cantidad_impactos": cantidad_impactos,
-        })
+            "cantidad_impactos": descubrimiento.cantidad_impactos,
+        }
+        for descubrimiento in descubrimientos
+    ]
 
     return {
         "documento_id": documento.id,
@@ -98,6 +473,14 @@ def guardar_descubrimientos(
     }
 
 
+async def aguardar_descubrimientos(
+    documento: Documento,
+    impactos: list[ProyectoLeyImpacto],
+) -> dict:
+    """Versión asíncrona de guardar_descubrimientos."""
+    return await sync_to_async(guardar_descubrimientos)(documento, impactos)
+
+
 async def detect_conflicts(pdf_content: bytes, nombre_documento: str = "", user=None) -> dict:
     """
     Detecta conflictos usando el agente LangGraph y guarda el descubrimiento.
@@ -110,27 +493,50 @@ async def detect_conflicts(pdf_content: bytes, nombre_documento: str = "", user=
     Returns:
         Diccionario con el documento, los descubrimientos y el conteo de pendientes
     """
-    # Crear el documento primero
-    documento = await sync_to_async(crear_documento)(nombre_documento, user)
+    # Extraer y normalizar el texto de cada página (o leerlo si ya se procesó)
+    content_hash, document_pages = await sync_to_async(obtener_paginas_documento)(
+        pdf_content
+    )
 
-    # Extraer texto de cada página del PDF
-    document_pages = await sync_to_async(extract_text_from_pdf)(pdf_content)
+    # Crear el documento
+    documento = await sync_to_async(crear_documento)(
+        nombre_documento, user, content_hash
+    )
+    registrar_etapa(
+        documento,
+        user,
+        "documento_creado",
+        "Documento cargado",
+        paginas=len(document_pages),
+        content_hash=content_hash,
+    )
 
     # Ejecutar el agente de forma asíncrona usando sync_to_async
+    inicio = time.perf_counter()
     impactos = await sync_to_async(run_agent)(document_pages)
+    registrar_etapa(
+        documento,
+        user,
+        "agente_completado",
+        "Análisis del agente completado",
+        proyectos=len(impactos),
+        duracion_ms=round((time.perf_counter() - inicio) * 1000),
+    )
 
     # Guardar los descubrimientos en la base de datos
-    result = await sync_to_async(guardar_descubrimientos)(documento, impactos)
+    result = await aguardar_descubrimientos(documento, impactos)
+    registrar_etapa(
+        documento,
+        user,
+        "descubrimientos_guardados",
+        "Descubrimientos guardados",
+        descubrimientos=len(result["descubrimientos"]),
+    )
 
-    # Contar descubrimientos pendientes del usuario
-    pending_count = await sync_to_async(
-        lambda: DescubrimientoConflicto.objects.filter(
-            documento__user=user,
-            estado=DescubrimientoConflicto.Estado.PENDING
-        ).count()
-    )()
+    # Leer el contador de descubrimientos pendientes del usuario
+    contador = await aobtener_contador(user)
 
     # Agregar el conteo al resultado
-    result["pending_discoveries_count"] = pending_count
+    result["pending_discoveries_count"] = contador.pendientes
 
     return result
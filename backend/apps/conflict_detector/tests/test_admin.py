@@ -0,0 +1,84 @@
+"""Tests del admin: los cambios deben mantener el contador de descubrimientos."""
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from apps.conflict_detector.models import DescubrimientoConflicto, Documento
+from apps.conflict_detector.services import obtener_contador, recalcular_contador
+
+Estado = DescubrimientoConflicto.Estado
+
+
+class AdminContadorTests(TestCase):
+    def setUp(self):
+        self.admin_user = get_user_model().objects.create_superuser(
+            email="admin@example.com", password="x"
+        )
+        self.user = get_user_model().objects.create_user(
+            email="dueno@example.com", password="x"
+        )
+        self.documento = Documento.objects.create(user=self.user, nombre="doc.pdf")
+        self.descubrimientos = [
+            DescubrimientoConflicto.objects.create(
+                documento=self.documento,
+                user=self.user,
+                proyecto_titulo="Proyecto",
+                estado=estado,
+            )
+            for estado in [Estado.PENDING, Estado.PENDING, Estado.TRACKING]
+        ]
+        recalcular_contador(self.user.pk)
+        self.client.force_login(self.admin_user)
+
+    def _contador(self) -> tuple[int, int, int]:
+        contador = obtener_contador(self.user)
+        return contador.pendientes, contador.en_seguimiento, contador.descartados
+
+    def test_eliminar_documento(self):
+        response = self.client.post(
+            reverse(
+                "admin:conflict_detector_documento_delete", args=[self.documento.pk]
+            ),
+            {"post": "yes"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._contador(), (0, 0, 0))
+
+    def test_eliminar_documentos_en_lote(self):
+        response = self.client.post(
+            reverse("admin:conflict_detector_documento_changelist"),
+            {
+                "action": "delete_selected",
+                "_selected_action": [self.documento.pk],
+                "post": "yes",
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._contador(), (0, 0, 0))
+
+    def test_eliminar_descubrimiento(self):
+        response = self.client.post(
+            reverse(
+                "admin:conflict_detector_descubrimientoconflicto_delete",
+                args=[self.descubrimientos[2].pk],
+            ),
+            {"post": "yes"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._contador(), (2, 0, 0))
+
+    def test_cambiar_estado(self):
+        model_admin = admin.site._registry[DescubrimientoConflicto]
+        request = RequestFactory().post("/")
+        request.user = self.admin_user
+        descubrimiento = self.descubrimientos[0]
+        descubrimiento.estado = Estado.DISCARDED
+
+        model_admin.save_model(request, descubrimiento, form=None, change=True)
+
+        self.assertEqual(self._contador(), (1, 1, 1))
@@ -0,0 +1,47 @@
+"""Tests del contador de descubrimientos por estado."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.conflict_detector.models import DescubrimientoConflicto, Documento
+from apps.conflict_detector.services import (
+    eliminar_documento,
+    obtener_contador,
+    recalcular_contador,
+)
+
+Estado = DescubrimientoConflicto.Estado
+
+
+class EliminarDocumentoTests(TestCase):
+    def test_descuenta_los_descubrimientos_por_estado(self):
+        user = get_user_model().objects.create_user(
+            email="contador@example.com", password="x"
+        )
+        documentos = [
+            Documento.objects.create(user=user, nombre=f"doc{n}.pdf") for n in range(2)
+        ]
+        for documento, estados in zip(
+            documentos,
+            [
+                [Estado.PENDING, Estado.PENDING, Estado.TRACKING, Estado.DISCARDED],
+                [Estado.PENDING, Estado.TRACKING],
+            ],
+        ):
+            for estado in estados:
+                DescubrimientoConflicto.objects.create(
+                    documento=documento,
+                    user=user,
+                    proyecto_titulo="Proyecto",
+                    estado=estado,
+                )
+        recalcular_contador(user.pk)
+
+        eliminar_documento(documentos[0])
+
+        contador = obtener_contador(user)
+        self.assertEqual(
+            (contador.pendientes, contador.en_seguimiento, contador.descartados),
+            (1, 1, 0),
+        )
+        self.assertEqual(contador.pendientes, recalcular_contador(user.pk).pendientes)
@@ -0,0 +1,88 @@
+"""Tests de regresión: las bandejas de descubrimientos deben usar sus índices."""
+
+from django.contrib.auth import get_user_model
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.conflict_detector.models import DescubrimientoConflicto, Documento
+from services.pagination import CursorPage, paginate_queryset
+
+
+def _indice(campos: list[str]) -> str:
+    """Nombre del índice de DescubrimientoConflicto con los campos dados."""
+    for indice in DescubrimientoConflicto._meta.indexes:
+        if list(indice.fields) == campos:
+            return indice.name
+    msg = f"No existe un índice sobre {campos}"
+    raise AssertionError(msg)
+
+
+# Los planes de otros motores no nombran los índices igual ni ordenan igual
+@skipUnless(connection.vendor == "postgresql", "Requiere PostgreSQL")
+class IndicesBandejaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="bandeja@example.com", password="x"
+        )
+        documento = Documento.objects.create(user=cls.user, nombre="doc.pdf")
+        DescubrimientoConflicto.objects.bulk_create(
+            DescubrimientoConflicto(
+                documento=documento,
+                user=cls.user,
+                proyecto_titulo=f"Proyecto {n}",
+                max_nivel_relevancia=n * 10 % 100,
+                estado=estado,
+            )
+            for n in range(30)
+            for estado in DescubrimientoConflicto.Estado.values
+        )
+
+    def _paginar(
+        self, queryset, ordering: tuple[str, ...], cursor: str | None = None
+    ) -> tuple[CursorPage, str]:
+        """Pide una página y devuelve también el plan de la consulta que ejecutó."""
+        with CaptureQueriesContext(connection) as consultas:
+            pagina = paginate_queryset(
+                queryset, ordering=ordering, cursor=cursor, limit=20
+            )
+        with connection.cursor() as cursor_db:
+            # Con tablas tan pequeñas el planner preferiría un seq scan
+            cursor_db.execute("SET LOCAL enable_seqscan = off")
+            cursor_db.execute(f"EXPLAIN {consultas.captured_queries[-1]['sql']}")
+            plan = "\n".join(fila[0] for fila in cursor_db.fetchall())
+        return pagina, plan
+
+    def assertPaginasUsanIndiceSinOrdenar(
+        self, queryset, ordering: tuple[str, ...]
+    ):
+        indice = _indice(["user", "estado", *ordering])
+        primera, plan = self._paginar(queryset, ordering)
+        self.assertIsNotNone(primera.next_cursor)
+        _, plan_siguiente = self._paginar(queryset, ordering, primera.next_cursor)
+
+        for plan_pagina in (plan, plan_siguiente):
+            self.assertIn(indice, plan_pagina)
+            # El índice ya entrega las filas en el orden de la página
+            self.assertNotIn("Sort", plan_pagina)
+
+    def test_bandeja_pendientes_usa_indice_por_relevancia(self):
+        # Misma consulta que list_discoveries
+        self.assertPaginasUsanIndiceSinOrdenar(
+            DescubrimientoConflicto.objects.select_related("documento").filter(
+                user=self.user, estado=DescubrimientoConflicto.Estado.PENDING
+            ),
+            ("-max_nivel_relevancia", "-id"),
+        )
+
+    def test_bandeja_seguimiento_usa_indice_por_fecha(self):
+        # Misma consulta que list_tracking_discoveries
+        self.assertPaginasUsanIndiceSinOrdenar(
+            DescubrimientoConflicto.objects.select_related(
+                "documento", "proyecto"
+            ).filter(user=self.user, estado=DescubrimientoConflicto.Estado.TRACKING),
+            ("-fecha_analisis", "-id"),
+        )
@@ -0,0 +1,55 @@
+"""Tests de la normalización del texto de los PDFs."""
+
+from unittest import TestCase
+
+from apps.conflict_detector.text_cleaning import _clave_repeticion, normalizar_paginas
+
+CUERPO = (
+    "El presente proyecto modifica las normas sobre transparencia y acceso a la "
+    "información pública de los órganos de la Administración del Estado."
+)
+
+
+class ClaveRepeticionTests(TestCase):
+    def test_numeros_de_encabezados_distinguen_lineas(self):
+        self.assertNotEqual(
+            _clave_repeticion("TÍTULO 1"), _clave_repeticion("TÍTULO 2")
+        )
+        self.assertNotEqual(
+            _clave_repeticion("Artículo 3"), _clave_repeticion("Artículo 4")
+        )
+
+    def test_numeros_de_pagina_se_ignoran(self):
+        for primera, segunda in [
+            ("Boletín 12.345-07 - Página 4", "Boletín 12.345-07 - Página 5"),
+            ("Cámara pág. 3 de 10", "Cámara pág. 4 de 10"),
+            ("Informe - 3 -", "Informe - 4 -"),
+            ("Senado 3/10", "Senado 4/10"),
+        ]:
+            with self.subTest(primera=primera):
+                self.assertEqual(_clave_repeticion(primera), _clave_repeticion(segunda))
+
+
+class NormalizarPaginasTests(TestCase):
+    def test_conserva_titulos_y_articulos_numerados(self):
+        paginas = [
+            f"TÍTULO {n}\nArtículo {n}\n{CUERPO}\nArtículo {n + 10}"
+            for n in range(1, 7)
+        ]
+
+        resultado = normalizar_paginas(paginas)
+
+        for n, pagina in enumerate(resultado.paginas, start=1):
+            self.assertIn(f"TÍTULO {n}", pagina)
+            self.assertIn(f"Artículo {n}\n", pagina)
+            self.assertIn(f"Artículo {n + 10}", pagina)
+
+    def test_elimina_encabezados_y_pies_repetidos(self):
+        paginas = [
+            f"Boletín N° 12.345-07\n{CUERPO}\nCámara de Diputados - Página {n} de 6"
+            for n in range(1, 7)
+        ]
+
+        resultado = normalizar_paginas(paginas)
+
+        self.assertEqual(resultado.paginas, [CUERPO] * 6)
@@ -0,0 +1,116 @@
+"""Tests del cambio de estado masivo de descubrimientos."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.conflict_detector.models import DescubrimientoConflicto, Documento
+from apps.conflict_detector.services import (
+    obtener_contador,
+    recalcular_contador,
+    triage_masivo,
+)
+
+Estado = DescubrimientoConflicto.Estado
+
+
+class TriageMasivoTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="triage@example.com", password="x"
+        )
+        self.documento = Documento.objects.create(user=self.user, nombre="doc.pdf")
+        self.descubrimientos = {
+            estado: DescubrimientoConflicto.objects.create(
+                documento=self.documento,
+                user=self.user,
+                proyecto_titulo=estado,
+                max_nivel_relevancia=10,
+                estado=estado,
+            )
+            for estado in Estado.values
+        }
+        recalcular_contador(self.user.pk)
+
+    def _estados(self) -> dict[str, str]:
+        return {
+            estado: DescubrimientoConflicto.objects.get(pk=desc.pk).estado
+            for estado, desc in self.descubrimientos.items()
+        }
+
+    def test_filtro_solo_mueve_pendientes(self):
+        resultado = triage_masivo(
+            self.user,
+            Estado.DISCARDED,
+            documento_id=self.documento.id,
+            relevancia_menor_a=50,
+        )
+
+        self.assertEqual(resultado["actualizados"], 1)
+        self.assertEqual(
+            self._estados(),
+            {
+                Estado.PENDING: Estado.DISCARDED,
+                Estado.TRACKING: Estado.TRACKING,
+                Estado.DISCARDED: Estado.DISCARDED,
+            },
+        )
+        contador = obtener_contador(self.user)
+        self.assertEqual(
+            (contador.pendientes, contador.en_seguimiento, contador.descartados),
+            (0, 1, 2),
+        )
+
+    def test_filtro_con_estado_origen(self):
+        resultado = triage_masivo(
+            self.user,
+            Estado.TRACKING,
+            documento_id=self.documento.id,
+            estado_origen=Estado.DISCARDED,
+        )
+
+        self.assertEqual(resultado["actualizados"], 1)
+        self.assertEqual(self._estados()[Estado.DISCARDED], Estado.TRACKING)
+        self.assertEqual(self._estados()[Estado.PENDING], Estado.PENDING)
+
+    def test_ids_explicitos_mueven_cualquier_estado(self):
+        resultado = triage_masivo(
+            self.user,
+            Estado.TRACKING,
+            ids=[desc.pk for desc in self.descubrimientos.values()],
+        )
+
+        self.assertEqual(resultado["actualizados"], 2)
+        self.assertEqual(set(self._estados().values()), {Estado.TRACKING})
+
+    def test_endpoint_descarta_por_filtro(self):
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            "/api/conflict-detector/discoveries/bulk/discard",
+            {"documento_id": self.documento.id},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "success": True,
+                "estado": Estado.DISCARDED,
+                "actualizados": 1,
+                "pendientes": 0,
+            },
+        )
+        self.assertEqual(self._estados()[Estado.TRACKING], Estado.TRACKING)
+
+    def test_endpoint_sin_criterio_es_invalido(self):
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            "/api/conflict-detector/discoveries/bulk/track",
+            {},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self._estados()[Estado.PENDING], Estado.PENDING)
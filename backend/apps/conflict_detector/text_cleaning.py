@@ -0,0 +1,238 @@
+"""Normalización del texto extraído de los PDFs.
+
+Limpia las páginas obtenidas con ``page.get_text()`` antes de generar
+embeddings y de enviarlas a los prompts del LLM:
+
+- Elimina encabezados y pies de página repetidos entre páginas
+- Elimina números de página sueltos
+- Une palabras cortadas con guion al final de línea
+- Colapsa espacios y líneas en blanco
+- Omite páginas de índice / tabla de contenidos y páginas casi vacías
+
+Las páginas omitidas se reemplazan por un string vacío para conservar la
+numeración original (``detectar_conflictos`` ya ignora páginas vacías).
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Versión del algoritmo de normalización (cambiarla invalida textos persistidos)
+NORMALIZACION_VERSION = 2
+
+# Mínimo de páginas para detectar encabezados/pies repetidos
+MIN_PAGINAS_REPETICION = 3
+# Fracción de páginas en que debe aparecer una línea para considerarla repetida
+UMBRAL_REPETICION = 0.5
+# Largo máximo de una línea candidata a encabezado/pie
+MAX_LARGO_LINEA_REPETIDA = 120
+# Líneas al inicio y al final de cada página donde se buscan encabezados/pies
+LINEAS_BORDE_PAGINA = 3
+# Páginas con menos caracteres útiles que esto se consideran vacías
+MIN_CARACTERES_PAGINA = 80
+# Fracción de líneas con formato de índice para omitir la página
+UMBRAL_LINEAS_INDICE = 0.5
+
+_RE_ESPACIOS = re.compile(r"[ \t\u00a0\u2000-\u200b]+")
+# Números de página dentro de un encabezado/pie ("Página 3 de 10", "- 3 -", "3/10")
+_RE_FRAGMENTO_NUMERO_PAGINA = re.compile(
+    r"p[aá]g(ina)?\.?\s*\d{1,4}(\s*(de|/)\s*\d{1,4})?"
+    r"|[-–—]\s*\d{1,4}\s*[-–—]"
+    r"|\b\d{1,4}\s*/\s*\d{1,4}$",
+    re.IGNORECASE,
+)
+_RE_NUMERO_PAGINA = re.compile(
+    r"^(p[aá]g(ina)?\.?\s*)?[-–—]?\s*\d{1,3}\s*[-–—]?(\s*(de|/)\s*\d{1,3})?$",
+    re.IGNORECASE,
+)
+_RE_LINEA_INDICE = re.compile(r"(\.{3,}|…{2,}|(\s\.){3,})\s*\d{1,4}$")
+_RE_TITULO_INDICE = re.compile(
+    r"^(í|i)ndice|^tabla de contenidos?|^contenidos?$", re.IGNORECASE
+)
+_RE_GUION_FINAL = re.compile(r"(\w)[-\u2010]$")
+
+
+class EstadisticaPagina(NamedTuple):
+    """Estadísticas de normalización de una página.
+
+    Attributes:
+        pagina_numero: Índice de la página en el documento.
+        bytes_originales: Tamaño en bytes (UTF-8) del texto extraído.
+        bytes_eliminados: Bytes eliminados por la normalización.
+        omitida: Motivo por el que se omitió la página, o None.
+    """
+
+    pagina_numero: int
+    bytes_originales: int
+    bytes_eliminados: int
+    omitida: str | None = None
+
+
+class ResultadoNormalizacion(NamedTuple):
+    """Páginas normalizadas junto a sus estadísticas."""
+
+    paginas: list[str]
+    estadisticas: list[EstadisticaPagina]
+
+
+def _limpiar_linea(linea: str) -> str:
+    """Colapsa espacios de una línea y elimina espacios en los extremos."""
+    return _RE_ESPACIOS.sub(" ", linea).strip()
+
+
+def _clave_repeticion(linea: str) -> str:
+    """
+    Clave para comparar líneas entre páginas.
+
+    Las líneas se comparan por su texto exacto, salvo los números de página:
+    "TÍTULO 1" y "TÍTULO 2" son líneas distintas, mientras que
+    "Boletín 123 - Página 4" y "Boletín 123 - Página 5" son el mismo pie.
+    """
+    return _RE_FRAGMENTO_NUMERO_PAGINA.sub("#", linea)
+
+
+def _lineas_borde(lineas: list[str]) -> list[str]:
+    """Retorna las primeras y últimas líneas no vacías de una página."""
+    no_vacias = [linea for linea in lineas if linea]
+    if len(no_vacias) <= 2 * LINEAS_BORDE_PAGINA:
+        return no_vacias
+    return no_vacias[:LINEAS_BORDE_PAGINA] + no_vacias[-LINEAS_BORDE_PAGINA:]
+
+
+def _detectar_lineas_repetidas(paginas_lineas: list[list[str]]) -> set[str]:
+    """
+    Detecta encabezados y pies de página repetidos entre páginas.
+
+    Args:
+        paginas_lineas: Líneas limpias de cada página
+
+    Returns:
+        Conjunto de claves de repetición de las líneas a eliminar
+    """
+    paginas_con_texto = [lineas for lineas in paginas_lineas if lineas]
+    if len(paginas_con_texto) < MIN_PAGINAS_REPETICION:
+        return set()
+
+    conteo: Counter[str] = Counter()
+    for lineas in paginas_con_texto:
+        conteo.update(
+            {
+                _clave_repeticion(linea)
+                for linea in _lineas_borde(lineas)
+                if len(linea) <= MAX_LARGO_LINEA_REPETIDA
+            }
+        )
+
+    minimo = max(MIN_PAGINAS_REPETICION, UMBRAL_REPETICION * len(paginas_con_texto))
+    return {clave for clave, cantidad in conteo.items() if cantidad >= minimo}
+
+
+def _es_pagina_indice(lineas: list[str]) -> bool:
+    """Indica si la página corresponde a un índice o tabla de contenidos."""
+    lineas_no_vacias = [linea for linea in lineas if linea]
+    if not lineas_no_vacias:
+        return False
+
+    lineas_indice = sum(
+        1 for linea in lineas_no_vacias if _RE_LINEA_INDICE.search(linea)
+    )
+    proporcion = lineas_indice / len(lineas_no_vacias)
+
+    if _RE_TITULO_INDICE.match(lineas_no_vacias[0]):
+        return proporcion >= UMBRAL_LINEAS_INDICE / 2
+    return proporcion >= UMBRAL_LINEAS_INDICE
+
+
+def _unir_lineas(lineas: list[str]) -> str:
+    """Une las líneas de una página reparando guiones y líneas en blanco."""
+    resultado: list[str] = []
+    for linea in lineas:
+        if not linea:
+            if resultado and resultado[-1]:
+                resultado.append("")
+            continue
+
+        anterior = resultado[-1] if resultado else ""
+        if anterior and _RE_GUION_FINAL.search(anterior) and linea[0].islower():
+            # Palabra cortada con guion al final de la línea anterior
+            resultado[-1] = anterior[:-1] + linea
+        else:
+            resultado.append(linea)
+
+    return "\n".join(resultado).strip()
+
+
+def normalizar_paginas(paginas: list[str]) -> ResultadoNormalizacion:
+    """
+    Normaliza el texto de las páginas de un documento.
+
+    Args:
+        paginas: Texto de cada página tal como lo entrega PyMuPDF
+
+    Returns:
+        ResultadoNormalizacion con las páginas limpias (vacías si se omitieron)
+        y las estadísticas por página
+    """
+    paginas_lineas = [
+        [_limpiar_linea(linea) for linea in (pagina or "").splitlines()]
+        for pagina in paginas
+    ]
+    lineas_repetidas = _detectar_lineas_repetidas(paginas_lineas)
+
+    paginas_limpias: list[str] = []
+    estadisticas: list[EstadisticaPagina] = []
+
+    for idx, (pagina, lineas) in enumerate(zip(paginas, paginas_lineas)):
+        bytes_originales = len((pagina or "").encode("utf-8"))
+        omitida = None
+
+        if _es_pagina_indice(lineas):
+            texto = ""
+            omitida = "indice"
+        else:
+            borde = set(_lineas_borde(lineas))
+            lineas = [
+                linea
+                for linea in lineas
+                if not (
+                    linea in borde
+                    and (
+                        _RE_NUMERO_PAGINA.match(linea)
+                        or _clave_repeticion(linea) in lineas_repetidas
+                    )
+                )
+            ]
+            texto = _unir_lineas(lineas)
+            if len(texto) < MIN_CARACTERES_PAGINA:
+                texto = ""
+                omitida = "vacia"
+
+        paginas_limpias.append(texto)
+        estadisticas.append(
+            EstadisticaPagina(
+                pagina_numero=idx,
+                bytes_originales=bytes_originales,
+                bytes_eliminados=bytes_originales - len(texto.encode("utf-8")),
+                omitida=omitida,
+            )
+        )
+
+    total_original = sum(e.bytes_originales for e in estadisticas)
+    total_eliminado = sum(e.bytes_eliminados for e in estadisticas)
+    omitidas = sum(1 for e in estadisticas if e.omitida)
+    logger.info(
+        f"Normalización: {len(paginas)} páginas, {omitidas} omitidas, "
+        f"{total_eliminado}/{total_original} bytes eliminados "
+        f"({(total_eliminado / total_original * 100) if total_original else 0:.1f}%)"
+    )
+    for estadistica in estadisticas:
+        logger.debug(
+            f"Página {estadistica.pagina_numero}: "
+            f"{estadistica.bytes_eliminados}/{estadistica.bytes_originales} bytes "
+            f"eliminados (omitida: {estadistica.omitida})"
+        )
+
+    return ResultadoNormalizacion(paginas=paginas_limpias, estadisticas=estadisticas)
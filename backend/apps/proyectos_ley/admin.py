@@ -1,6 +1,7 @@
 """Admin configuration for proyectos_ley app."""
 
 from django.contrib import admin
+from django.db.models import Count
 
 from .models import Articulo, ProyectoLey
 
@@ -43,6 +44,11 @@ class ProyectoLeyAdmin(admin.ModelAdmin):
         ("Metadatos", {"fields": ("created_at", "updated_at"), "classes": ("collapse",)}),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _articulos_count=Count("articulos")
+        )
+
     def titulo_truncado(self, obj):
         """Return truncated title."""
         return obj.titulo[:60] + "..." if len(obj.titulo) > 60 else obj.titulo
@@ -51,9 +57,10 @@ class ProyectoLeyAdmin(admin.ModelAdmin):
 
     def articulos_count(self, obj):
         """Return count of articulos."""
-        return obj.articulos.count()
+        return obj._articulos_count
 
     articulos_count.short_description = "Artículos"
+    articulos_count.admin_order_field = "_articulos_count"
 
 
 @admin.register(Articulo)
@@ -4,9 +4,15 @@ Proyectos de Ley API
 This module implements the HTTP endpoints for accessing proyectos de ley.
 """
 
+from django.db.models import Count
 from ninja import Query, Router, Schema
+from ninja.decorators import decorate_view
+
+from services.http_cache import cache_response
+from services.pagination import apaginate_queryset
 
 from .models import Articulo, ProyectoLey
+from .services import CORPUS_CACHE_NAMESPACE
 
 
 class ArticuloOut(Schema):
@@ -52,6 +58,7 @@ class ProyectosLeyResponse(Schema):
 
     proyectos: list[ProyectoLeyOut]
     total: int
+    next_cursor: str | None = None
 
 
 class ArticulosResponse(Schema):
@@ -59,6 +66,7 @@ class ArticulosResponse(Schema):
 
     articulos: list[ArticuloOut]
     total: int
+    next_cursor: str | None = None
 
 
 class ProyectoLeyFilters(Schema):
@@ -66,6 +74,7 @@ class ProyectoLeyFilters(Schema):
 
     page_size: int = 100
     offset: int = 0
+    cursor: str | None = None
     camara_origen: str | None = None
     etapa: int | None = None
     urgencia_actual: str | None = None
@@ -76,20 +85,26 @@ class ArticuloFilters(Schema):
 
     page_size: int = 100
     offset: int = 0
+    cursor: str | None = None
     proyecto_id: str | None = None
     tipo: str | None = None
 
 
 router = Router(auth=None)  # Public endpoint - no authentication required
 
+# Responses are cached per query string and invalidated on every corpus change
+cached = decorate_view(cache_response(CORPUS_CACHE_NAMESPACE))
+
 
 @router.get("/", response=ProyectosLeyResponse)
+@cached
 async def list_proyectos_ley(request, filters: ProyectoLeyFilters = Query(...)):  # noqa: B008
     """
     List all proyectos de ley.
 
     - Ordered by fecha descending (most recent first)
     - Page size = 100 by default
+    - Pass the returned next_cursor as cursor to fetch the next page
     - Optional filters: camara_origen, etapa, urgencia_actual
     """
     queryset = ProyectoLey.objects.all()
@@ -102,11 +117,16 @@ async def list_proyectos_ley(request, filters: ProyectoLeyFilters = Query(...)):
         queryset = queryset.filter(urgencia_actual=filters.urgencia_actual)
 
     total = await queryset.acount()
-    proyectos_qs = queryset[filters.offset : filters.offset + filters.page_size]
+    page = await apaginate_queryset(
+        queryset.annotate(articulos_count=Count("articulos")),
+        ordering=("-fecha", "-id"),
+        cursor=filters.cursor,
+        limit=filters.page_size,
+        offset=filters.offset,
+    )
 
     proyectos = []
-    async for proyecto in proyectos_qs:
-        articulos_count = await proyecto.articulos.acount()
+    for proyecto in page.items:
         proyectos.append(
             ProyectoLeyOut(
                 id=proyecto.id,
@@ -117,14 +137,17 @@ async def list_proyectos_ley(request, filters: ProyectoLeyFilters = Query(...)):
                 etapa=proyecto.etapa,
                 urgencia_actual=proyecto.urgencia_actual,
                 fecha=proyecto.fecha.isoformat(),
-                articulos_count=articulos_count,
+                articulos_count=proyecto.articulos_count,
             )
         )
 
-    return ProyectosLeyResponse(proyectos=proyectos, total=total)
+    return ProyectosLeyResponse(
+        proyectos=proyectos, total=total, next_cursor=page.next_cursor
+    )
 
 
 @router.get("/{proyecto_id}", response=ProyectoLeyDetailOut)
+@cached
 async def get_proyecto_ley(request, proyecto_id: str):
     """
     Get a specific proyecto de ley by its proyecto_id.
@@ -164,14 +187,17 @@ async def get_proyecto_ley(request, proyecto_id: str):
 
 
 @router.get("/articulos/", response=ArticulosResponse)
+@cached
 async def list_articulos(request, filters: ArticuloFilters = Query(...)):  # noqa: B008
     """
     List articulos with optional filters.
 
+    - Ordered by proyecto and numero
     - Page size = 100 by default
+    - Pass the returned next_cursor as cursor to fetch the next page
     - Optional filters: proyecto_id, tipo
     """
-    queryset = Articulo.objects.select_related("proyecto").all()
+    queryset = Articulo.objects.all()
 
     if filters.proyecto_id:
         queryset = queryset.filter(proyecto__proyecto_id=filters.proyecto_id)
@@ -179,10 +205,16 @@ async def list_articulos(request, filters: ArticuloFilters = Query(...)):  # noq
         queryset = queryset.filter(tipo=filters.tipo)
 
     total = await queryset.acount()
-    articulos_qs = queryset[filters.offset : filters.offset + filters.page_size]
+    page = await apaginate_queryset(
+        queryset,
+        ordering=("proyecto_id", "numero"),
+        cursor=filters.cursor,
+        limit=filters.page_size,
+        offset=filters.offset,
+    )
 
     articulos = []
-    async for articulo in articulos_qs:
+    for articulo in page.items:
         articulos.append(
             ArticuloOut(
                 id=articulo.id,
@@ -193,4 +225,6 @@ async def list_articulos(request, filters: ArticuloFilters = Query(...)):  # noq
             )
         )
 
-    return ArticulosResponse(articulos=articulos, total=total)
+    return ArticulosResponse(
+        articulos=articulos, total=total, next_cursor=page.next_cursor
+    )
@@ -1,6 +1,7 @@
 """App configuration for proyectos_ley."""
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ProyectosLeyConfig(AppConfig):
@@ -9,3 +10,8 @@ class ProyectosLeyConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.proyectos_ley"
     verbose_name = "Proyectos de Ley"
+
+    def ready(self):
+        from . import signals
+
+        post_migrate.connect(signals.invalidar_cache_post_migrate, sender=self)
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proyectos_ley', '0002_load_initial_data'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proyectoley',
+            index=models.Index(fields=['-fecha', '-id'], name='proyectos_l_fecha_998d26_idx'),
+        ),
+    ]
@@ -34,6 +34,9 @@ class ProyectoLey(models.Model):
         verbose_name = "Proyecto de Ley"
         verbose_name_plural = "Proyectos de Ley"
         ordering = ["-fecha"]
+        indexes = [
+            models.Index(fields=["-fecha", "-id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.proyecto_id} - {self.titulo[:50]}"
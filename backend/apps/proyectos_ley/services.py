@@ -0,0 +1,21 @@
+"""Servicios para proyectos de ley."""
+
+from services.cache import abump_version, bump_version
+
+# Namespace de cache HTTP de los endpoints públicos de proyectos de ley
+CORPUS_CACHE_NAMESPACE = "proyectos_ley"
+
+
+def invalidar_cache_corpus() -> None:
+    """
+    Incrementa la versión del corpus, invalidando las respuestas cacheadas.
+
+    Debe llamarse tras cualquier ingesta o modificación de proyectos o
+    artículos que no pase por save()/delete() (e.g. ``QuerySet.update``).
+    """
+    bump_version(CORPUS_CACHE_NAMESPACE)
+
+
+async def ainvalidar_cache_corpus() -> None:
+    """Versión async de invalidar_cache_corpus."""
+    await abump_version(CORPUS_CACHE_NAMESPACE)
@@ -0,0 +1,22 @@
+"""Signals para proyectos de ley."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Articulo, ProyectoLey
+from .services import invalidar_cache_corpus
+
+
+@receiver(post_save, sender=ProyectoLey)
+@receiver(post_delete, sender=ProyectoLey)
+@receiver(post_save, sender=Articulo)
+@receiver(post_delete, sender=Articulo)
+def invalidar_cache_en_cambios(sender, **kwargs):
+    """Invalida el cache HTTP del corpus cuando cambia un proyecto o artículo."""
+    invalidar_cache_corpus()
+
+
+def invalidar_cache_post_migrate(sender, **kwargs):
+    """Invalida el cache HTTP del corpus tras migraciones (pueden cargar datos)."""
+    invalidar_cache_corpus()
+
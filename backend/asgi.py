@@ -13,4 +13,35 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after setup: these modules read settings and models at import time
+from apps.auditlog.websocket import WEBSOCKET_PATH, auditlog_websocket  # noqa: E402
+from apps.auditlog.writer import audit_log_writer  # noqa: E402
+
+
+async def lifespan(scope, receive, send):
+    """Start the audit log writer and flush it before the worker exits."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await audit_log_writer.start()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await audit_log_writer.close()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    # Django only speaks HTTP, so lifespan and WebSocket scopes are handled here
+    if scope["type"] == "lifespan":
+        await lifespan(scope, receive, send)
+    elif scope["type"] == "websocket":
+        if scope["path"] == WEBSOCKET_PATH:
+            await auditlog_websocket(scope, receive, send)
+        else:
+            await receive()
+            await send({"type": "websocket.close"})
+    else:
+        await django_application(scope, receive, send)
@@ -48,6 +48,40 @@ class CeleryConfig(Config):
     BEAT_SCHEDULER: str = "django_celery_beat.schedulers:DatabaseScheduler"
 
 
+class DatabaseConfig(Config):
+    """Database connection configuration"""
+
+    POOL_ENABLED: bool = True
+    POOL_MIN_SIZE: int = 2
+    POOL_MAX_SIZE: int = 10
+    POOL_TIMEOUT: float = 10.0
+    POOL_MAX_IDLE: float = 300.0
+    CONN_MAX_AGE: int = 60
+    CONN_HEALTH_CHECKS: bool = True
+
+
+class CacheConfig(Config):
+    """Cache configuration"""
+
+    REDIS_URL: str = ""
+    FILE_LOCATION: str = "/tmp/django_cache"
+    KEY_PREFIX: str = ""
+    DEFAULT_TIMEOUT: int = 300
+    MAX_ENTRIES: int = 10000
+
+
+class AuditlogConfig(Config):
+    """Audit log buffered writer configuration"""
+
+    WRITER_BATCH_SIZE: int = 500
+    WRITER_FLUSH_INTERVAL: float = 1.0
+    WRITER_QUEUE_SIZE: int = 10000
+    WRITER_SPILL_PATH: str = "/tmp/auditlog_spill.ndjson"
+    PARTITIONS_AHEAD: int = 3
+    RETENTION_MONTHS: int = 0
+    ARCHIVE_DIR: str = "/tmp/auditlog_archive"
+
+
 class EmailConfig(Config):
     """Email configuration"""
 
@@ -74,6 +108,9 @@ django_config = DjangoConfig.load(prefix="DJANGO")
 email_config = EmailConfig.load(prefix="")
 project_config = ProjectConfig.load(prefix="PROJECT")
 celery_config = CeleryConfig.load(prefix="CELERY")
+cache_config = CacheConfig.load(prefix="CACHE")
+database_config = DatabaseConfig.load(prefix="DATABASE")
+auditlog_config = AuditlogConfig.load(prefix="AUDITLOG")
 
 #############################
 # GENERAL
@@ -98,6 +135,24 @@ USE_X_FORWARDED_HOST = True
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 DATABASES = {"default": dj_database_url.parse(django_config.DATABASE_URL)}
 
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    if database_config.POOL_ENABLED:
+        # psycopg3 connection pool per process; incompatible with CONN_MAX_AGE
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"] = {
+            **DATABASES["default"].get("OPTIONS", {}),
+            "pool": {
+                "min_size": database_config.POOL_MIN_SIZE,
+                "max_size": database_config.POOL_MAX_SIZE,
+                "timeout": database_config.POOL_TIMEOUT,
+                "max_idle": database_config.POOL_MAX_IDLE,
+            },
+        }
+    else:
+        # Persistent connections, checked before being reused by a request
+        DATABASES["default"]["CONN_MAX_AGE"] = database_config.CONN_MAX_AGE
+        DATABASES["default"]["CONN_HEALTH_CHECKS"] = database_config.CONN_HEALTH_CHECKS
+
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -318,12 +373,35 @@ EMAIL_TIMEOUT = 5
 # CACHING
 #############################
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "",
-    },
-}
+# Shared between workers: Redis when CACHE_REDIS_URL is set, otherwise a
+# file-based cache on local disk
+if cache_config.REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": cache_config.REDIS_URL,
+            "KEY_PREFIX": cache_config.KEY_PREFIX,
+            "TIMEOUT": cache_config.DEFAULT_TIMEOUT,
+            "OPTIONS": {
+                "serializer": "services.cache.MsgpackSerializer",
+            },
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": cache_config.FILE_LOCATION,
+            "KEY_PREFIX": cache_config.KEY_PREFIX,
+            "TIMEOUT": cache_config.DEFAULT_TIMEOUT,
+            "OPTIONS": {
+                "MAX_ENTRIES": cache_config.MAX_ENTRIES,
+            },
+        },
+    }
+
+# Sessions are read from the cache and written through to the database
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 
 
 #############################
@@ -367,7 +445,7 @@ LOGGING = {
 # https://github.com/adamchainz/django-cors-headers
 CORS_ALLOWED_ORIGINS = [django_config.FRONTEND_URL]
 CORS_ALLOW_CREDENTIALS = True
-CORS_EXPOSE_HEADERS = ["X-Session-Token"]
+CORS_EXPOSE_HEADERS = ["X-Session-Token", "X-Next-Cursor"]
 
 # Allow cookies to be sent cross-origin
 # For cross-origin requests (frontend and backend on different domains), we need:
@@ -424,6 +502,22 @@ SOCIALACCOUNT_EMAIL_AUTHENTICATION = True
 SOCIALACCOUNT_EMAIL_AUTHENTICATION_AUTO_CONNECT = True
 
 
+#############################
+# AUDIT LOG
+#############################
+# Entries are buffered per process and written in batches; see apps.auditlog.writer
+AUDITLOG_WRITER_BATCH_SIZE = auditlog_config.WRITER_BATCH_SIZE
+AUDITLOG_WRITER_FLUSH_INTERVAL = auditlog_config.WRITER_FLUSH_INTERVAL
+AUDITLOG_WRITER_QUEUE_SIZE = auditlog_config.WRITER_QUEUE_SIZE
+# Entries that cannot reach the database are appended here (empty to disable)
+AUDITLOG_WRITER_SPILL_PATH = auditlog_config.WRITER_SPILL_PATH
+# Postgres only: monthly LogEntry partitions, see maintain_log_partitions
+AUDITLOG_PARTITIONS_AHEAD = auditlog_config.PARTITIONS_AHEAD
+# Months kept besides the current one; older partitions are archived (0 keeps all)
+AUDITLOG_RETENTION_MONTHS = auditlog_config.RETENTION_MONTHS
+AUDITLOG_ARCHIVE_DIR = auditlog_config.ARCHIVE_DIR
+
+
 #############################
 # PROJECT SPECIFIC SETTINGS
 #############################
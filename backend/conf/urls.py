@@ -1,14 +1,21 @@
+import logging
+
 from apps.auditlog.api import router as auditlog_router
 from apps.conflict_detector.api import router as conflict_detector_router
 from apps.proyectos_ley.api import router as proyectos_ley_router
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import DatabaseError, connections
 from django.http import JsonResponse
 from django.urls import include, path
 from django.views import defaults as default_views
 from ninja import NinjaAPI
-from ninja.security import SessionAuth
+from services.auth import AsyncSessionAuth
+from services.pagination import InvalidCursorError
+from services.renderers import ORJSONParser, ORJSONRenderer
+
+logger = logging.getLogger(__name__)
 
 ########################
 # API Configuration
@@ -20,13 +27,45 @@ API_ROUTERS = [
 ]
 
 # Configuration process guards against multiple
-session_auth = sync_to_async(SessionAuth(csrf=False))
-api = NinjaAPI(title="gestion API", version="1.0.0", auth=session_auth)
+session_auth = AsyncSessionAuth(csrf=False)
+api = NinjaAPI(
+    title="gestion API",
+    version="1.0.0",
+    auth=session_auth,
+    renderer=ORJSONRenderer(),
+    parser=ORJSONParser(),
+)
 for route_path, router in API_ROUTERS:
     if not router.api:
         api.add_router(route_path, router)
 
 
+@api.exception_handler(InvalidCursorError)
+def invalid_cursor(request, exc):
+    return api.create_response(request, {"detail": str(exc)}, status=400)
+
+
+def database_health(request):
+    """Check the database connection; public, so errors are only logged."""
+    try:
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except DatabaseError:
+        logger.exception("Database health check failed")
+        return JsonResponse({"status": "error"}, status=503)
+    return JsonResponse({"status": "ok"})
+
+
+@staff_member_required
+def database_pool_stats(request):
+    """Report the connection pool statistics, if pooling is on (staff only)."""
+    connection = connections["default"]
+    pool = getattr(connection, "pool", None)
+    return JsonResponse(
+        {"vendor": connection.vendor, "pool": pool.get_stats() if pool else None}
+    )
+
+
 ########################
 # Django URL Configuration
 ########################
@@ -40,6 +79,8 @@ urlpatterns = [
     path(".auth/headless/", include("allauth.headless.urls")),
     path("api/", api.urls),
     path("_health/", lambda request: JsonResponse({"status": "ok"})),
+    path("_health/db/", database_health),
+    path("_health/db/pool/", database_pool_stats),
     ######################
     # Additional URLs
     ######################
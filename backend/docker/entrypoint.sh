@@ -1,5 +1,14 @@
 #!/bin/bash
 
 python manage.py migrate --noinput
+python manage.py maintain_log_partitions --skip-retention
 python manage.py collectstatic --noinput --clear
-exec gunicorn wsgi:application --bind 0.0.0.0:8000 --workers 3 --timeout 120
+
+# SERVER_MODE=asgi (default) serves asgi.py with uvicorn workers, so async
+# views share each worker's event loop; SERVER_MODE=wsgi keeps sync workers
+if [ "${SERVER_MODE:-asgi}" = "wsgi" ]; then
+    exec gunicorn wsgi:application --config gunicorn.conf.py --bind 0.0.0.0:8000 --workers "${WEB_CONCURRENCY:-3}" --timeout 120
+fi
+
+exec gunicorn asgi:application --config gunicorn.conf.py --bind 0.0.0.0:8000 --workers "${WEB_CONCURRENCY:-3}" --timeout 120 \
+    --worker-class uvicorn_worker.UvicornWorker
@@ -0,0 +1,9 @@
+"""Gunicorn settings shared by both SERVER_MODEs (see docker/entrypoint.sh)."""
+
+
+def worker_exit(server, worker):
+    """Write the audit log entries still queued before the worker exits."""
+    # Under SERVER_MODE=asgi the lifespan handler has already closed it
+    from apps.auditlog.writer import audit_log_writer
+
+    audit_log_writer.shutdown()
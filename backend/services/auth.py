@@ -0,0 +1,182 @@
+"""
+Async-native session authentication for the Ninja API.
+
+``AsyncSessionAuth`` authenticates with the Django session cookie like
+``ninja.security.SessionAuth``, but on async operations it loads the session
+and the user through ``request.auser()`` (async session and ORM calls)
+instead of hopping into the thread pool. Sync operations keep the regular
+``request.user`` path, so one instance serves both kinds of routes.
+
+``aget_session_user`` resolves a session key the same way for transports
+that have no HttpRequest, such as WebSocket connections.
+
+Resolved users are kept in a short-lived per-process cache keyed by session
+key, so most requests skip the session and user queries entirely. Entries
+are dropped on logout; other changes (deactivation, password change,
+logout handled by another worker) are picked up once the entry expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from importlib import import_module
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import aget_user
+from django.contrib.auth.signals import user_logged_out
+from django.dispatch import receiver
+from django.http import HttpRequest
+from ninja.security.apikey import APIKeyCookie
+
+# Seconds a resolved session -> user mapping is reused
+SESSION_USER_CACHE_TTL = 10
+# Maximum number of sessions kept in the cache of each process
+SESSION_USER_CACHE_MAX_ENTRIES = 10_000
+
+
+class SessionUserCache:
+    """Thread-safe TTL cache of session key -> authenticated user."""
+
+    def __init__(
+        self,
+        ttl: float = SESSION_USER_CACHE_TTL,
+        max_entries: int = SESSION_USER_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_key: str) -> Any | None:
+        entry = self._entries.get(session_key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at < time.monotonic():
+            self.discard(session_key)
+            return None
+        return user
+
+    def set(self, session_key: str, user: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries = {
+                    key: entry for key, entry in self._entries.items() if entry[1] >= now
+                }
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[session_key] = (user, now + self.ttl)
+
+    def discard(self, session_key: str) -> None:
+        with self._lock:
+            self._entries.pop(session_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+session_user_cache = SessionUserCache()
+
+
+@receiver(user_logged_out)
+def _forget_session_on_logout(sender, request=None, **kwargs):
+    session = getattr(request, "session", None)
+    if session is not None and session.session_key:
+        session_user_cache.discard(session.session_key)
+
+
+async def aget_session_user(
+    session_key: str | None, cache: SessionUserCache | None = None
+) -> Any | None:
+    """
+    Return the authenticated user of a session key, or None.
+
+    Args:
+        session_key: Value of the session cookie
+        cache: Cache of resolved users, session_user_cache by default
+
+    Returns:
+        The user, or None if the session is missing, expired or anonymous
+    """
+    if not session_key:
+        return None
+    cache = cache or session_user_cache
+    user = cache.get(session_key)
+    if user is not None:
+        return user
+
+    request = HttpRequest()
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+    user = await aget_user(request)
+    if not user.is_authenticated:
+        return None
+    cache.set(session_key, user)
+    return user
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class AsyncSessionAuth(APIKeyCookie):
+    """Django session authentication that is async-native on async routes."""
+
+    param_name: str = settings.SESSION_COOKIE_NAME
+
+    def __init__(self, csrf: bool = True, cache: SessionUserCache | None = None):
+        self.cache = cache or session_user_cache
+        super().__init__(csrf=csrf)
+        # Makes ninja await the result on async operations; sync operations
+        # get a plain value because __call__ only returns a coroutine in a loop
+        self.is_async = True
+
+    def __call__(self, request: HttpRequest) -> Any:
+        key = self._get_key(request)
+        if _in_event_loop():
+            return self.aauthenticate(request, key)
+        return self.authenticate(request, key)
+
+    def _from_cache(self, request: HttpRequest, key: str | None) -> Any | None:
+        if not key:
+            return None
+        user = self.cache.get(key)
+        if user is not None:
+            # Avoid loading the session again if the view reads request.user
+            request.user = user
+        return user
+
+    def authenticate(self, request: HttpRequest, key: str | None) -> Any | None:
+        if not key:
+            return None
+        user = self._from_cache(request, key)
+        if user is not None:
+            return user
+
+        user = request.user
+        if not user.is_authenticated:
+            return None
+        self.cache.set(key, user)
+        return user
+
+    async def aauthenticate(self, request: HttpRequest, key: str | None) -> Any | None:
+        if not key:
+            return None
+        user = self._from_cache(request, key)
+        if user is not None:
+            return user
+
+        user = await request.auser()
+        if not user.is_authenticated:
+            return None
+        request.user = user
+        self.cache.set(key, user)
+        return user
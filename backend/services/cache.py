@@ -0,0 +1,116 @@
+"""
+Cache helpers shared by the apps.
+
+- ``MsgpackSerializer``: compact serializer for Django's ``RedisCache``.
+  Values are packed with msgpack and zlib-compressed above a size threshold;
+  types msgpack cannot represent natively (tuples, datetimes, models, ...)
+  fall back to pickle inside a msgpack extension, so any picklable value can
+  still be cached.
+- Versioned namespaces: a namespace version stored in the cache is part of
+  every key of the namespace, so bumping it invalidates all of them at once.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+import zlib
+from typing import Any
+
+import msgpack
+from django.core.cache import cache
+
+# Values whose packed size exceeds this many bytes are compressed
+COMPRESS_MIN_BYTES = 1024
+
+_PICKLE_EXT_TYPE = 1
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+def _pack_default(obj: Any) -> msgpack.ExtType:
+    return msgpack.ExtType(_PICKLE_EXT_TYPE, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code == _PICKLE_EXT_TYPE:
+        return pickle.loads(data)
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackSerializer:
+    """
+    msgpack + zlib serializer for ``django.core.cache.backends.redis.RedisCache``.
+
+    Plain integers are stored unserialized, as Django's default serializer
+    does, so ``incr``/``decr`` keep working atomically in Redis.
+    """
+
+    def dumps(self, obj: Any) -> bytes | int:
+        if type(obj) is int:
+            return obj
+        # strict_types keeps tuples and subclasses (NamedTuple, OrderedDict)
+        # lossless by routing them through the pickle fallback
+        packed = msgpack.packb(
+            obj, default=_pack_default, strict_types=True, use_bin_type=True
+        )
+        if len(packed) >= COMPRESS_MIN_BYTES:
+            return _COMPRESSED + zlib.compress(packed)
+        return _RAW + packed
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return int(data)
+        except ValueError:
+            pass
+        marker, payload = data[:1], data[1:]
+        if marker == _COMPRESSED:
+            payload = zlib.decompress(payload)
+        return msgpack.unpackb(payload, ext_hook=_unpack_ext, raw=False)
+
+
+def _version_key(namespace: str) -> str:
+    return f"cache_version:{namespace}"
+
+
+def _initial_version() -> int:
+    # Time based, so a version lost on eviction never reuses an older number
+    return int(time.time() * 1000)
+
+
+def get_version(namespace: str) -> int:
+    """Return the current cache version of ``namespace``."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(namespace: str) -> int:
+    """Async version of get_version."""
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _initial_version(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(namespace: str) -> None:
+    """Invalidate every key of ``namespace``."""
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+
+
+async def abump_version(namespace: str) -> None:
+    """Async version of bump_version."""
+    key = _version_key(namespace)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, _initial_version(), timeout=None)
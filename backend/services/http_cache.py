@@ -0,0 +1,155 @@
+"""
+HTTP response caching for public, read-mostly endpoints.
+
+Serialized response bodies are stored in the Django cache under a key made of
+a namespace, the namespace's current version and the full request path
+(including the query string). Bumping the version, e.g. when new data is
+ingested, invalidates every cached response of the namespace at once without
+having to enumerate keys.
+
+Every cacheable response gets an ``ETag`` computed from its body and a
+``Cache-Control`` header; requests whose ``If-None-Match`` matches get an
+empty 304 response.
+
+Use it on django-ninja operations through ``decorate_view``::
+
+    @router.get("/")
+    @decorate_view(cache_response("proyectos_ley"))
+    async def list_things(request): ...
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+from typing import Any, Callable, NamedTuple
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+from services.cache import aget_version, get_version
+
+DEFAULT_MAX_AGE = 60
+DEFAULT_TIMEOUT = 60 * 60
+
+# Headers that must never be replayed from the cache
+_UNCACHED_HEADERS = {"set-cookie", "vary", "etag", "cache-control"}
+
+
+class CachedResponse(NamedTuple):
+    """Serialized response stored in the cache."""
+
+    content: bytes
+    etag: str
+    headers: dict[str, str]
+
+
+def _response_key(namespace: str, version: int, request: HttpRequest) -> str:
+    path_hash = hashlib.sha256(request.get_full_path().encode("utf-8")).hexdigest()
+    return f"http_cache:response:{namespace}:{version}:{path_hash}"
+
+
+def _serialize(response: HttpResponse) -> CachedResponse:
+    content = response.content
+    return CachedResponse(
+        content=content,
+        etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        headers={
+            name: value
+            for name, value in response.items()
+            if name.lower() not in _UNCACHED_HEADERS
+        },
+    )
+
+
+def _is_cacheable(request: HttpRequest, response: Any) -> bool:
+    return (
+        request.method in ("GET", "HEAD")
+        and isinstance(response, HttpResponse)
+        and response.status_code == 200
+        and not response.streaming
+    )
+
+
+def _build_response(
+    request: HttpRequest, cached: CachedResponse, max_age: int, hit: bool
+) -> HttpResponse:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (
+        cached.etag in parse_etags(if_none_match) or if_none_match.strip() == "*"
+    ):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(cached.content)
+        for name, value in cached.headers.items():
+            response[name] = value
+
+    response["ETag"] = cached.etag
+    response["X-Cache"] = "HIT" if hit else "MISS"
+    patch_cache_control(response, public=True, max_age=max_age)
+    return response
+
+
+def cache_response(
+    namespace: str,
+    *,
+    max_age: int = DEFAULT_MAX_AGE,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Callable:
+    """
+    Build a view decorator that caches successful GET responses.
+
+    Args:
+        namespace: Cache namespace, invalidated as a whole by bump_version
+        max_age: Seconds clients and proxies may reuse a response (Cache-Control)
+        timeout: Seconds a response is kept in the server-side cache
+
+    Returns:
+        Decorator for sync or async views receiving ``(request, ...)``
+    """
+
+    def decorator(view: Callable) -> Callable:
+        if inspect.iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def async_wrapper(request: HttpRequest, *args: Any, **kwargs: Any):
+                if request.method not in ("GET", "HEAD"):
+                    return await view(request, *args, **kwargs)
+
+                key = _response_key(namespace, await aget_version(namespace), request)
+                cached = await cache.aget(key)
+                if cached is not None:
+                    return _build_response(request, cached, max_age, hit=True)
+
+                response = await view(request, *args, **kwargs)
+                if not _is_cacheable(request, response):
+                    return response
+                cached = _serialize(response)
+                await cache.aset(key, cached, timeout)
+                return _build_response(request, cached, max_age, hit=False)
+
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+
+            key = _response_key(namespace, get_version(namespace), request)
+            cached = cache.get(key)
+            if cached is not None:
+                return _build_response(request, cached, max_age, hit=True)
+
+            response = view(request, *args, **kwargs)
+            if not _is_cacheable(request, response):
+                return response
+            cached = _serialize(response)
+            cache.set(key, cached, timeout)
+            return _build_response(request, cached, max_age, hit=False)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,151 @@
+"""
+Keyset (cursor) pagination shared by the API routers.
+
+A cursor is an opaque URL-safe string encoding the sort-key values of the last
+row of a page. The next page is selected with a WHERE clause on those values
+instead of an OFFSET, so every page costs the same as the first one as long
+as an index covers ``(filters..., *ordering)``.
+
+Orderings must be made of non-null fields and be unique as a whole (end them
+with ``"id"`` or ``"-id"``), otherwise rows could be skipped between pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, NamedTuple
+
+from django.db.models import Model, Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__("Invalid pagination cursor")
+
+
+class CursorPage(NamedTuple):
+    """A page of results and the cursor pointing to the next one."""
+
+    items: list[Any]
+    next_cursor: str | None
+
+
+def _json_default(value: Any) -> str:
+    # Full precision: DjangoJSONEncoder truncates microseconds
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    msg = f"Unsupported cursor value: {value!r}"
+    raise TypeError(msg)
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode sort-key values into an opaque cursor string."""
+    raw = json.dumps(values, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises InvalidCursorError if the cursor is malformed or does not hold
+    ``size`` values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as err:
+        raise InvalidCursorError(cursor) from err
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(cursor)
+    return values
+
+
+def _after(ordering: tuple[str, ...], values: list[Any]) -> Q:
+    """Build the filter selecting rows strictly after ``values`` in ``ordering``."""
+    condition = Q()
+    for idx, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        step = Q(**{f"{name}__{lookup}": values[idx]})
+        for prev_field, prev_value in zip(ordering[:idx], values[:idx]):
+            step &= Q(**{prev_field.lstrip("-"): prev_value})
+        condition |= step
+    return condition
+
+
+def _page_queryset(
+    queryset: QuerySet,
+    ordering: tuple[str, ...],
+    cursor: str | None,
+    limit: int,
+    offset: int,
+) -> tuple[QuerySet, int]:
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        values = decode_cursor(cursor, len(ordering))
+        queryset = queryset.filter(_after(ordering, values))
+    elif offset:
+        # Kept for clients that still page with offsets
+        queryset = queryset[offset:]
+    # One extra row tells whether there is a next page
+    return queryset[: limit + 1], limit
+
+
+def _build_page(rows: list[Model], ordering: tuple[str, ...], limit: int) -> CursorPage:
+    if len(rows) <= limit:
+        return CursorPage(items=rows, next_cursor=None)
+
+    rows = rows[:limit]
+    last = rows[-1]
+    values = [getattr(last, field.lstrip("-")) for field in ordering]
+    return CursorPage(items=rows, next_cursor=encode_cursor(values))
+
+
+def paginate_queryset(
+    queryset: QuerySet,
+    *,
+    ordering: tuple[str, ...],
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> CursorPage:
+    """
+    Return one page of ``queryset`` ordered by ``ordering``.
+
+    Args:
+        queryset: Filtered queryset to paginate
+        ordering: Unique ordering, e.g. ``("-created", "-id")``
+        cursor: Cursor returned by the previous page, if any
+        limit: Maximum number of rows in the page (capped at MAX_PAGE_SIZE)
+        offset: Legacy offset, only used when no cursor is given
+
+    Returns:
+        CursorPage with the rows and the cursor of the next page (or None)
+    """
+    page_qs, limit = _page_queryset(queryset, ordering, cursor, limit, offset)
+    return _build_page(list(page_qs), ordering, limit)
+
+
+async def apaginate_queryset(
+    queryset: QuerySet,
+    *,
+    ordering: tuple[str, ...],
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> CursorPage:
+    """Async version of paginate_queryset."""
+    page_qs, limit = _page_queryset(queryset, ordering, cursor, limit, offset)
+    return _build_page([obj async for obj in page_qs], ordering, limit)
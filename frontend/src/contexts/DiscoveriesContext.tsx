@@ -1,6 +1,6 @@
 import { createContext, useContext, useState, useEffect } from 'react';
 import type { ReactNode } from 'react';
-import { listDiscoveries } from '@/services/api/conflictDetector';
+import { getDiscoveryCounts } from '@/services/api/conflictDetector';
 
 interface DiscoveriesContextType {
   pendingCount: number;
@@ -15,8 +15,8 @@ export function DiscoveriesProvider({ children }: { children: ReactNode }) {
 
   const fetchPendingCount = async () => {
     try {
-      const discoveries = await listDiscoveries();
-      setPendingCount(discoveries.length);
+      const counts = await getDiscoveryCounts();
+      setPendingCount(counts.pendientes);
     } catch (error) {
       console.error('Error fetching pending discoveries:', error);
     }
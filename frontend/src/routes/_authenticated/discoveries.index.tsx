@@ -11,6 +11,8 @@ export const Route = createFileRoute("/_authenticated/discoveries/")({
 function Discoveries() {
   const [discoveries, setDiscoveries] = useState<DescubrimientoList[]>([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const { refreshPendingCount } = useDiscoveries();
 
   useEffect(() => {
@@ -20,8 +22,9 @@ function Discoveries() {
   const loadDiscoveries = async () => {
     try {
       setIsLoading(true);
-      const data = await listDiscoveries();
-      setDiscoveries(data);
+      const page = await listDiscoveries();
+      setDiscoveries(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Error al cargar descubrimientos:', error);
     } finally {
@@ -29,6 +32,20 @@ function Discoveries() {
     }
   };
 
+  const loadMoreDiscoveries = async () => {
+    if (!nextCursor) return;
+    try {
+      setIsLoadingMore(true);
+      const page = await listDiscoveries(nextCursor);
+      setDiscoveries((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error al cargar más descubrimientos:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const getImpactLevel = (maxRelevancia: number): string => {
     if (maxRelevancia >= 50) return "Alto";
     if (maxRelevancia >= 30) return "Medio";
@@ -60,8 +77,10 @@ function Discoveries() {
   const handleDiscard = async (discoveryId: number) => {
     try {
       await discardDiscovery(discoveryId);
-      // Recargar la lista de descubrimientos y actualizar el contador
-      await Promise.all([loadDiscoveries(), refreshPendingCount()]);
+      // Quitarlo de la lista sin recargar, así se conservan las páginas ya
+      // cargadas y el cursor sigue siendo válido; luego actualizar el contador
+      setDiscoveries((current) => current.filter((d) => d.id !== discoveryId));
+      await refreshPendingCount();
     } catch (error) {
       console.error('Error al descartar descubrimiento:', error);
       alert('Error al descartar el descubrimiento. Por favor, intenta nuevamente.');
@@ -71,8 +90,10 @@ function Discoveries() {
   const handleTrack = async (discoveryId: number) => {
     try {
       await trackDiscovery(discoveryId);
-      // Recargar la lista de descubrimientos y actualizar el contador
-      await Promise.all([loadDiscoveries(), refreshPendingCount()]);
+      // Quitarlo de la lista sin recargar, así se conservan las páginas ya
+      // cargadas y el cursor sigue siendo válido; luego actualizar el contador
+      setDiscoveries((current) => current.filter((d) => d.id !== discoveryId));
+      await refreshPendingCount();
     } catch (error) {
       console.error('Error al dar seguimiento:', error);
       alert('Error al dar seguimiento al descubrimiento. Por favor, intenta nuevamente.');
@@ -165,6 +186,25 @@ function Discoveries() {
           })}
         </div>
       )}
+
+      {!isLoading && nextCursor && (
+        <div className="flex justify-center">
+          <button
+            onClick={loadMoreDiscoveries}
+            disabled={isLoadingMore}
+            className="px-4 py-2 text-sm border border-[hsl(var(--border))] rounded-md hover:bg-[hsl(var(--accent))] flex items-center gap-2 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {isLoadingMore ? (
+              <>
+                <Loader2 className="h-4 w-4 animate-spin" />
+                Cargando...
+              </>
+            ) : (
+              "Cargar más"
+            )}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -22,6 +22,8 @@ function Documents() {
   const [uploadError, setUploadError] = useState<string | null>(null);
   const [detectionResult, setDetectionResult] = useState<DetectConflictsResponse | null>(null);
   const [documents, setDocuments] = useState<DocumentoList[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [showUploadMenu, setShowUploadMenu] = useState(false);
   const [showDeleteDialog, setShowDeleteDialog] = useState(false);
   const [documentToDelete, setDocumentToDelete] = useState<{ id: number; nombre: string } | null>(null);
@@ -47,8 +49,9 @@ function Documents() {
   const loadDocuments = async () => {
     try {
       setIsLoading(true);
-      const docs = await listDocuments();
-      setDocuments(docs);
+      const page = await listDocuments();
+      setDocuments(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Error al cargar documentos:', error);
     } finally {
@@ -56,6 +59,20 @@ function Documents() {
     }
   };
 
+  const loadMoreDocuments = async () => {
+    if (!nextCursor) return;
+    try {
+      setIsLoadingMore(true);
+      const page = await listDocuments(nextCursor);
+      setDocuments((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error al cargar más documentos:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleFileUpload = async (event: React.ChangeEvent<HTMLInputElement>) => {
     const file = event.target.files?.[0];
     if (!file) return;
@@ -99,8 +116,8 @@ function Documents() {
 
     try {
       await deleteDocument(documentToDelete.id);
-      // Recargar la lista de documentos
-      await loadDocuments();
+      // Quitarlo de la lista sin recargar, así se conservan las páginas ya cargadas
+      setDocuments((current) => current.filter((doc) => doc.id !== documentToDelete.id));
     } catch (error) {
       console.error('Error al eliminar documento:', error);
       setUploadError(error instanceof Error ? error.message : 'Error al eliminar el documento');
@@ -284,6 +301,25 @@ function Documents() {
         </div>
       )}
 
+      {!isLoading && nextCursor && (
+        <div className="flex justify-center">
+          <button
+            onClick={loadMoreDocuments}
+            disabled={isLoadingMore}
+            className="px-4 py-2 text-sm border border-[hsl(var(--border))] rounded-md hover:bg-[hsl(var(--accent))] flex items-center gap-2 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {isLoadingMore ? (
+              <>
+                <Loader2 className="h-4 w-4 animate-spin" />
+                Cargando...
+              </>
+            ) : (
+              "Cargar más"
+            )}
+          </button>
+        </div>
+      )}
+
       <ConfirmDialog
         isOpen={showDeleteDialog}
         onClose={() => setShowDeleteDialog(false)}
@@ -5,6 +5,8 @@ import {
   listDocuments, 
   listDiscoveries, 
   listTrackingDiscoveries,
+  getDiscoveryCounts,
+  type ContadorDescubrimientos,
   type DescubrimientoList 
 } from "../../services/api/conflictDetector";
 import { 
@@ -19,6 +21,13 @@ export const Route = createFileRoute("/_authenticated/")({
 function Dashboard() {
   const [isLoading, setIsLoading] = useState(true);
   const [documentsCount, setDocumentsCount] = useState(0);
+  const [hasMoreDocuments, setHasMoreDocuments] = useState(false);
+  const [counts, setCounts] = useState<ContadorDescubrimientos>({
+    pendientes: 0,
+    en_seguimiento: 0,
+    descartados: 0,
+  });
+  const [hasMoreDiscoveries, setHasMoreDiscoveries] = useState(false);
   const [activeDiscoveries, setActiveDiscoveries] = useState<DescubrimientoList[]>([]);
   const [trackingDiscoveries, setTrackingDiscoveries] = useState<DescubrimientoList[]>([]);
   const [recentlyViewed, setRecentlyViewed] = useState<RecentlyViewedDiscovery[]>([]);
@@ -114,15 +123,22 @@ function Dashboard() {
   const loadDashboardData = async () => {
     try {
       setIsLoading(true);
-      const [documents, discoveries, tracking] = await Promise.all([
+      // Solo la primera página de cada lista; los totales vienen del contador
+      const [documents, discoveries, tracking, discoveryCounts] = await Promise.all([
         listDocuments(),
         listDiscoveries(),
         listTrackingDiscoveries(),
+        getDiscoveryCounts(),
       ]);
 
-      setDocumentsCount(documents.length);
-      setActiveDiscoveries(discoveries);
-      setTrackingDiscoveries(tracking);
+      setDocumentsCount(documents.items.length);
+      setHasMoreDocuments(documents.nextCursor !== null);
+      setActiveDiscoveries(discoveries.items);
+      setTrackingDiscoveries(tracking.items);
+      setHasMoreDiscoveries(
+        discoveries.nextCursor !== null || tracking.nextCursor !== null
+      );
+      setCounts(discoveryCounts);
 
       // Los proyectos vistos recientemente se actualizarán automáticamente
       // cuando se actualicen activeDiscoveries y trackingDiscoveries
@@ -161,7 +177,8 @@ function Dashboard() {
   };
 
   // Calcular estadísticas
-  // Alto impacto: descubrimientos con max_nivel_relevancia >= 50 tanto en activos como en seguimiento
+  // Alto impacto: descubrimientos con max_nivel_relevancia >= 50 tanto en activos como en seguimiento,
+  // contados sobre las páginas cargadas ("+" si quedan más por cargar)
   const highImpactCount = [
     ...activeDiscoveries,
     ...trackingDiscoveries
@@ -170,28 +187,28 @@ function Dashboard() {
   const stats = [
     {
       title: "Documentos Subidos",
-      value: documentsCount.toString(),
+      value: `${documentsCount}${hasMoreDocuments ? "+" : ""}`,
       description: "En tu perfil corporativo",
       icon: FileText,
       color: "text-primary",
     },
     {
       title: "Descubrimientos Activos",
-      value: activeDiscoveries.length.toString(),
+      value: counts.pendientes.toString(),
       description: "Proyectos de ley detectados",
       icon: AlertTriangle,
       color: "text-[hsl(var(--alert-medium))]",
     },
     {
       title: "En Seguimiento",
-      value: trackingDiscoveries.length.toString(),
+      value: counts.en_seguimiento.toString(),
       description: "Proyectos monitoreados",
       icon: Eye,
       color: "text-[hsl(var(--status-active))]",
     },
     {
       title: "Alto Impacto",
-      value: highImpactCount.toString(),
+      value: `${highImpactCount}${hasMoreDiscoveries ? "+" : ""}`,
       description: "Requieren atención urgente",
       icon: TrendingUp,
       color: "text-[hsl(var(--alert-high))]",
@@ -11,6 +11,8 @@ function Tracking() {
   const [discoveries, setDiscoveries] = useState<DescubrimientoList[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [isAdvancing, setIsAdvancing] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     loadTrackingDiscoveries();
@@ -19,8 +21,9 @@ function Tracking() {
   const loadTrackingDiscoveries = async () => {
     try {
       setIsLoading(true);
-      const data = await listTrackingDiscoveries();
-      setDiscoveries(data);
+      const page = await listTrackingDiscoveries();
+      setDiscoveries(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Error al cargar descubrimientos en seguimiento:', error);
     } finally {
@@ -28,6 +31,20 @@ function Tracking() {
     }
   };
 
+  const loadMoreTrackingDiscoveries = async () => {
+    if (!nextCursor) return;
+    try {
+      setIsLoadingMore(true);
+      const page = await listTrackingDiscoveries(nextCursor);
+      setDiscoveries((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error al cargar más descubrimientos en seguimiento:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleAdvanceTime = async () => {
     try {
       setIsAdvancing(true);
@@ -238,6 +255,25 @@ function Tracking() {
           })}
         </div>
       )}
+
+      {!isLoading && nextCursor && (
+        <div className="flex justify-center">
+          <button
+            onClick={loadMoreTrackingDiscoveries}
+            disabled={isLoadingMore}
+            className="px-4 py-2 text-sm border border-[hsl(var(--border))] rounded-md hover:bg-[hsl(var(--accent))] flex items-center gap-2 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {isLoadingMore ? (
+              <>
+                <Loader2 className="h-4 w-4 animate-spin" />
+                Cargando...
+              </>
+            ) : (
+              "Cargar más"
+            )}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -5,6 +5,38 @@ const getApiUrl = (path: string): string => {
     : path;
 };
 
+// Una página de un endpoint paginado por cursor
+export interface Page<T> {
+  items: T[];
+  // Cursor de la página siguiente (header X-Next-Cursor), null en la última
+  nextCursor: string | null;
+}
+
+// Pide una sola página; el llamador guarda nextCursor para pedir la siguiente
+const fetchPage = async <T>(
+  path: string,
+  cursor: string | null | undefined,
+  errorMessage: string
+): Promise<Page<T>> => {
+  const url = cursor
+    ? `${path}?cursor=${encodeURIComponent(cursor)}`
+    : path;
+  const response = await fetch(getApiUrl(url), {
+    method: 'GET',
+    credentials: 'include',
+  });
+
+  if (!response.ok) {
+    const error = await response.text();
+    throw new Error(`${errorMessage}: ${error}`);
+  }
+
+  return {
+    items: (await response.json()) as T[],
+    nextCursor: response.headers.get('X-Next-Cursor'),
+  };
+};
+
 // ============================================
 // INTERFACES
 // ============================================
@@ -72,6 +104,12 @@ export interface DescubrimientoList {
   proyecto_camara_origen?: string | null;
 }
 
+export interface ContadorDescubrimientos {
+  pendientes: number;
+  en_seguimiento: number;
+  descartados: number;
+}
+
 export interface DescubrimientoDetail {
   id: number;
   proyecto_id: string;
@@ -108,18 +146,14 @@ export async function detectConflicts(
   return response.json();
 }
 
-export async function listDocuments(): Promise<DocumentoList[]> {
-  const response = await fetch(getApiUrl('/api/conflict-detector/documents'), {
-    method: 'GET',
-    credentials: 'include',
-  });
-
-  if (!response.ok) {
-    const error = await response.text();
-    throw new Error(`Error al listar documentos: ${error}`);
-  }
-
-  return response.json();
+export async function listDocuments(
+  cursor?: string | null
+): Promise<Page<DocumentoList>> {
+  return fetchPage<DocumentoList>(
+    '/api/conflict-detector/documents',
+    cursor,
+    'Error al listar documentos'
+  );
 }
 
 export async function getDocumentDetail(
@@ -160,9 +194,19 @@ export async function deleteDocument(
   return response.json();
 }
 
-export async function listDiscoveries(): Promise<DescubrimientoList[]> {
+export async function listDiscoveries(
+  cursor?: string | null
+): Promise<Page<DescubrimientoList>> {
+  return fetchPage<DescubrimientoList>(
+    '/api/conflict-detector/discoveries',
+    cursor,
+    'Error al listar descubrimientos'
+  );
+}
+
+export async function getDiscoveryCounts(): Promise<ContadorDescubrimientos> {
   const response = await fetch(
-    getApiUrl('/api/conflict-detector/discoveries'),
+    getApiUrl('/api/conflict-detector/discoveries/counts'),
     {
       method: 'GET',
       credentials: 'include',
@@ -171,7 +215,7 @@ export async function listDiscoveries(): Promise<DescubrimientoList[]> {
 
   if (!response.ok) {
     const error = await response.text();
-    throw new Error(`Error al listar descubrimientos: ${error}`);
+    throw new Error(`Error al obtener contador de descubrimientos: ${error}`);
   }
 
   return response.json();
@@ -234,21 +278,62 @@ export async function discardDiscovery(
   return response.json();
 }
 
-export async function listTrackingDiscoveries(): Promise<DescubrimientoList[]> {
+export interface TriageMasivoCriterio {
+  ids?: number[];
+  documento_id?: number;
+  relevancia_menor_a?: number;
+}
+
+export interface TriageMasivoResultado {
+  success: boolean;
+  estado: string;
+  actualizados: number;
+  pendientes: number;
+}
+
+const bulkTriage = async (
+  action: 'track' | 'discard',
+  criterio: TriageMasivoCriterio,
+  errorMessage: string
+): Promise<TriageMasivoResultado> => {
   const response = await fetch(
-    getApiUrl('/api/conflict-detector/discoveries/tracking'),
+    getApiUrl(`/api/conflict-detector/discoveries/bulk/${action}`),
     {
-      method: 'GET',
+      method: 'POST',
       credentials: 'include',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(criterio),
     }
   );
 
   if (!response.ok) {
     const error = await response.text();
-    throw new Error(`Error al listar descubrimientos en seguimiento: ${error}`);
+    throw new Error(`${errorMessage}: ${error}`);
   }
 
   return response.json();
+};
+
+export async function bulkTrackDiscoveries(
+  criterio: TriageMasivoCriterio
+): Promise<TriageMasivoResultado> {
+  return bulkTriage('track', criterio, 'Error al dar seguimiento a los descubrimientos');
+}
+
+export async function bulkDiscardDiscoveries(
+  criterio: TriageMasivoCriterio
+): Promise<TriageMasivoResultado> {
+  return bulkTriage('discard', criterio, 'Error al descartar los descubrimientos');
+}
+
+export async function listTrackingDiscoveries(
+  cursor?: string | null
+): Promise<Page<DescubrimientoList>> {
+  return fetchPage<DescubrimientoList>(
+    '/api/conflict-detector/discoveries/tracking',
+    cursor,
+    'Error al listar descubrimientos en seguimiento'
+  );
 }
 
 export async function advanceTime(): Promise<{ success: boolean; message: string; proyectos_actualizados: number }> {